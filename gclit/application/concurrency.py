@@ -0,0 +1,56 @@
+# gclit/application/concurrency.py
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+from gclit.domain import deadline
+
+
+def run_in_background(func: Callable, *args, **kwargs) -> Future:
+    """
+    Ejecuta `func` en un hilo daemon y devuelve su Future.
+
+    A diferencia de ThreadPoolExecutor, el hilo no retiene la salida del
+    proceso, así que abandonar una llamada lenta (p. ej. al LLM) no bloquea
+    el fin de la CLI. El hilo hereda el plazo de --timeout.
+    """
+    future = Future()
+    func = deadline.bind_context(func)
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+class PhaseTimer:
+    """Acumula la duración en segundos de cada fase de un caso de uso"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        # Un plazo agotado antes de empezar se atribuye a la fase anterior, no a esta
+        deadline.check()
+        start = time.perf_counter()
+        try:
+            with deadline.phase(name):
+                yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        """Envuelve `func` para registrar su duración bajo `name`"""
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
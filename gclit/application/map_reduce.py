@@ -0,0 +1,100 @@
+# gclit/application/map_reduce.py
+"""
+Resumen jerárquico de PRs que no caben en la ventana del modelo: el diff se
+trocea por rutas, cada bloque se resume en paralelo y los resúmenes se
+vuelven a agrupar hasta que caben en el presupuesto de la llamada final.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from gclit.application.token_budget import CHARS_PER_TOKEN, estimate_tokens
+from gclit.domain.deadline import bind_context
+from gclit.domain.models.diff import NOTE_PREFIX, FileDiff, ParsedDiff
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.domain.ports.llm import LLMProvider
+
+
+class DiffSummarizer:
+    def __init__(self, llm_provider: LLMProvider, concurrency: int = 4, chunk_tokens: int = 12_000):
+        self.llm_provider = llm_provider
+        self.concurrency = max(1, concurrency)
+        self.chunk_tokens = chunk_tokens
+        self.chunk_count = 0
+
+    def condense(self, context: PullRequestContext, source_diff: ParsedDiff, budget: int) -> PullRequestContext:
+        """Devuelve `context` con el diff completo sustituido por resúmenes que caben en `budget`"""
+        limit = min(self.chunk_tokens, budget) if self.chunk_tokens else budget
+        chunks = self._chunk_files(source_diff, limit)
+        self.chunk_count = len(chunks)
+
+        chunk_contexts = [
+            self._chunk_context(context, source_diff, files, index, len(chunks), limit)
+            for index, files in enumerate(chunks, start=1)
+        ]
+        # Cada resumen conserva la cabecera con las rutas de su bloque
+        summaries = [
+            f"{chunk.change_summaries[0]}\n{summary}"
+            for chunk, summary in zip(chunk_contexts, self._summarize(chunk_contexts))
+        ]
+
+        # Si los resúmenes siguen sin caber, se resumen de nuevo por grupos
+        while len(summaries) > 1 and sum(estimate_tokens(s) for s in summaries) > budget:
+            groups = self._group_summaries(summaries, limit)
+            if len(groups) == len(summaries):
+                break
+            summaries = self._summarize([
+                context.model_copy(update={"change_summaries": group}) for group in groups
+            ])
+
+        return context.model_copy(update={"change_summaries": summaries + source_diff.notes})
+
+    def _summarize(self, contexts: List[PullRequestContext]) -> List[str]:
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return list(pool.map(bind_context(self.llm_provider.summarize_changes), contexts))
+
+    @staticmethod
+    def _chunk_files(parsed_diff: ParsedDiff, limit: int) -> List[List[FileDiff]]:
+        # Ordenar por ruta mantiene juntos los ficheros del mismo directorio
+        chunks, current, size = [], [], 0
+        for file in sorted(parsed_diff.files, key=lambda f: f.path):
+            tokens = file.size // CHARS_PER_TOKEN + 1
+            if current and size + tokens > limit:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(file)
+            size += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _chunk_context(
+        context: PullRequestContext,
+        source_diff: ParsedDiff,
+        files: List[FileDiff],
+        index: int,
+        total: int,
+        limit: int
+    ) -> PullRequestContext:
+        header = f"#### Part {index}/{total}: {files[0].path}" + (f" … {files[-1].path}" if len(files) > 1 else "")
+        text = ParsedDiff(source_diff.text, files).render()
+
+        # Un único fichero mayor que el bloque se recorta para no desbordar la ventana
+        max_chars = limit * CHARS_PER_TOKEN
+        if len(text) > max_chars:
+            text = text[:max_chars] + f"\n{NOTE_PREFIX}part truncated at {max_chars} characters\n"
+        return context.model_copy(update={"change_summaries": [header, text]})
+
+    @staticmethod
+    def _group_summaries(summaries: List[str], limit: int) -> List[List[str]]:
+        groups, current, size = [], [], 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if current and size + tokens > limit:
+                groups.append(current)
+                current, size = [], 0
+            current.append(summary)
+            size += tokens
+        if current:
+            groups.append(current)
+        return groups
@@ -0,0 +1,167 @@
+# gclit/application/token_budget.py
+"""
+Presupuesto de tokens para el diff del prompt.
+
+Estima tokens sin red (≈4 caracteres por token), conoce la ventana de
+contexto de cada modelo y rellena el presupuesto con los ficheros más
+relevantes. Los que no caben se listan en una nota de ficheros omitidos.
+"""
+import math
+from typing import Dict, List, Optional
+
+from gclit.domain.models.diff import NOTE_PREFIX, FileDiff, ParsedDiff
+
+CHARS_PER_TOKEN = 4
+
+# Por prefijo de nombre; gana el prefijo más largo
+MODEL_CONTEXT_WINDOWS: Dict[str, int] = {
+    "gpt-3.5-turbo": 16_385,
+    "gpt-4": 8_192,
+    "gpt-4-32k": 32_768,
+    "gpt-4-turbo": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4.1": 1_047_576,
+    "gpt-5": 400_000,
+    "o1": 200_000,
+    "o3": 200_000,
+    "o4": 200_000,
+}
+DEFAULT_CONTEXT_WINDOW = 8_192
+
+# Instrucciones, pautas y formato de respuesta del prompt
+PROMPT_OVERHEAD_TOKENS = 1_000
+# Máximo de ficheros omitidos detallados en la nota
+MAX_OMITTED_LISTED = 50
+
+CATEGORY_RANK = {"source": 0, "test": 1, "config": 2, "docs": 3}
+
+_CONFIG_EXTENSIONS = (
+    ".json", ".yaml", ".yml", ".toml", ".ini", ".cfg", ".conf", ".xml",
+    ".properties", ".env", ".lock", ".csproj", ".gradle",
+)
+_CONFIG_NAMES = ("dockerfile", "makefile", "jenkinsfile", ".gitignore", ".gitattributes", ".editorconfig")
+_DOCS_EXTENSIONS = (".md", ".rst", ".txt", ".adoc")
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def context_window(model: str) -> int:
+    matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_WINDOW
+    return MODEL_CONTEXT_WINDOWS[max(matches, key=len)]
+
+
+def categorize(path: str) -> str:
+    lower = path.lower()
+    parts = lower.split("/")
+    name = parts[-1]
+
+    if (
+        any(part in ("test", "tests", "__tests__", "spec", "specs") for part in parts[:-1])
+        or name.startswith("test_")
+        or any(marker in name for marker in ("_test.", ".test.", ".spec.", "_spec."))
+    ):
+        return "test"
+    if name.endswith(_CONFIG_EXTENSIONS) or name in _CONFIG_NAMES or ".github" in parts:
+        return "config"
+    if name.endswith(_DOCS_EXTENSIONS) or "docs" in parts[:-1]:
+        return "docs"
+    return "source"
+
+
+class BudgetEntry:
+    __slots__ = ("file", "category", "tokens", "included")
+
+    def __init__(self, file: FileDiff, category: str, tokens: int):
+        self.file = file
+        self.category = category
+        self.tokens = tokens
+        self.included = False
+
+    def as_dict(self) -> dict:
+        return {
+            "path": self.file.path,
+            "category": self.category,
+            "tokens": self.tokens,
+            "included": self.included,
+        }
+
+
+class BudgetPlan:
+    def __init__(self, parsed_diff: ParsedDiff, entries: List[BudgetEntry], budget: int, window: int, source_diff: Optional[ParsedDiff] = None):
+        # Diff ajustado al presupuesto y diff completo del que procede
+        self.parsed_diff = parsed_diff
+        self.source_diff = source_diff or parsed_diff
+        self.entries = entries
+        self.budget = budget
+        self.window = window
+
+    @property
+    def used(self) -> int:
+        return sum(entry.tokens for entry in self.entries if entry.included)
+
+    @property
+    def omitted(self) -> List[BudgetEntry]:
+        return [entry for entry in self.entries if not entry.included]
+
+    def as_dict(self) -> dict:
+        return {
+            "window": self.window,
+            "budget": self.budget,
+            "used": self.used,
+            "files": [entry.as_dict() for entry in self.entries],
+        }
+
+
+class TokenBudget:
+    def __init__(self, model: str, max_prompt_tokens: int = 0, reserve_output_tokens: int = 4_096):
+        self.model = model
+        self.window = context_window(model)
+        self.max_prompt_tokens = max_prompt_tokens
+        self.reserve_output_tokens = reserve_output_tokens
+
+    def available(self, extra_text: str = "") -> int:
+        """Tokens disponibles para el diff tras instrucciones, contexto y respuesta"""
+        limit = self.window - self.reserve_output_tokens
+        if self.max_prompt_tokens:
+            limit = min(limit, self.max_prompt_tokens)
+        return max(0, limit - PROMPT_OVERHEAD_TOKENS - estimate_tokens(extra_text))
+
+    def fit(self, parsed_diff: ParsedDiff, extra_text: str = "") -> BudgetPlan:
+        """
+        Rellena el presupuesto de forma voraz: primero código fuente, luego
+        tests, configuración y documentación; dentro de cada categoría, los
+        ficheros con más líneas cambiadas por token. Los que no caben se
+        saltan y se resumen en una nota final.
+        """
+        budget = self.available(extra_text)
+        entries = [
+            BudgetEntry(file, categorize(file.path), math.ceil(file.size / CHARS_PER_TOKEN))
+            for file in parsed_diff.files
+        ]
+
+        remaining = budget - sum(estimate_tokens(note) + 1 for note in parsed_diff.notes)
+        for entry in sorted(entries, key=self._priority):
+            if entry.tokens <= remaining:
+                entry.included = True
+                remaining -= entry.tokens
+
+        omitted = [entry for entry in entries if not entry.included]
+        if not omitted:
+            return BudgetPlan(parsed_diff, entries, budget, self.window)
+
+        notes = [f"{NOTE_PREFIX}{len(omitted)} files omitted to fit the {budget}-token budget:"]
+        notes.extend(f"{NOTE_PREFIX}  {entry.file.stat_line()}" for entry in omitted[:MAX_OMITTED_LISTED])
+        if len(omitted) > MAX_OMITTED_LISTED:
+            notes.append(f"{NOTE_PREFIX}  ... and {len(omitted) - MAX_OMITTED_LISTED} more")
+
+        selected = parsed_diff.select((entry.file for entry in entries if entry.included), notes)
+        return BudgetPlan(selected, entries, budget, self.window, source_diff=parsed_diff)
+
+    @staticmethod
+    def _priority(entry: BudgetEntry):
+        churn = entry.file.additions + entry.file.deletions
+        return CATEGORY_RANK[entry.category], -churn / max(entry.tokens, 1)
@@ -1,38 +1,114 @@
 # gclit/application/use_cases/generate_commit.py
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+from gclit.application.concurrency import PhaseTimer, run_in_background
+from gclit.application.token_budget import BudgetPlan, TokenBudget
 from gclit.domain.exceptions.exception import GitProviderException
 from gclit.domain.models.commit_message import CommitContext
 from gclit.domain.models.common import Lang
+from gclit.domain.models.diff import ParsedDiff, diff_mode
 from gclit.domain.ports.git import GitProvider
-from gclit.domain.ports.llm import LLMProvider
+from gclit.domain.ports.llm import LLMProvider, TokenCallback, served_by, usage_of
 
 
 class GenerateCommitMessage:
-    def __init__(self, llm_provider: LLMProvider, git_provider: GitProvider):
+    def __init__(self, llm_provider: LLMProvider, git_provider: GitProvider, token_budget: Optional[TokenBudget] = None):
         self.llm_provider = llm_provider
         self.git_provider = git_provider
+        # La respuesta es un mensaje corto: basta una reserva pequeña
+        self.token_budget = token_budget or TokenBudget(llm_provider.model, reserve_output_tokens=256)
+        self.budget_plan: Optional[BudgetPlan] = None
+        # Último contexto construido: "regenerar" lo reutiliza sin volver a consultar git
+        self._context: Optional[CommitContext] = None
+        self.timings: Dict[str, float] = {}
+        self.diagnostics: Dict[str, Any] = {}
 
-    def execute(self, lang: Lang = "en") -> str:
+    def execute(self, lang: Lang = "en", on_token: Optional[TokenCallback] = None) -> str:
         """
-        Genera un mensaje de commit y opcionalmente lo aplica
+        Genera un mensaje de commit y opcionalmente lo aplica. Con `on_token`
+        el mensaje se notifica según lo genera el LLM.
         """
-        diff = self.git_provider.get_stash_diff()
-        if not diff:
-            raise GitProviderException("No staged changes to generate commit message.")
+        timer = self._start()
+        context = self._context = self._build_context(timer, lang)
 
-        commit_history = self.git_provider.get_recent_commits(limit=5)
+        with timer.phase("llm"):
+            if on_token is not None:
+                commit_message = self.llm_provider.stream_commit_message(context, on_token)
+            else:
+                commit_message = self.llm_provider.generate_commit_message(context)
+        self._record_response(commit_message)
+        return commit_message
+
+    def generate_candidates(self, lang: Lang = "en", candidates: int = 3) -> List[str]:
+        """Varias propuestas de mensaje en una sola petición al LLM"""
+        timer = self._start()
+        self._context = self._build_context(timer, lang)
+        return self._candidates(timer, candidates)
+
+    def regenerate(self, lang: Lang = "en", candidates: int = 1) -> List[str]:
+        """Propuestas nuevas para el contexto ya construido (sin git ni caché de respuestas)"""
+        timer = self._start()
+        if self._context is None or self._context.lang != lang:
+            self._context = self._build_context(timer, lang)
+        return self._candidates(timer, candidates)
+
+    def _candidates(self, timer: PhaseTimer, candidates: int) -> List[str]:
+        with timer.phase("llm"):
+            messages = self.llm_provider.generate_commit_messages(self._context, candidates)
+        self._record_response(messages)
+        return messages
+
+    def _record_response(self, result):
+        provider = served_by(result)
+        if provider:
+            self.diagnostics["llm_provider"] = provider
+        # Como en los PRs: tokens del prompt servidos desde la caché de prefijos incluidos
+        usage = usage_of(result)
+        if usage:
+            self.diagnostics["usage"] = usage
+
+    def explain_budget(self, lang: Lang = "en") -> dict:
+        """Calcula el coste en tokens de cada fichero sin llamar al LLM"""
+        self._build_context(self._start(), lang)
+        return self.budget_plan.as_dict()
 
-        context = CommitContext(
+    def _start(self) -> PhaseTimer:
+        timer = PhaseTimer()
+        self.timings = timer.timings
+        self.diagnostics = {}
+        return timer
+
+    def _build_context(self, timer: PhaseTimer, lang: Lang) -> CommitContext:
+        # Los tres comandos git son independientes: se lanzan a la vez
+        with timer.phase("git"):
+            diff_future = run_in_background(timer.timed("git_diff", self.git_provider.get_stash_diff))
+            history_future = run_in_background(timer.timed("git_log", self.git_provider.get_recent_commits), limit=5)
+            branch_future = run_in_background(timer.timed("git_branch", self.git_provider.get_branch_name))
+
+            diff = diff_future.result()
+            if not diff:
+                raise GitProviderException("No staged changes to generate commit message.")
+            commit_history = history_future.result()
+            branch_name = branch_future.result()
+            self.diagnostics["diff_mode"] = diff_mode(diff)
+
+        with timer.phase("budget"):
+            self.budget_plan = self.token_budget.fit(
+                ParsedDiff.parse(diff).without_noise(),
+                extra_text=commit_history or ""
+            )
+            self.diagnostics["tokens"] = f"{self.budget_plan.used}/{self.budget_plan.budget} (window {self.budget_plan.window})"
+            if self.budget_plan.omitted:
+                self.diagnostics["omitted_files"] = len(self.budget_plan.omitted)
+
+        return CommitContext(
             diff=diff,
-            branch_name=self.git_provider.get_branch_name(),
+            parsed_diff=self.budget_plan.parsed_diff,
+            branch_name=branch_name,
             commit_history=commit_history,
             lang=lang,
         )
 
-        commit_message = self.llm_provider.generate_commit_message(context)
-        return commit_message
-
     def apply_commit(self, message: str) -> str:
         """Aplica un commit con el mensaje dado"""
         return self.git_provider.create_commit(message)
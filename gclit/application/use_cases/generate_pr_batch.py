@@ -0,0 +1,143 @@
+# gclit/application/use_cases/generate_pr_batch.py
+import fnmatch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from gclit.application.concurrency import PhaseTimer
+from gclit.application.use_cases.generate_pr_docs import GeneratePullRequestDocs
+from gclit.domain.deadline import bind_context
+from gclit.domain.models.common import Lang
+from gclit.domain.models.pull_request import mark_generated
+from gclit.domain.ports.git import GitProvider
+
+
+class GeneratePullRequestDocsBatch:
+    """
+    Documenta varios PRs en paralelo. Cada PR usa su propia instancia de
+    GeneratePullRequestDocs y un fallo en uno no afecta al resto.
+    """
+
+    def __init__(
+        self,
+        git_provider: GitProvider,
+        use_case_factory: Callable[[], GeneratePullRequestDocs],
+        concurrency: int = 4
+    ):
+        self.git_provider = git_provider
+        self.use_case_factory = use_case_factory
+        self.concurrency = concurrency
+        self.timings: Dict[str, float] = {}
+        self.diagnostics: Dict[str, Any] = {}
+
+    def execute(
+        self,
+        pr_numbers: Optional[List[int]] = None,
+        to_pattern: Optional[str] = None,
+        lang: Lang = "en",
+        auto_confirm: bool = False,
+        dry_run: bool = False,
+        concurrency: Optional[int] = None,
+        skip_generated: bool = False
+    ) -> dict:
+        """
+        Genera la documentación de `pr_numbers` y de los PRs abiertos hacia
+        `to_pattern` (salvo, con `skip_generated`, los ya documentados por
+        gclit). Solo con `auto_confirm` se actualizan los PRs; si no, la CLI
+        pide una única confirmación y llama a `apply`.
+        """
+        timer = self._start()
+        with timer.phase("select"):
+            numbers = list(dict.fromkeys(pr_numbers or []))
+            if to_pattern:
+                numbers.extend(n for n in self.select(to_pattern, skip_generated) if n not in numbers)
+        if not numbers:
+            return {"error": "No hay Pull Requests que documentar"}
+
+        with timer.phase("batch"):
+            items = self._map(lambda n: self._generate(n, lang), numbers, concurrency)
+        # Las actualizaciones se envían juntas: el proveedor puede agruparlas en una petición
+        if auto_confirm and not dry_run:
+            with timer.phase("update"):
+                items = self._update(items)
+
+        self.diagnostics["prs"] = len(items)
+        self.diagnostics["failed"] = sum(1 for item in items if item["status"] == "error")
+        return {"items": items}
+
+    def apply(self, items: List[dict]) -> dict:
+        """Actualiza los PRs con la documentación ya generada"""
+        timer = self._start()
+        with timer.phase("update"):
+            items = self._update(items)
+        self.diagnostics["failed"] = sum(1 for item in items if item["status"] == "error")
+        return {"items": items}
+
+    def select(self, to_pattern: str, skip_generated: bool = False) -> List[int]:
+        """PRs abiertos cuya rama destino encaja con el glob `to_pattern`"""
+        # Sin comodines el filtro lo hace la API
+        base = None if any(char in to_pattern for char in "*?[") else to_pattern
+        return [
+            pr.pr_number for pr in self.git_provider.list_prs(base=base)
+            if fnmatch.fnmatchcase(pr.to_branch, to_pattern) and not (skip_generated and pr.generated)
+        ]
+
+    def _start(self) -> PhaseTimer:
+        timer = PhaseTimer()
+        self.timings = timer.timings
+        self.diagnostics = {}
+        return timer
+
+    def _map(self, func: Callable[[Any], dict], values: list, concurrency: Optional[int]) -> List[dict]:
+        if not values:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, concurrency or self.concurrency)) as executor:
+            return list(executor.map(bind_context(func), values))
+
+    def _generate(self, pr_number: int, lang: Lang) -> dict:
+        start = time.perf_counter()
+        use_case = None
+        try:
+            use_case = self.use_case_factory()
+            result = use_case.execute(pr_number=pr_number, lang=lang, dry_run=True)
+        except Exception as e:
+            result = {"error": str(e)}
+
+        usage = use_case.diagnostics.get("usage", {}) if use_case is not None else {}
+        return {
+            "pr_number": pr_number,
+            "status": "error" if "error" in result else result.get("action", "generated"),
+            "title": result.get("title", ""),
+            "body": result.get("body", ""),
+            "error": result.get("error"),
+            "seconds": time.perf_counter() - start,
+            "tokens": usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0),
+            "cached_tokens": usage.get("cached_tokens", 0),
+        }
+
+    def _update(self, items: List[dict]) -> List[dict]:
+        pending = [item for item in items if item["status"] == "generated"]
+        if not pending:
+            return items
+        start = time.perf_counter()
+        try:
+            errors = self.git_provider.update_prs([
+                (item["pr_number"], item["title"], mark_generated(item["body"])) for item in pending
+            ])
+        except Exception as e:
+            errors = {item["pr_number"]: str(e) for item in pending}
+        # El tiempo de la actualización conjunta se reparte entre los PRs
+        share = (time.perf_counter() - start) / len(pending)
+
+        updated = []
+        for item in items:
+            if item["status"] == "generated":
+                error = errors.get(item["pr_number"])
+                item = {
+                    **item,
+                    "status": "error" if error else "updated",
+                    "error": error,
+                    "seconds": item["seconds"] + share,
+                }
+            updated.append(item)
+        return updated
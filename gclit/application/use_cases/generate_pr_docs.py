@@ -1,14 +1,39 @@
 # gclit/application/use_cases/generate_pr_docs.py
-from gclit.domain.exceptions.exception import GitProviderException
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from gclit.application.concurrency import PhaseTimer, run_in_background
+from gclit.application.map_reduce import DiffSummarizer
+from gclit.application.token_budget import BudgetPlan, TokenBudget
+from gclit.domain.exceptions.exception import DeadlineExceededException, ExistingPullRequestException, GitProviderException
 from gclit.domain.models.common import Lang
-from gclit.domain.ports.llm import LLMProvider
-from gclit.domain.models.pull_request import PullRequestContext, PullRequestInfo
+from gclit.domain.models.diff import ParsedDiff, diff_mode
+from gclit.domain.ports.llm import LLMProvider, TokenCallback
+from gclit.domain.models.pull_request import PullRequestContext, PullRequestInfo, mark_generated
 from gclit.domain.ports.git import GitProvider
 
+
+class _DiffUnavailable(Exception):
+    """Fallo al obtener el diff que se devuelve como {"error": ...}"""
+
+
 class GeneratePullRequestDocs:
-    def __init__(self, llm_provider: LLMProvider, git_provider: GitProvider):
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        git_provider: GitProvider,
+        token_budget: Optional[TokenBudget] = None,
+        summarizer: Optional[DiffSummarizer] = None
+    ):
         self.llm_provider = llm_provider
         self.git_provider = git_provider
+        self.token_budget = token_budget or TokenBudget(llm_provider.model)
+        # Sin summarizer, los ficheros que no caben se omiten en lugar de resumirse
+        self.summarizer = summarizer
+        self.budget_plan: Optional[BudgetPlan] = None
+        self.timings: Dict[str, float] = {}
+        self.diagnostics: Dict[str, Any] = {}
 
     def execute(
         self,
@@ -17,40 +42,52 @@ class GeneratePullRequestDocs:
         pr_number: int = None, 
         lang: Lang = "en",
         auto_confirm: bool = False,
-        dry_run: bool = False
+        dry_run: bool = False,
+        on_token: Optional[TokenCallback] = None
     ) -> dict:
-        
-        if pr_number is not None:
-            try:
-                pr_data: PullRequestInfo = self.git_provider.get_pr_diff_by_number(pr_number)
-                from_branch = pr_data.from_branch
-                to_branch = pr_data.to_branch
-                remote_available = True
-            except Exception:
-                remote_available = False
-                if not from_branch or not to_branch:
-                    raise GitProviderException("No se pudo obtener información del PR remoto y no se proporcionaron las ramas")
-
+        """Con `on_token`, el título y la descripción se notifican según los genera el LLM"""
+        timer = self._start()
+        # La comprobación de PR existente arranca en cuanto se conocen las ramas, en
+        # paralelo al diff: si la creación está condenada a fallar, se informa sin
+        # esperar al resumen ni a la generación
+        check_existing = pr_number is None and not dry_run
         try:
-            diff = self.git_provider.get_branch_diff(from_branch, to_branch)
-            if not diff:
-                return {"error": "No hay diferencias entre las ramas especificadas"}
-        except GitProviderException as e:
-            if pr_number is not None:
-                return {"error": f"No se pudo obtener el diff: {str(e)}. Usa --from y --to para especificar ramas locales"}
-            raise e
+            context, remote_available, existing_future = self._build_context(
+                timer, from_branch, to_branch, pr_number, lang, check_existing=check_existing
+            )
+        except _DiffUnavailable as e:
+            return {"error": str(e)}
+        from_branch, to_branch = context.from_branch, context.to_branch
 
-        commit_history = self.git_provider.get_recent_commits(from_branch)
+        if self.summarizer is not None and self.budget_plan.omitted:
+            # El map-reduce es caro: antes se espera a saber si el PR ya existe
+            if existing_future is not None:
+                existing_pr = self._existing_pr_number(existing_future)
+                if existing_pr:
+                    return {"error": str(ExistingPullRequestException(from_branch, to_branch, existing_pr))}
+                existing_future = None
+            with timer.phase("map_reduce"):
+                context = self.summarizer.condense(context, self.budget_plan.source_diff, self.budget_plan.budget)
+            self.diagnostics["summary_chunks"] = self.summarizer.chunk_count
 
-        context = PullRequestContext(
-            diff=diff,
-            from_branch=from_branch,
-            to_branch=to_branch,
-            lang=lang,
-            commit_history=commit_history
-        )
+        cancelled = threading.Event()
+        llm_future = run_in_background(timer.timed("llm", self._generate), context, on_token, cancelled)
+
+        if existing_future is not None:
+            existing_pr = self._existing_pr_number(existing_future)
+            if existing_pr:
+                cancelled.set()
+                return {"error": str(ExistingPullRequestException(from_branch, to_branch, existing_pr))}
 
-        result = self.llm_provider.generate_pr_documentation(context)
+        result = llm_future.result()
+        usage = result.pop("usage", None)
+        if usage:
+            self.diagnostics["usage"] = usage
+        if result.pop("cached", False):
+            self.diagnostics["llm_cache"] = "hit"
+        provider = result.pop("provider", None)
+        if provider:
+            self.diagnostics["llm_provider"] = provider
         
         if dry_run or (pr_number is not None and not remote_available):
             return {
@@ -64,12 +101,14 @@ class GeneratePullRequestDocs:
             return {
                 "title": result["title"],
                 "body": result["body"],
+                "from_branch": from_branch,
+                "to_branch": to_branch,
                 "requires_confirmation": True
             }
 
         try:
             if pr_number is not None:
-                self.git_provider.update_pr(pr_number, title=result["title"], body=result["body"])
+                self.git_provider.update_pr(pr_number, title=result["title"], body=mark_generated(result["body"]))
                 result["action"] = "updated"
                 result["pr_number"] = pr_number
             else:
@@ -77,7 +116,7 @@ class GeneratePullRequestDocs:
                     from_branch=from_branch,
                     to_branch=to_branch,
                     title=result["title"],
-                    body=result["body"]
+                    body=mark_generated(result["body"])
                 )
                 result["action"] = "created"
                 result["pr_url"] = pr_url
@@ -87,18 +126,168 @@ class GeneratePullRequestDocs:
 
         return result
 
+    def explain_budget(
+        self,
+        from_branch: str = None,
+        to_branch: str = None,
+        pr_number: int = None,
+        lang: Lang = "en"
+    ) -> dict:
+        """Calcula el coste en tokens de cada fichero sin llamar al LLM"""
+        timer = self._start()
+        try:
+            self._build_context(timer, from_branch, to_branch, pr_number, lang)
+        except _DiffUnavailable as e:
+            return {"error": str(e)}
+        return self.budget_plan.as_dict()
+
+    def _start(self) -> PhaseTimer:
+        timer = PhaseTimer()
+        self.timings = timer.timings
+        self.diagnostics = {}
+        return timer
+
+    def _build_context(
+        self,
+        timer: PhaseTimer,
+        from_branch: Optional[str],
+        to_branch: Optional[str],
+        pr_number: Optional[int],
+        lang: Lang,
+        check_existing: bool = False
+    ) -> Tuple[PullRequestContext, bool, Optional[Future]]:
+        """
+        Reúne diff e historial (en paralelo) y ajusta el diff al presupuesto de
+        tokens. Con `check_existing` lanza también la búsqueda de un PR abierto
+        entre las ramas y devuelve su future.
+        """
+        remote_available = True
+        existing_future = None
+
+        with timer.phase("context"):
+            if pr_number is None:
+                from_branch, to_branch = self._default_branches(from_branch, to_branch)
+                if check_existing:
+                    existing_future = run_in_background(
+                        timer.timed("existing_pr", self.git_provider.find_existing_pr), from_branch, to_branch
+                    )
+
+            pr_future = None
+            if pr_number is not None:
+                pr_future = run_in_background(timer.timed("remote_pr", self.git_provider.get_pr_diff_by_number), pr_number)
+
+            # Con las ramas ya conocidas, el diff y el historial no esperan a la API remota
+            local_futures = None
+            if from_branch and to_branch:
+                local_futures = self._gather_local_context(timer, from_branch, to_branch)
+
+            if pr_future is not None:
+                try:
+                    pr_data: PullRequestInfo = pr_future.result()
+                    if (pr_data.from_branch, pr_data.to_branch) != (from_branch, to_branch):
+                        from_branch = pr_data.from_branch
+                        to_branch = pr_data.to_branch
+                        local_futures = None
+                except Exception:
+                    remote_available = False
+                    if not from_branch or not to_branch:
+                        raise GitProviderException("No se pudo obtener información del PR remoto y no se proporcionaron las ramas")
+
+            if local_futures is None:
+                local_futures = self._gather_local_context(timer, from_branch, to_branch)
+            diff_future, history_future = local_futures
+
+            try:
+                diff = diff_future.result()
+                self.diagnostics["diff_source"] = "git"
+            except GitProviderException as e:
+                if pr_number is None:
+                    raise e
+                # Ramas ausentes en local (p. ej. clon superficial de CI): se pide el diff a la API
+                diff = self._remote_diff(timer, pr_number, e)
+            if not diff:
+                raise _DiffUnavailable("No hay diferencias entre las ramas especificadas")
+
+            commit_history = history_future.result()
+            self.diagnostics["diff_mode"] = diff_mode(diff)
+
+        with timer.phase("budget"):
+            self.budget_plan = self.token_budget.fit(
+                ParsedDiff.parse(diff).without_noise(),
+                extra_text=commit_history or ""
+            )
+            self.diagnostics["tokens"] = f"{self.budget_plan.used}/{self.budget_plan.budget} (window {self.budget_plan.window})"
+            if self.budget_plan.omitted:
+                self.diagnostics["omitted_files"] = len(self.budget_plan.omitted)
+
+        context = PullRequestContext(
+            diff=diff,
+            parsed_diff=self.budget_plan.parsed_diff,
+            from_branch=from_branch,
+            to_branch=to_branch,
+            lang=lang,
+            commit_history=commit_history
+        )
+        return context, remote_available, existing_future
+
+    def _generate(self, context: PullRequestContext, on_token: Optional[TokenCallback], cancelled: threading.Event) -> dict:
+        if on_token is None:
+            return self.llm_provider.generate_pr_documentation(context)
+        # Si la creación ya se ha descartado, deja de mostrarse lo que siga llegando
+        return self.llm_provider.stream_pr_documentation(
+            context,
+            lambda field, text: None if cancelled.is_set() else on_token(field, text)
+        )
+
+    def _remote_diff(self, timer: PhaseTimer, pr_number: int, local_error: GitProviderException) -> str:
+        hint = f"No se pudo obtener el diff: {str(local_error)}. Usa --from y --to para especificar ramas locales"
+        try:
+            diff = timer.timed("remote_diff", self.git_provider.fetch_pr_diff)(pr_number)
+        except DeadlineExceededException:
+            raise
+        except Exception as e:
+            raise _DiffUnavailable(f"{hint} (API: {e})")
+        if diff is None:
+            raise _DiffUnavailable(hint)
+        self.diagnostics["diff_source"] = "api"
+        return diff
+
+    def _default_branches(self, from_branch: Optional[str], to_branch: Optional[str]) -> Tuple[str, str]:
+        """Sin ramas explícitas: la rama actual contra la rama por defecto del remoto"""
+        from_branch = from_branch or self.git_provider.get_branch_name()
+        to_branch = to_branch or self.git_provider.get_default_branch()
+        if not to_branch:
+            raise _DiffUnavailable("No se pudo determinar la rama por defecto del repositorio. Usa --to")
+        if from_branch == to_branch:
+            raise _DiffUnavailable(f"La rama origen y destino son la misma (`{to_branch}`). Usa --from o --to")
+        return from_branch, to_branch
+
+    def _gather_local_context(self, timer: PhaseTimer, from_branch: str, to_branch: str) -> Tuple[Future, Future]:
+        """Lanza en paralelo el diff entre ramas y el historial de commits"""
+        diff_future = run_in_background(timer.timed("git_diff", self.git_provider.get_branch_diff), from_branch, to_branch)
+        history_future = run_in_background(timer.timed("git_log", self.git_provider.get_recent_commits), from_branch)
+        return diff_future, history_future
+
+    @staticmethod
+    def _existing_pr_number(existing_future: Future) -> Optional[int]:
+        # Un fallo en la comprobación no bloquea: create_pr vuelve a validarlo
+        try:
+            return existing_future.result()
+        except Exception:
+            return None
+
     def confirm_and_execute(self, from_branch: str, to_branch: str, title: str, body: str, pr_number: int = None) -> dict:
         """Ejecuta la creación/actualización después de la confirmación"""
         try:
             if pr_number is not None:
-                self.git_provider.update_pr(pr_number, title=title, body=body)
+                self.git_provider.update_pr(pr_number, title=title, body=mark_generated(body))
                 return {"action": "updated", "pr_number": pr_number}
             else:
                 pr_url = self.git_provider.create_pr(
                     from_branch=from_branch,
                     to_branch=to_branch,
                     title=title,
-                    body=body
+                    body=mark_generated(body)
                 )
                 return {"action": "created", "pr_url": pr_url}
         except Exception as e:
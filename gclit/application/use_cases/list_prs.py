@@ -0,0 +1,35 @@
+# gclit/application/use_cases/list_prs.py
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from gclit.application.concurrency import PhaseTimer
+from gclit.domain.ports.git import GitProvider
+
+
+class ListPullRequests:
+    def __init__(self, git_provider: GitProvider):
+        self.git_provider = git_provider
+        self.timings: Dict[str, float] = {}
+        self.diagnostics: Dict[str, Any] = {}
+
+    def execute(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        author: Optional[str] = None,
+        limit: int = 30,
+        only_pending: bool = False
+    ) -> List[dict]:
+        """
+        PRs abiertos filtrados en el servidor. Las páginas se piden bajo
+        demanda, así que con `limit` no se descargan las que sobran.
+        """
+        timer = PhaseTimer()
+        self.timings = timer.timings
+        with timer.phase("list"):
+            prs = self.git_provider.list_prs(base=base, head=head, author=author)
+            if only_pending:
+                prs = (pr for pr in prs if not pr.generated)
+            result = [pr.model_dump() for pr in islice(prs, limit or None)]
+        self.diagnostics = {"prs": len(result)}
+        return result
@@ -1,41 +1,121 @@
 # gclit/cli/commands/commit.py
 
 import typer
+from typing import List, Optional
 from gclit.domain.models.common import Lang
-from gclit.container import container
-from gclit.cli.options.common import LangOptions
-from gclit.cli.utils import handle_cli_errors
-from gclit.application.use_cases.generate_commit import GenerateCommitMessage
+from gclit.cli.options.common import (
+    ExplainBudgetOptions,
+    LangOptions,
+    NoCacheOptions,
+    RefreshOptions,
+    TimeoutOptions,
+    VerboseOptions,
+)
+from gclit.cli.utils import ask_user, can_stream, echo_budget, echo_verbose, get_use_case, handle_cli_errors, with_timeout
 
 commit_app = typer.Typer()
 
+REGENERATE = "r"
+
+
+def _display_message(message: str):
+    typer.echo(f"\n🔤 Generated commit message:\n")
+    typer.secho(f"{message}", fg=typer.colors.BRIGHT_CYAN, bold=True)
+    typer.echo()
+
+
+def _display_candidates(messages: List[str]):
+    typer.echo(f"\n🔤 Generated commit messages:\n")
+    for index, message in enumerate(messages, start=1):
+        first, *rest = message.splitlines() or [""]
+        typer.secho(f"  {index}) {first}", fg=typer.colors.BRIGHT_CYAN, bold=True)
+        for line in rest:
+            typer.echo(f"     {line}")
+    typer.echo()
+
+
+def _choose(messages: List[str]) -> Optional[str]:
+    """Mensaje elegido, REGENERATE o None si se cancela"""
+    if len(messages) == 1:
+        question = "Do you want to create this commit? [y]es / [n]o / [r]egenerate"
+        choices = {"y": messages[0], "n": None, REGENERATE: REGENERATE}
+    else:
+        question = f"Pick a message [1-{len(messages)}], [r]egenerate or [n] to cancel"
+        choices = {str(index): message for index, message in enumerate(messages, start=1)}
+        choices.update({"n": None, REGENERATE: REGENERATE})
+
+    while True:
+        answer = ask_user(typer.prompt, question, default="n", show_default=False).strip().lower()
+        if answer in choices:
+            return choices[answer]
+        typer.secho(f"Please answer one of: {', '.join(choices)}", fg=typer.colors.YELLOW)
+
 
 @commit_app.command()
 @handle_cli_errors
+@with_timeout("commit generate")
 def generate(
     auto: bool = typer.Option(False, "--auto", help="Automatically create commit without confirmation"),
-    lang: Lang = LangOptions
+    candidates: int = typer.Option(
+        1, "--candidates", "-n", min=1, max=10, help="Generate N alternative messages in one request and pick one"
+    ),
+    lang: Lang = LangOptions,
+    explain_budget: bool = ExplainBudgetOptions,
+    verbose: bool = VerboseOptions,
+    no_cache: bool = NoCacheOptions,
+    refresh: bool = RefreshOptions,
+    timeout: float = TimeoutOptions
 ):
     """Generate a commit message based on staged changes."""
-    use_case = GenerateCommitMessage(
-        llm_provider=container.get_llm_provider(),
-        git_provider=container.get_git_provier()
-    )
+    use_case = get_use_case("commit", no_cache=no_cache, refresh=refresh)
 
-    message = use_case.execute(lang)
-    typer.echo(f"\n🔤 Generated commit message:\n")
-    typer.secho(f"{message}", fg=typer.colors.BRIGHT_CYAN, bold=True)
-    typer.echo()
+    if explain_budget:
+        echo_budget(use_case.explain_budget(lang=lang))
+        return
+
+    if candidates > 1:
+        messages = use_case.generate_candidates(lang=lang, candidates=candidates)
+        if verbose:
+            echo_verbose(use_case)
+    else:
+        streamed = []
+
+        def on_token(field: str, text: str):
+            if not streamed:
+                typer.echo(f"\n🔤 Generated commit message:\n")
+            streamed.append(text)
+            typer.secho(text, fg=typer.colors.BRIGHT_CYAN, bold=True, nl=False)
+
+        messages = [use_case.execute(lang=lang, on_token=on_token if can_stream() else None)]
+        if streamed:
+            typer.echo("\n")
+        if verbose:
+            echo_verbose(use_case)
+        if not streamed:
+            _display_message(messages[0])
 
     if auto:
-        use_case.apply_commit(message)
+        use_case.apply_commit(message=messages[0])
         typer.secho("✅ Commit created automatically.", fg=typer.colors.GREEN)
-    else:
-        if typer.confirm("Do you want to create this commit?"):
-            use_case.apply_commit(message)
-            typer.secho("✅ Commit created.", fg=typer.colors.GREEN)
+        return
+
+    if len(messages) > 1:
+        _display_candidates(messages)
+    choice = _choose(messages)
+    # Regenerar reutiliza el diff y el prompt ya construidos y el cliente abierto
+    while choice == REGENERATE:
+        messages = use_case.regenerate(lang=lang, candidates=candidates)
+        if len(messages) > 1:
+            _display_candidates(messages)
         else:
-            typer.echo("❌ Commit cancelled.")
+            _display_message(messages[0])
+        choice = _choose(messages)
+
+    if choice is None:
+        typer.echo("❌ Commit cancelled.")
+        return
+    use_case.apply_commit(message=choice)
+    typer.secho("✅ Commit created.", fg=typer.colors.GREEN)
 
 
 def register_commit_commands(app: typer.Typer):
@@ -1,11 +1,11 @@
 # cli/config.py
 import typer
-from gclit.config.settings import AppConfig, settings, get_config_keys
 
 config_app = typer.Typer()
 
 
 def key_autocomplete(ctx: typer.Context, args: list[str], incomplete: str):
+    from gclit.config.settings import AppConfig, get_config_keys
     config = AppConfig.load()
     all_keys = get_config_keys(config)
     return [k for k in all_keys if k.startswith(incomplete)]
@@ -19,6 +19,7 @@ def config_set(
     value: str = typer.Argument(...),
 ):
     """Actualiza una clave de configuración"""
+    from gclit.config.settings import AppConfig
     config = AppConfig.load()
     # all_keys = get_config_keys(config)
 
@@ -36,7 +37,8 @@ def config_set(
 @config_app.command("show")
 def config_show():
     """Muestra la configuración actual"""
-    for key, value in settings.model_dump().items():
+    from gclit.config.settings import get_settings
+    for key, value in get_settings().model_dump().items():
         typer.echo(f"{key}: {value}")
 
 
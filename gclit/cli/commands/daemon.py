@@ -0,0 +1,68 @@
+# gclit/cli/commands/daemon.py
+
+import subprocess
+import sys
+import time
+
+import typer
+
+daemon_app = typer.Typer()
+
+
+@daemon_app.command("start")
+def start(
+    foreground: bool = typer.Option(False, "--foreground", help="Run the daemon in the current process"),
+):
+    """Start the background daemon that keeps providers warm."""
+    from gclit.daemon.client import is_daemon_available
+
+    if is_daemon_available():
+        typer.echo("ℹ️  Daemon already running.")
+        return
+
+    if foreground:
+        from gclit.daemon.server import serve
+        serve()
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "gclit.daemon.server"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    for _ in range(50):
+        if is_daemon_available():
+            typer.secho("✅ Daemon started.", fg=typer.colors.GREEN)
+            return
+        time.sleep(0.1)
+    typer.secho("❌ Daemon did not start.", fg=typer.colors.RED)
+    raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def stop():
+    """Stop the background daemon."""
+    from gclit.daemon.client import shutdown_daemon
+
+    if shutdown_daemon():
+        typer.secho("✅ Daemon stopped.", fg=typer.colors.GREEN)
+    else:
+        typer.echo("ℹ️  Daemon is not running.")
+
+
+@daemon_app.command("status")
+def status():
+    """Show whether the daemon is running."""
+    from gclit.daemon.client import is_daemon_available
+
+    if is_daemon_available():
+        typer.secho("🟢 Daemon running.", fg=typer.colors.GREEN)
+    else:
+        typer.echo("⚪ Daemon not running.")
+
+
+def register_daemon_commands(app: typer.Typer):
+    """Registra los comandos del daemon en la aplicación principal"""
+    app.add_typer(daemon_app, name="daemon", help="Background daemon that keeps providers warm")
@@ -1,11 +1,17 @@
 # gclit/cli/commands/pr.py
 
 import typer
+from typing import List
 from gclit.domain.models.common import Lang
-from gclit.container import container
-from gclit.cli.options.common import LangOptions
-from gclit.cli.utils import handle_cli_errors
-from gclit.application.use_cases.generate_pr_docs import GeneratePullRequestDocs
+from gclit.cli.options.common import (
+    ExplainBudgetOptions,
+    LangOptions,
+    NoCacheOptions,
+    RefreshOptions,
+    TimeoutOptions,
+    VerboseOptions,
+)
+from gclit.cli.utils import ask_user, can_stream, echo_budget, echo_verbose, get_use_case, handle_cli_errors, with_timeout
 
 pr_app = typer.Typer()
 
@@ -20,54 +26,176 @@ def _display_pr_documentation(title: str, body: str):
     typer.echo(f"{'='*60}\n")
 
 
+class _StreamPrinter:
+    """Muestra título y descripción según los genera el LLM, con el formato de _display_pr_documentation"""
+
+    def __init__(self):
+        self.title = None
+        self.body_started = False
+
+    def __call__(self, field: str, text: str):
+        if field == "title":
+            self.title = text
+            typer.echo(f"\n{'='*60}")
+            typer.echo(f"📌 PR TITLE:")
+            typer.secho(f"{text}", fg=typer.colors.BRIGHT_CYAN, bold=True)
+        elif field == "body" and self.title is not None:
+            if not self.body_started:
+                self.body_started = True
+                typer.echo(f"\n📝 PR DESCRIPTION:")
+            typer.echo(text, nl=False)
+
+    def finish(self, title: str, body: str):
+        """Cierra lo mostrado o, si no llegó a mostrarse completo, pinta el resultado final"""
+        if self.title == title and (self.body_started or not body):
+            typer.echo(f"\n{'='*60}\n")
+        else:
+            if self.title is not None:
+                typer.echo()
+            _display_pr_documentation(title, body)
+
+
 def _confirm_action(action_type: str) -> bool:
     """Helper para pedir confirmación"""
-    return typer.confirm(f"Do you want to {action_type} the Pull Request?")
+    return ask_user(typer.confirm, f"Do you want to {action_type} the Pull Request?")
+
+
+def _display_batch_summary(items: List[dict]):
+    """Tabla resumen del modo batch: estado, latencia y tokens por PR"""
+    colors = {"updated": typer.colors.GREEN, "generated": typer.colors.BLUE, "error": typer.colors.RED}
+    typer.echo(f"\n{'PR':>7}  {'STATUS':<10} {'TIME':>8} {'TOKENS':>8}  TITLE / ERROR")
+    for item in items:
+        detail = item["error"] if item["status"] == "error" else item["title"]
+        typer.secho(
+            f"{'#' + str(item['pr_number']):>7}  {item['status']:<10} {item['seconds']:>7.1f}s {item['tokens']:>8}  {detail}",
+            fg=colors.get(item["status"])
+        )
+    total_tokens = sum(item["tokens"] for item in items)
+    cached_tokens = sum(item.get("cached_tokens", 0) for item in items)
+    failed = sum(1 for item in items if item["status"] == "error")
+    typer.echo(f"\n{len(items)} PRs, {failed} failed, {total_tokens} tokens ({cached_tokens} cached prompt tokens).\n")
+
+
+def _generate_batch(
+    pr_numbers: List[int],
+    to_pattern: str,
+    skip_generated: bool,
+    lang: Lang,
+    auto: bool,
+    dry_run: bool,
+    concurrency: int,
+    verbose: bool,
+    no_cache: bool,
+    refresh: bool
+):
+    """Documenta varios PRs en paralelo; sin --auto pide una sola confirmación"""
+    use_case = get_use_case("pr_batch", no_cache=no_cache, refresh=refresh)
+    result = use_case.execute(
+        pr_numbers=pr_numbers,
+        to_pattern=to_pattern,
+        lang=lang,
+        auto_confirm=auto,
+        dry_run=dry_run,
+        concurrency=concurrency,
+        skip_generated=skip_generated
+    )
+    if "error" in result:
+        typer.secho(f"❌ {result['error']}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    items = result["items"]
+    if dry_run:
+        for item in items:
+            if item["status"] != "error":
+                typer.echo(f"PR #{item['pr_number']}")
+                _display_pr_documentation(item["title"], item["body"])
+    _display_batch_summary(items)
+    if verbose:
+        echo_verbose(use_case)
+
+    pending = sum(1 for item in items if item["status"] == "generated")
+    if pending and not auto and not dry_run:
+        if ask_user(typer.confirm, f"Do you want to update {pending} Pull Requests?"):
+            items = use_case.apply(items=items)["items"]
+            _display_batch_summary(items)
+        else:
+            typer.echo("❌ Operation cancelled.")
+
+    if any(item["status"] == "error" for item in items):
+        raise typer.Exit(code=1)
 
 
 @pr_app.command("generate")
 @handle_cli_errors
+@with_timeout("pr generate")
 def generate(
-    branch_from: str = typer.Option(None, "--from", help="Source branch for the PR"),
-    branch_to: str = typer.Option(None, "--to", help="Target branch for the PR"),
+    branch_from: str = typer.Option(None, "--from", help="Source branch for the PR (defaults to the current branch)"),
+    branch_to: str = typer.Option(None, "--to", help="Target branch for the PR (defaults to the repository's default branch)"),
     pr_number: int = typer.Option(None, "--pr", help="PR number to update"),
+    extra_prs: List[int] = typer.Argument(None, help="More PR numbers to document in batch (`--pr 12 15 18`)"),
+    open_prs: bool = typer.Option(False, "--open", help="Document every open PR targeting --to (glob allowed, e.g. 'release/*')"),
+    concurrency: int = typer.Option(None, "--concurrency", help="PRs documented in parallel in batch mode"),
+    skip_generated: bool = typer.Option(False, "--skip-generated", help="With --open, skip PRs already documented by gclit"),
     auto: bool = typer.Option(False, "--auto", help="Skip confirmation prompt"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Generate documentation without creating/updating PR"),
-    lang: Lang = LangOptions
+    lang: Lang = LangOptions,
+    explain_budget: bool = ExplainBudgetOptions,
+    verbose: bool = VerboseOptions,
+    no_cache: bool = NoCacheOptions,
+    refresh: bool = RefreshOptions,
+    timeout: float = TimeoutOptions
 ):
     """
     Generate or update pull request documentation.
 
     Use --from and --to to generate a new PR doc,
-    or use --pr to update an existing one.
+    or use --pr to update an existing one. Without them, the current
+    branch is compared against the repository's default branch.
+
+    Several PRs (`--pr 12 15 18`) or all open PRs towards a branch
+    (`--open --to 'release/*'`) are documented in parallel.
     """
 
-    if not pr_number and (not branch_from or not branch_to):
-        typer.secho("❌ Must provide either --from/--to or --pr.", fg=typer.colors.RED)
-        raise typer.Exit(code=1)
+    if extra_prs or open_prs:
+        if explain_budget:
+            typer.secho("❌ --explain-budget works with a single PR.", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        pr_numbers = ([pr_number] if pr_number else []) + list(extra_prs or [])
+        to_pattern = (branch_to or "*") if open_prs else None
+        _generate_batch(pr_numbers, to_pattern, skip_generated, lang, auto, dry_run, concurrency, verbose, no_cache, refresh)
+        return
 
-    use_case = GeneratePullRequestDocs(
-        llm_provider=container.get_llm_provider(),
-        git_provider=container.get_git_provier()
-    )
+    use_case = get_use_case("pr", no_cache=no_cache, refresh=refresh)
 
+    if explain_budget:
+        plan = use_case.explain_budget(from_branch=branch_from, to_branch=branch_to, pr_number=pr_number, lang=lang)
+        if "error" in plan:
+            typer.secho(f"❌ {plan['error']}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        echo_budget(plan)
+        return
+
+    printer = _StreamPrinter()
     result = use_case.execute(
         from_branch=branch_from,
         to_branch=branch_to,
         pr_number=pr_number,
         lang=lang,
         auto_confirm=auto,
-        dry_run=dry_run
+        dry_run=dry_run,
+        on_token=printer if can_stream() else None
     )
+    if "title" in result:
+        printer.finish(result["title"], result["body"])
+    elif printer.title is not None:
+        typer.echo()
+    if verbose:
+        echo_verbose(use_case)
 
     if "error" in result:
         typer.secho(f"❌ {result['error']}", fg=typer.colors.RED)
-        if result.get("dry_run") and "title" in result:
-            _display_pr_documentation(result.get("title", ""), result.get("body", ""))
         raise typer.Exit(code=1)
 
-    _display_pr_documentation(result["title"], result["body"])
-
     if dry_run or result.get("dry_run"):
         if not result.get("remote_available", True):
             typer.secho("ℹ️  Could not access remote PR. Documentation generated using local branches.",
@@ -104,9 +232,34 @@ def generate(
 
 @pr_app.command("list")
 @handle_cli_errors
-def list_prs():
-    """List open pull requests (future feature)"""
-    typer.echo("🚧 Feature coming soon: List open PRs")
+@with_timeout("pr list")
+def list_prs(
+    base: str = typer.Option(None, "--base", help="Only PRs targeting this branch"),
+    head: str = typer.Option(None, "--head", help="Only PRs from this branch"),
+    author: str = typer.Option(None, "--author", help="Only PRs opened by this user"),
+    limit: int = typer.Option(30, "--limit", help="Maximum number of PRs to show (0 = all)"),
+    pending: bool = typer.Option(False, "--pending", help="Only PRs without a gclit-generated description"),
+    verbose: bool = VerboseOptions,
+    no_cache: bool = NoCacheOptions,
+    timeout: float = TimeoutOptions
+):
+    """
+    List open pull requests.
+
+    PRs whose description was written by gclit are flagged with 🤖.
+    """
+    use_case = get_use_case("pr_list", no_cache=no_cache)
+    prs = use_case.execute(base=base, head=head, author=author, limit=limit, only_pending=pending)
+
+    if not prs:
+        typer.echo("No open pull requests found.")
+    for pr in prs:
+        mark = "🤖" if pr["generated"] else "  "
+        typer.echo(f"{mark} #{pr['pr_number']:<6} {pr['from_branch']} → {pr['to_branch']}")
+        typer.secho(f"          {pr['title']}" + (f" ({pr['author']})" if pr["author"] else ""), fg=typer.colors.BRIGHT_CYAN)
+
+    if verbose:
+        echo_verbose(use_case)
 
 
 def register_pr_commands(app: typer.Typer):
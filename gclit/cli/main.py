@@ -3,6 +3,7 @@ import typer
 from gclit.cli.commands.commit import register_commit_commands
 from gclit.cli.commands.pr import register_pr_commands
 from gclit.cli.commands.config import register_config_app
+from gclit.cli.commands.daemon import register_daemon_commands
 
 app = typer.Typer(
     name="gclit",
@@ -13,6 +14,7 @@ app = typer.Typer(
 register_commit_commands(app)
 register_pr_commands(app)
 register_config_app(app)
+register_daemon_commands(app)
 
 
 @app.command("version")
@@ -2,3 +2,17 @@ import typer
 
 
 LangOptions = typer.Option("en", "--lang", help="Language for the documentation")
+ExplainBudgetOptions = typer.Option(
+    False, "--explain-budget", help="Show the per-file token cost of the prompt and exit without calling the model"
+)
+VerboseOptions = typer.Option(False, "--verbose", "-v", help="Show per-phase timings and diagnostics")
+NoCacheOptions = typer.Option(
+    False, "--no-cache", help="Bypass the on-disk caches (LLM and API responses, merge-bases, repository metadata)"
+)
+RefreshOptions = typer.Option(
+    False, "--refresh", help="Ignore cached results (e.g. a previous LLM response) and store fresh ones"
+)
+TimeoutOptions = typer.Option(
+    0.0, "--timeout", min=0,
+    help="Abort if the command takes longer than this many seconds, not counting prompts (0 = no limit)"
+)
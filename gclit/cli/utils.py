@@ -1,9 +1,15 @@
 # gclit/cli/utils.py
 
+import sys
 import typer
 from functools import wraps
+from typing import Callable
 
-from gclit.domain.exceptions.exception import GclitException, LLMProviderException
+from gclit.domain.deadline import deadline, paused, phase
+from gclit.domain.exceptions.exception import DeadlineExceededException, GclitException, LLMProviderException
+
+# Como timeout(1): los hooks distinguen un plazo agotado de otros fallos
+TIMEOUT_EXIT_CODE = 124
 
 
 def handle_cli_errors(func):
@@ -11,6 +17,11 @@ def handle_cli_errors(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except (typer.Exit, typer.Abort):
+            raise
+        except DeadlineExceededException as e:
+            typer.secho(f"⏱️  Timeout: {str(e)}", fg=typer.colors.RED)
+            raise typer.Exit(code=TIMEOUT_EXIT_CODE)
         except GclitException as e:
             typer.secho(f"❌ Error: {str(e)}", fg=typer.colors.RED)
         except LLMProviderException as e:
@@ -19,3 +30,82 @@ def handle_cli_errors(func):
             typer.secho(f"💥 Error inesperado: {str(e)}", fg=typer.colors.BRIGHT_RED)
 
     return wrapper
+
+
+def with_timeout(command: str):
+    """
+    Aplica el `--timeout` del comando a todo su trabajo (git, APIs y LLM).
+    Fuera de las fases de los casos de uso, el error cita `command`.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with deadline(kwargs.get("timeout")), phase(command):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def ask_user(prompt: Callable, *args, **kwargs):
+    """typer.prompt/confirm sin que la espera al usuario consuma el plazo de --timeout"""
+    with paused():
+        return prompt(*args, **kwargs)
+
+
+def echo_verbose(use_case):
+    """Muestra los diagnósticos y la duración de cada fase en modo verbose"""
+    for key, value in getattr(use_case, "diagnostics", {}).items():
+        typer.secho(f"🔎 {key}: {value}", fg=typer.colors.BRIGHT_BLACK)
+
+    timings = getattr(use_case, "timings", {})
+    if not timings:
+        return
+    typer.secho("⏱️  Timings:", fg=typer.colors.BRIGHT_BLACK)
+    for phase, seconds in timings.items():
+        typer.secho(f"   {phase:<14} {seconds * 1000:8.1f} ms", fg=typer.colors.BRIGHT_BLACK)
+
+
+def can_stream() -> bool:
+    """Los tokens solo se pintan en vivo en una terminal; en pipes y CI se muestra el resultado final"""
+    return sys.stdout.isatty()
+
+
+def echo_budget(plan: dict):
+    """Tabla con el coste en tokens de cada fichero y si entra en el presupuesto"""
+    typer.echo(f"\n📊 Token budget: {plan['used']}/{plan['budget']} tokens (model window {plan['window']})\n")
+    for file in sorted(plan["files"], key=lambda f: f["tokens"], reverse=True):
+        mark = "✅" if file["included"] else "✂️ "
+        typer.echo(f"{mark} {file['tokens']:>8}  {file['category']:<7} {file['path']}")
+
+    omitted = sum(1 for file in plan["files"] if not file["included"])
+    if omitted:
+        typer.secho(f"\n{omitted} files omitted to fit the budget.", fg=typer.colors.YELLOW)
+    typer.echo()
+
+
+def get_use_case(name: str, no_cache: bool = False, refresh: bool = False):
+    """
+    Devuelve el caso de uso `name`: a través del daemon si está en marcha,
+    o construido en el proceso actual en caso contrario.
+    """
+    from gclit.daemon.client import get_remote_use_case
+
+    options = {"cache_mode": "off" if no_cache else "refresh" if refresh else "use"}
+
+    def build_local():
+        from gclit.container import container
+        from gclit.infrastructure.cache.disk_cache import set_cache_mode
+
+        set_cache_mode(options["cache_mode"])
+        return container.get_use_case(name)
+
+    def apply_commit(message: str) -> str:
+        # git commit lanza hooks y firma: necesita la terminal y el entorno de este proceso
+        from gclit.container import container
+
+        return container.get_git_provier().create_commit(message)
+
+    local_methods = {"apply_commit": apply_commit} if name == "commit" else None
+    return get_remote_use_case(name, fallback=build_local, options=options, local_methods=local_methods) or build_local()
@@ -2,12 +2,14 @@
 
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, TypeAdapter, field_validator
+from typing import List, Literal
 import json
 
 from gclit.domain.models.common import Lang
 
 CONFIG_PATH = Path.home() / ".gclit" / "config.json"
+CACHE_DIR = CONFIG_PATH.parent / "cache"
 
 
 class OpenAISettings(BaseModel):
@@ -20,16 +22,112 @@ class ClaudeSettings(BaseModel):
 
 class LocalSettings(BaseModel):
     endpoint: str = "http://localhost:11434"
+    # Solo para servidores compatibles que exijan clave (vLLM, LM Studio...)
+    api_key: str = ""
+    # Tiempo que Ollama mantiene el modelo cargado tras cada petición ("" = el del servidor)
+    keep_alive: str = "30m"
+    # Carga el modelo en segundo plano al arrancar, en paralelo a la lectura del diff
+    warm_up: bool = True
+
+
+class HedgeSettings(BaseModel):
+    # Con provider = "hedged": cada petición va a `primary` y, si no responde en
+    # `delay_ms`, también a `secondary`; gana la primera respuesta
+    primary: str = "openai"
+    secondary: str = "local"
+    # Modelo del secundario ("" = el mismo que `model`)
+    secondary_model: str = ""
+    delay_ms: int = 2000
 
 
 class GitHubSettings(BaseModel):
     token: str = ""
+    # Agrupa consultas y actualizaciones en peticiones GraphQL (REST si no está disponible)
+    graphql: bool = True
 
 
 class AzureDevOpsSettings(BaseModel):
     token: str = ""
 
 
+class DiffSettings(BaseModel):
+    # Presupuesto de lectura del diff (0 = sin límite)
+    max_bytes: int = 4 * 1024 * 1024
+    max_tokens: int = 0
+    # A partir de este tamaño el diff se vuelca a un fichero temporal
+    spill_bytes: int = 1024 * 1024
+
+    # Globs al estilo .gitignore: sin "/" se aplican en cualquier directorio
+    include: List[str] = []
+    exclude: List[str] = []
+    # Lockfiles, bundles minificados, snapshots y código generado conocidos
+    exclude_defaults: bool = True
+    # Respeta `linguist-generated` y `-diff` de .gitattributes
+    use_gitattributes: bool = True
+
+    # full: -U3 | compact: -U0 sin espacios | function: contexto de función
+    # auto: compact a partir de `compact_threshold_lines` líneas cambiadas
+    mode: Literal["auto", "full", "compact", "function"] = "auto"
+    compact_threshold_lines: int = 1500
+    # En auto se ignoran espacios si menos de esta fracción del cambio sobrevive a -w
+    whitespace_ratio: float = 0.5
+
+    @field_validator("include", "exclude", mode="before")
+    @classmethod
+    def _split_globs(cls, value):
+        # Permite `gclit config set diff.exclude "*.sql,docs/**"`
+        if isinstance(value, str):
+            return [glob.strip() for glob in value.split(",") if glob.strip()]
+        return value
+
+
+class BudgetSettings(BaseModel):
+    # Límite de tokens del prompt (0 = ventana de contexto del modelo)
+    max_prompt_tokens: int = 0
+    # Tokens reservados para la respuesta del modelo
+    reserve_output_tokens: int = 4096
+
+
+class MapReduceSettings(BaseModel):
+    # Resume por bloques los PRs que no caben en la ventana del modelo
+    enabled: bool = True
+    concurrency: int = 4
+    chunk_tokens: int = 12_000
+
+
+class BatchSettings(BaseModel):
+    # PRs documentados en paralelo en `gclit pr generate --pr 12 15 18`
+    concurrency: int = 4
+
+
+class GitSettings(BaseModel):
+    remote: str = "origin"
+    # Trae con un fetch superficial las ramas que no existan en local
+    fetch_missing: bool = False
+    fetch_depth: int = 50
+
+
+class HttpSettings(BaseModel):
+    # Timeouts de las APIs de GitHub / Azure DevOps, en segundos
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    # Reintentos ante errores de red, 5xx y límites de peticiones
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    # Si la cuota se repone más tarde que esto, se falla en lugar de esperar
+    rate_limit_max_wait: float = 60.0
+    pool_size: int = 10
+
+
+class CacheSettings(BaseModel):
+    enabled: bool = True
+    # Tamaño máximo de cada caché en disco antes de expulsar por LRU
+    max_bytes: int = 100 * 1024 * 1024
+    # Vigencia de las respuestas del LLM guardadas (0 = sin caducidad)
+    llm_ttl: int = 7 * 24 * 3600
+
+
 class AppConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -50,6 +148,15 @@ class AppConfig(BaseSettings):
     openai: OpenAISettings = OpenAISettings()
     claude: ClaudeSettings = ClaudeSettings()
     local: LocalSettings = LocalSettings()
+    hedge: HedgeSettings = HedgeSettings()
+
+    git: GitSettings = GitSettings()
+    http: HttpSettings = HttpSettings()
+    cache: CacheSettings = CacheSettings()
+    diff: DiffSettings = DiffSettings()
+    budget: BudgetSettings = BudgetSettings()
+    map_reduce: MapReduceSettings = MapReduceSettings()
+    batch: BatchSettings = BatchSettings()
 
     @classmethod
     def load(cls) -> "AppConfig":
@@ -100,4 +207,25 @@ def get_config_keys(config: BaseModel, prefix="") -> list[str]:
     return keys
 
 
-settings = AppConfig.load()
+_settings = None
+
+
+def get_settings() -> AppConfig:
+    """Carga la configuración una sola vez, en el primer uso"""
+    global _settings
+    if _settings is None:
+        _settings = AppConfig.load()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Descarta la configuración cargada para releerla en el próximo acceso"""
+    global _settings
+    _settings = None
+
+
+def __getattr__(name: str):
+    # Compatibilidad con `from gclit.config.settings import settings` sin cargar al importar
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,47 @@
 # gclit/container.py
 
-import subprocess
-import re
+import importlib
 
-from gclit.config.settings import settings
-from gclit.domain.exceptions.exception import GitProviderException, LLMProviderException
+from gclit.config.settings import CACHE_DIR, get_settings
+from gclit.domain.exceptions.exception import LLMProviderException
 from gclit.domain.ports.git import GitProvider
 from gclit.domain.ports.llm import LLMProvider
 
-from gclit.infrastructure.llm.openai_provider import OpenAIProvider
-from gclit.infrastructure.git.github_adapter import GitHubAdapter
-from gclit.infrastructure.git.azure_devops_adapter import AzureDevOpsAdapter
-from gclit.infrastructure.llm.openai_with_func_provider import OpenAIWithFuncProvider
+
+# Registro perezoso: los módulos (openai, requests) solo se importan al resolver el proveedor
+LLM_PROVIDERS = {
+    "openai": "gclit.infrastructure.llm.openai_provider:OpenAIProvider",
+    "openai-with-func": "gclit.infrastructure.llm.openai_with_func_provider:OpenAIWithFuncProvider",
+    "local": "gclit.infrastructure.llm.local_provider:LocalProvider",
+}
+
+# Proveedores con implementación asíncrona nativa (los síncronos se apoyan en ellos)
+ASYNC_LLM_PROVIDERS = {
+    "openai": "gclit.infrastructure.llm.async_openai_provider:AsyncOpenAIProvider",
+    "local": "gclit.infrastructure.llm.local_provider:AsyncLocalProvider",
+}
+
+# Compone dos de los proveedores anteriores (ver HedgeSettings)
+HEDGED_PROVIDER = "hedged"
+
+GIT_PROVIDERS = {
+    "github": "gclit.infrastructure.git.github_adapter:GitHubAdapter",
+    "azure_devops": "gclit.infrastructure.git.azure_devops_adapter:AzureDevOpsAdapter",
+}
+
+
+USE_CASES = {
+    "commit": "gclit.application.use_cases.generate_commit:GenerateCommitMessage",
+    "pr": "gclit.application.use_cases.generate_pr_docs:GeneratePullRequestDocs",
+    "pr_batch": "gclit.application.use_cases.generate_pr_batch:GeneratePullRequestDocsBatch",
+    "pr_list": "gclit.application.use_cases.list_prs:ListPullRequests",
+}
+
+
+def _load(path: str):
+    """Importa `modulo:Clase` bajo demanda"""
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class Container:
@@ -20,52 +50,159 @@ class Container:
 
     def get_llm_provider(self) -> LLMProvider:
         if self._llm_provider is None:
+            settings = get_settings()
             provider = settings.provider.lower()
-            if provider == "openai":
-                self._llm_provider = OpenAIProvider(
-                    model=settings.model,
-                    api_key=settings.openai.api_key
-                )
-
-            elif provider == "openai-with-func":
-                self._llm_provider = OpenAIWithFuncProvider(
-                    model=settings.model,
-                    api_key=settings.openai.api_key
-                )
+            if provider == HEDGED_PROVIDER:
+                from gclit.infrastructure.llm.hedged_provider import HedgedProvider
 
-            else:
+                self._llm_provider = HedgedProvider(self._hedge_members(), delay=settings.hedge.delay_ms / 1000)
+            elif provider not in LLM_PROVIDERS:
                 raise LLMProviderException(f"Unsupported LLM provider: {provider}")
+            else:
+                provider_class = _load(LLM_PROVIDERS[provider])
+                self._llm_provider = provider_class(**self._llm_options(provider))
+            cache = self._cache("llm", ttl=settings.cache.llm_ttl)
+            if cache is not None:
+                from gclit.infrastructure.llm.cached_provider import CachedLLMProvider
+
+                self._llm_provider = CachedLLMProvider(self._llm_provider, cache, provider_name=provider)
         return self._llm_provider
 
-    def get_git_provier(self) -> LLMProvider:
-        result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True)
-        url = result.stdout.strip()
-        if "github.com" in url:
-            # Soporta formatos SSH y HTTPS
-            token = settings.github.token
-            match = re.search(r"(github\.com[:/])(.+?)(\.git)?$", url)
-
-            if not match:
-                raise GitProviderException("No se pudo extraer el repo de GitHub")
-            repo = match.group(2)
-            return GitHubAdapter(token=token, repo=repo)
-
-        elif "dev.azure.com" in url:
-            match = re.search(r"dev\.azure\.com/([^/]+)/([^/]+)/_git/([^/]+)", url)
-            token = settings.azure_devops.token
-
-            if not match:
-                raise GitProviderException("No se pudo extraer info de Azure DevOps")
-            organization, project, repo = match.groups()
-            return AzureDevOpsAdapter(
-                token=token,
-                organization=organization,
-                project=project,
-                repo=repo
+    def _hedge_members(self) -> list:
+        """
+        (etiqueta, proveedor asíncrono) del principal y el secundario. Los
+        proveedores sin versión asíncrona se ejecutan en un hilo.
+        """
+        from gclit.infrastructure.llm.hedged_provider import ThreadedLLMProvider
+
+        settings = get_settings()
+        members = []
+        for provider, model in (
+            (settings.hedge.primary, settings.model),
+            (settings.hedge.secondary, settings.hedge.secondary_model or settings.model),
+        ):
+            provider = provider.lower()
+            if provider not in LLM_PROVIDERS:
+                raise LLMProviderException(f"Unsupported LLM provider for hedging: {provider}")
+            options = {**self._llm_options(provider), "model": model}
+            if provider in ASYNC_LLM_PROVIDERS:
+                member = _load(ASYNC_LLM_PROVIDERS[provider])(**options)
+            else:
+                member = ThreadedLLMProvider(_load(LLM_PROVIDERS[provider])(**options))
+            members.append((f"{provider}:{model}", member))
+        return members
+
+    @staticmethod
+    def _llm_options(provider: str) -> dict:
+        settings = get_settings()
+        if provider == "local":
+            return {
+                "model": settings.model,
+                "endpoint": settings.local.endpoint,
+                "api_key": settings.local.api_key,
+                "keep_alive": settings.local.keep_alive or None,
+                "warm_up": settings.local.warm_up,
+            }
+        return {"model": settings.model, "api_key": settings.openai.api_key}
+
+    def get_token_budget(self, reserve_output_tokens: int = None):
+        from gclit.application.token_budget import TokenBudget
+
+        settings = get_settings()
+        return TokenBudget(
+            model=settings.model,
+            max_prompt_tokens=settings.budget.max_prompt_tokens,
+            reserve_output_tokens=reserve_output_tokens or settings.budget.reserve_output_tokens
+        )
+
+    def get_summarizer(self):
+        from gclit.application.map_reduce import DiffSummarizer
+
+        settings = get_settings()
+        if not settings.map_reduce.enabled:
+            return None
+        return DiffSummarizer(
+            self.get_llm_provider(),
+            concurrency=settings.map_reduce.concurrency,
+            chunk_tokens=settings.map_reduce.chunk_tokens
+        )
+
+    def get_use_case(self, name: str, git_provider: GitProvider = None):
+        """Construye el caso de uso `name` con los proveedores configurados"""
+        use_case_class = _load(USE_CASES[name])
+        if name == "pr_list":
+            return use_case_class(git_provider=git_provider or self.get_git_provier())
+        if name == "pr_batch":
+            git_provider = git_provider or self.get_git_provier()
+            return use_case_class(
+                git_provider=git_provider,
+                use_case_factory=lambda: self.get_use_case("pr", git_provider=git_provider),
+                concurrency=get_settings().batch.concurrency
+            )
+
+        dependencies = {
+            "llm_provider": self.get_llm_provider(),
+            "git_provider": git_provider or self.get_git_provier(),
+            # Un mensaje de commit necesita poca reserva de salida
+            "token_budget": self.get_token_budget(256 if name == "commit" else None),
+        }
+        if name == "pr":
+            dependencies["summarizer"] = self.get_summarizer()
+        return use_case_class(**dependencies)
+
+    def reset(self) -> None:
+        """Descarta los proveedores en caché (p. ej. tras cambiar la configuración)"""
+        self._llm_provider = None
+
+    def _cache(self, name: str, ttl: int = 0):
+        from gclit.infrastructure.cache.disk_cache import DiskCache
+
+        settings = get_settings()
+        if not settings.cache.enabled:
+            return None
+        return DiskCache(CACHE_DIR / name, max_bytes=settings.cache.max_bytes, ttl=ttl)
+
+    def _git_adapter_options(self) -> dict:
+        settings = get_settings()
+        return {
+            "diff_settings": settings.diff,
+            "git_settings": settings.git,
+            "merge_base_cache": self._cache("merge_base"),
+        }
+
+    def get_repo_metadata_store(self):
+        from gclit.infrastructure.git.repo_metadata import RepoMetadataStore
+
+        return RepoMetadataStore(self._cache("repos"), preferred_remote=get_settings().git.remote)
+
+    def get_git_provier(self) -> GitProvider:
+        settings = get_settings()
+        # Proveedor, owner/repo y org/proyecto salen de .git/config (cacheado por repo)
+        store = self.get_repo_metadata_store()
+        repository = store.load()
+        options = {
+            **self._git_adapter_options(),
+            "repository": repository,
+            "metadata_store": store,
+            "http_settings": settings.http,
+            "http_cache": self._cache("http"),
+        }
+
+        if repository.provider == "github":
+            return _load(GIT_PROVIDERS["github"])(
+                token=settings.github.token,
+                repo=repository.full_name,
+                graphql=settings.github.graphql,
+                **options
             )
 
-        else:
-            raise GitProviderException("Proveedor Git no reconocido en la URL del repo")
+        return _load(GIT_PROVIDERS["azure_devops"])(
+            token=settings.azure_devops.token,
+            organization=repository.organization,
+            project=repository.project,
+            repo=repository.repo,
+            **options
+        )
 
 
 container = Container()
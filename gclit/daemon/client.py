@@ -0,0 +1,161 @@
+# gclit/daemon/client.py
+import os
+import socket
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from gclit.daemon.protocol import SOCKET_PATH, dotenv_overrides, environment_fingerprint, read_message, send_message
+from gclit.domain.deadline import exceeded, remaining, total
+from gclit.domain.exceptions import exception as exceptions
+
+# El daemon recibe un plazo algo menor que el del cliente: así suele ser él quien
+# informa del error, con la fase en la que ocurrió, sin pasarse del plazo total
+DEADLINE_MARGIN = 0.1
+# Un daemon ocupado o colgado no debe bloquear la CLI: pasado esto se trabaja en local
+CONNECT_TIMEOUT = 0.5
+PING_TIMEOUT = 0.5
+
+
+def _request(
+    message: dict,
+    on_token: Optional[Callable[[str, str], None]] = None,
+    timeout: Optional[float] = None
+) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT if timeout is None else min(timeout, CONNECT_TIMEOUT))
+        try:
+            sock.connect(str(SOCKET_PATH))
+        except socket.timeout as e:
+            # No es el plazo de --timeout: el daemon no acepta conexiones y se recurre al proceso local
+            raise ConnectionError("El daemon no acepta conexiones") from e
+        sock.settimeout(timeout)
+        stream = sock.makefile("rwb")
+        send_message(stream, message)
+        response = read_message(stream)
+        # En streaming, el daemon envía cada token antes de la respuesta final
+        while "token" in response:
+            on_token(*response["token"])
+            response = read_message(stream)
+        return response
+
+
+def _raise_remote_error(response: dict):
+    error_class = getattr(exceptions, response.get("type", ""), None)
+    if not (isinstance(error_class, type) and issubclass(error_class, exceptions.GclitException)):
+        error_class = exceptions.GclitException
+    # Se evita el __init__ propio de cada excepción: solo viaja el mensaje
+    error = error_class.__new__(error_class)
+    Exception.__init__(error, response["error"])
+    raise error
+
+
+def _ping() -> Optional[dict]:
+    if os.environ.get("GCLIT_NO_DAEMON") or not SOCKET_PATH.exists():
+        return None
+    try:
+        response = _request({"command": "ping"}, timeout=PING_TIMEOUT)
+    except (OSError, ValueError):
+        return None
+    return response if response.get("ok") else None
+
+
+def is_daemon_available() -> bool:
+    return _ping() is not None
+
+
+def _same_environment(daemon_environment: Optional[str]) -> bool:
+    """GIT_*, GCLIT_* y el .env del cwd cambian el resultado: deben coincidir con los del daemon"""
+    return daemon_environment == environment_fingerprint(os.environ, dotenv_overrides(Path.cwd()))
+
+
+def shutdown_daemon() -> bool:
+    try:
+        return _request({"command": "shutdown"}).get("ok", False)
+    except OSError:
+        return False
+
+
+class RemoteUseCase:
+    """
+    Proxy de un caso de uso que se ejecuta en el daemon.
+
+    Si el daemon deja de responder, la llamada se repite en el proceso
+    actual con el caso de uso que construye `fallback`. Los métodos de
+    `local_methods` (p. ej. crear el commit, que lanza hooks y firma con
+    GPG) se ejecutan siempre en el proceso actual.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fallback: Callable[[], object],
+        options: Optional[dict] = None,
+        local_methods: Optional[Dict[str, Callable]] = None
+    ):
+        self.name = name
+        # Opciones de la ejecución (p. ej. modo de caché) que el daemon aplica por petición
+        self.options = options or {}
+        # El daemon conserva la instancia del caso de uso entre llamadas de la misma sesión
+        self.session = uuid.uuid4().hex
+        self._fallback = fallback
+        self._local_methods = local_methods or {}
+        self._local = None
+        self.timings = {}
+        self.diagnostics = {}
+
+    def __getattr__(self, method: str):
+        def call(**kwargs):
+            if self._local is not None:
+                return self._call_local(method, kwargs)
+            if method in self._local_methods:
+                return self._local_methods[method](**kwargs)
+            # El callback no viaja por el socket: se piden los tokens como mensajes
+            on_token = kwargs.get("on_token")
+            # El daemon aplica el plazo restante de --timeout a su propia ejecución
+            left = remaining(operation="gclit daemon")
+            try:
+                response = _request({
+                    "use_case": self.name,
+                    "method": method,
+                    "kwargs": {key: value for key, value in kwargs.items() if key != "on_token"},
+                    "options": self.options,
+                    "stream": on_token is not None,
+                    "session": self.session,
+                    "cwd": os.getcwd(),
+                    "timeout": max(left - DEADLINE_MARGIN, 0.001) if left is not None else None,
+                    "timeout_total": total(),
+                }, on_token=on_token, timeout=left)
+            except socket.timeout:
+                raise exceeded("gclit daemon") from None
+            except OSError:
+                self._local = self._fallback()
+                return self._call_local(method, kwargs)
+
+            if not response.get("ok"):
+                _raise_remote_error(response)
+            self.timings = response.get("timings", {})
+            self.diagnostics = response.get("diagnostics", {})
+            return response["result"]
+
+        return call
+
+    def _call_local(self, method: str, kwargs: dict):
+        try:
+            return getattr(self._local, method)(**kwargs)
+        finally:
+            self.timings = getattr(self._local, "timings", {})
+            self.diagnostics = getattr(self._local, "diagnostics", {})
+
+
+def get_remote_use_case(
+    name: str,
+    fallback: Callable[[], object],
+    options: Optional[dict] = None,
+    local_methods: Optional[Dict[str, Callable]] = None
+) -> Optional[RemoteUseCase]:
+    """Devuelve un proxy al daemon si está en marcha y comparte el entorno del cliente, o None"""
+    daemon = _ping()
+    if daemon is None or not _same_environment(daemon.get("environment")):
+        return None
+    return RemoteUseCase(name, fallback, options, local_methods)
@@ -0,0 +1,52 @@
+# gclit/daemon/protocol.py
+"""
+Protocolo del daemon: un mensaje JSON por línea sobre un socket Unix.
+
+Se mantiene libre de dependencias pesadas para que el cliente no penalice
+el arranque de la CLI.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Mapping
+
+SOCKET_PATH = Path(os.environ.get("GCLIT_DAEMON_SOCKET", Path.home() / ".gclit" / "gclitd.sock"))
+
+# Variables que cambian lo que lee git (GIT_DIR, GIT_INDEX_FILE...) o la configuración de gclit
+ENVIRONMENT_PREFIXES = ("GIT_", "GCLIT_")
+# Controlan el propio daemon, no el resultado de las peticiones
+DAEMON_VARIABLES = {"GCLIT_DAEMON_SOCKET", "GCLIT_NO_DAEMON"}
+
+
+def dotenv_overrides(directory: Path) -> List[str]:
+    """Líneas GCLIT_* del `.env` de `directory`, que la configuración lee desde el cwd"""
+    try:
+        lines = (directory / ".env").read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    return sorted(line.strip() for line in lines if line.strip().upper().startswith("GCLIT_"))
+
+
+def environment_fingerprint(environ: Mapping[str, str], dotenv: List[str]) -> str:
+    """
+    Huella del entorno que afecta a una petición. El daemon solo atiende a
+    clientes con la misma huella que él: el resto se ejecutan en local.
+    """
+    variables = sorted(
+        f"{name}={value}" for name, value in environ.items()
+        if name.upper().startswith(ENVIRONMENT_PREFIXES) and name.upper() not in DAEMON_VARIABLES
+    )
+    return hashlib.sha256("\0".join(variables + ["--"] + dotenv).encode("utf-8")).hexdigest()
+
+
+def send_message(stream, message: dict) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_message(stream) -> dict:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("El daemon cerró la conexión")
+    return json.loads(line)
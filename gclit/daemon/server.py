@@ -0,0 +1,159 @@
+# gclit/daemon/server.py
+"""
+Daemon opcional que mantiene en memoria la configuración, los clientes de
+los proveedores LLM y los adaptadores Git por repositorio.
+
+Las peticiones se atienden de una en una: cada una cambia al directorio de
+trabajo del cliente antes de ejecutar el caso de uso. El daemon solo lee
+(git, APIs, LLM); crear el commit se hace en el proceso del cliente, con
+su terminal y su entorno. Los clientes cuyo entorno difiere del suyo (ver
+`environment_fingerprint`) no usan el daemon.
+"""
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from gclit.config.settings import CONFIG_PATH, reset_settings
+from gclit.container import container
+from gclit.daemon.protocol import SOCKET_PATH, environment_fingerprint, read_message, send_message
+from gclit.domain.deadline import deadline
+from gclit.domain.exceptions.exception import GclitException
+from gclit.infrastructure.cache.disk_cache import set_cache_mode
+from gclit.infrastructure.git.repo_metadata import config_path, find_git_dir
+
+
+# Casos de uso que se conservan entre peticiones de un mismo cliente
+MAX_SESSIONS = 16
+
+
+def _git_config_mtime(cwd: str) -> float:
+    git_dir = find_git_dir(Path(cwd))
+    if git_dir is None:
+        return 0.0
+    git_config = config_path(git_dir)
+    return git_config.stat().st_mtime if git_config.exists() else 0.0
+
+
+class DaemonState:
+    def __init__(self):
+        # La configuración sale de este entorno; un .env en el cwd del cliente lo descarta
+        self.environment = environment_fingerprint(os.environ, [])
+        self._config_mtime = self._current_config_mtime()
+        self._git_providers = {}
+        # (sesión, caso de uso) -> instancia, para que p. ej. "regenerar" reutilice el contexto
+        self._sessions = OrderedDict()
+
+    @staticmethod
+    def _current_config_mtime() -> float:
+        return CONFIG_PATH.stat().st_mtime if CONFIG_PATH.exists() else 0.0
+
+    def _refresh_settings(self):
+        mtime = self._current_config_mtime()
+        if mtime != self._config_mtime:
+            self._config_mtime = mtime
+            reset_settings()
+            container.reset()
+            self._git_providers.clear()
+            self._sessions.clear()
+
+    def _git_provider(self, cwd: str):
+        key = (cwd, _git_config_mtime(cwd))
+        if key not in self._git_providers:
+            self._git_providers[key] = container.get_git_provier()
+        return self._git_providers[key]
+
+    def _use_case(self, message: dict):
+        key = (message.get("session"), message["use_case"])
+        if key[0] is not None and key in self._sessions:
+            self._sessions.move_to_end(key)
+            return self._sessions[key]
+
+        use_case = container.get_use_case(message["use_case"], git_provider=self._git_provider(message["cwd"]))
+        if key[0] is not None:
+            self._sessions[key] = use_case
+            while len(self._sessions) > MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        return use_case
+
+    def handle(self, message: dict, on_token=None) -> dict:
+        self._refresh_settings()
+        os.chdir(message["cwd"])
+        set_cache_mode(message.get("options", {}).get("cache_mode", "use"))
+
+        use_case = self._use_case(message)
+        method = getattr(use_case, message["method"])
+        kwargs = message.get("kwargs", {})
+        if message.get("stream") and on_token is not None:
+            kwargs["on_token"] = on_token
+        with deadline(message.get("timeout"), total=message.get("timeout_total")):
+            result = method(**kwargs)
+        return {
+            "ok": True,
+            "result": result,
+            "timings": getattr(use_case, "timings", {}),
+            "diagnostics": getattr(use_case, "diagnostics", {}),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        message = read_message(self.rfile)
+        command = message.get("command")
+
+        if command == "ping":
+            send_message(self.wfile, {"ok": True, "pid": os.getpid(), "environment": self.server.state.environment})
+            return
+        if command == "shutdown":
+            send_message(self.wfile, {"ok": True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        # Los tokens llegan desde el hilo del LLM: las escrituras se serializan
+        lock = threading.Lock()
+
+        def send(response: dict):
+            with lock:
+                send_message(self.wfile, response)
+
+        try:
+            response = self.server.state.handle(message, on_token=lambda field, text: send({"token": [field, text]}))
+        except GclitException as e:
+            response = {"ok": False, "error": str(e), "type": type(e).__name__}
+        except Exception as e:
+            response = {"ok": False, "error": str(e), "type": "GclitException"}
+        send(response)
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            socket_path.unlink()
+
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+        self.socket_path = socket_path
+        self.state = DaemonState()
+
+    def server_close(self):
+        super().server_close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+
+def serve():
+    server = DaemonServer()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,135 @@
+# gclit/domain/deadline.py
+"""
+Plazo máximo de un comando (`--timeout`).
+
+La CLI fija el plazo una vez y cada llamada de E/S (git, HTTP, LLM) consulta
+el tiempo restante para acotar su propia espera. Vive en una ContextVar: los
+hilos y tareas que lanza el comando lo heredan si se crean con
+`bind_context`. La fase en curso (ver PhaseTimer) se anota para indicar en
+el error dónde se agotó.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from gclit.domain.exceptions.exception import DeadlineExceededException
+
+T = TypeVar("T")
+
+
+class Deadline:
+    def __init__(self, seconds: float, total: Optional[float] = None):
+        # Plazo pedido por el usuario, para el mensaje (puede ser mayor si se heredó ya empezado)
+        self.seconds = total or seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("gclit_deadline", default=None)
+_phase: ContextVar[Optional[str]] = ContextVar("gclit_phase", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float], total: Optional[float] = None):
+    """
+    Fija un plazo de `seconds` para el bloque (None o 0 = sin plazo). `total`
+    es el plazo original cuando este es lo que queda de otro (p. ej. en el daemon).
+    """
+    if not seconds:
+        yield
+        return
+    token = _deadline.set(Deadline(seconds, total))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def paused():
+    """El tiempo dentro del bloque (p. ej. esperando al usuario) no cuenta para el plazo"""
+    current = _deadline.get()
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        if current is not None:
+            current.expires_at += time.monotonic() - start
+
+
+@contextmanager
+def phase(name: str):
+    """Anota la fase en curso para el mensaje de error"""
+    token = _phase.set(name)
+    try:
+        yield
+    finally:
+        _phase.reset(token)
+
+
+def remaining(default: Optional[float] = None, operation: Optional[str] = None) -> Optional[float]:
+    """
+    Segundos para la próxima espera: lo que queda del plazo, como mucho
+    `default` (el timeout propio de la llamada). Sin plazo devuelve `default`;
+    con el plazo agotado lanza DeadlineExceededException.
+    """
+    current = _deadline.get()
+    if current is None:
+        return default
+    left = current.remaining()
+    if left <= 0:
+        raise exceeded(operation)
+    return left if default is None else min(default, left)
+
+
+def total() -> Optional[float]:
+    """Plazo fijado por el usuario, o None sin plazo"""
+    current = _deadline.get()
+    return current.seconds if current is not None else None
+
+
+def check() -> None:
+    """Lanza DeadlineExceededException si el plazo ya se agotó (se atribuye a la fase en curso)"""
+    remaining()
+
+
+def expired() -> bool:
+    current = _deadline.get()
+    return current is not None and current.remaining() <= 0
+
+
+def exceeded(operation: Optional[str] = None) -> DeadlineExceededException:
+    current = _deadline.get()
+    return DeadlineExceededException(current.seconds if current else 0, _phase.get(), operation)
+
+
+def bind_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    `func` con el plazo y la fase actuales, para ejecutarla en otro hilo
+    (ThreadPoolExecutor no propaga las ContextVar). Cada llamada usa su
+    propia copia, así que puede invocarse desde varios hilos a la vez.
+    """
+    context = copy_context()
+    return lambda *args, **kwargs: context.copy().run(func, *args, **kwargs)
+
+
+async def within_deadline(awaitable: Awaitable[T], operation: Optional[str] = None) -> T:
+    """Espera `awaitable` como mucho lo que queda del plazo; al agotarse se cancela"""
+    # Importación diferida: asyncio no debe pesar en el arranque de la CLI
+    import asyncio
+
+    try:
+        timeout = remaining(operation=operation)
+    except DeadlineExceededException:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        if not expired():
+            raise
+        raise exceeded(operation) from None
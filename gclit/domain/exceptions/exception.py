@@ -1,4 +1,6 @@
 # gclit/exceptions.py
+from typing import Optional
+
 
 class GclitException(Exception):
     """Excepción base para todas las excepciones personalizadas de gclit"""
@@ -18,3 +20,36 @@ class LLMProviderException(GclitException):
 class ConfigException(GclitException):
     """Errores de configuración de gclit"""
     pass
+
+
+class ExistingPullRequestException(GitProviderException):
+    """Ya existe un Pull Request abierto entre las mismas ramas"""
+
+    def __init__(self, from_branch: str, to_branch: str, pr_number: int):
+        self.pr_number = pr_number
+        super().__init__(
+            f"Ya existe un Pull Request abierto de `{from_branch}` hacia `{to_branch}` (PR #{pr_number}).\n"
+            f"Puedes usar `gclit pr --pr {pr_number}` para actualizarlo."
+        )
+
+
+class RateLimitException(GitProviderException):
+    """La API del proveedor rechazó la petición por límite de peticiones"""
+
+    def __init__(self, service: str, wait_seconds: float):
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"Límite de peticiones de {service} alcanzado: vuelve a intentarlo en {int(wait_seconds) + 1} s."
+        )
+
+
+class DeadlineExceededException(GclitException):
+    """Se agotó el plazo fijado con --timeout"""
+
+    def __init__(self, seconds: float, phase: Optional[str] = None, operation: Optional[str] = None):
+        self.seconds = seconds
+        self.phase = phase
+        self.operation = operation
+        where = f" durante la fase `{phase}`" if phase else ""
+        detail = f" ({operation})" if operation else ""
+        super().__init__(f"Se agotó el plazo de {round(seconds, 1):g} s{where}{detail}.")
@@ -1,11 +1,19 @@
 # domain/models/commit_message.py
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from gclit.domain.models.common import Lang
+from gclit.domain.models.diff import ParsedDiff
 
 
 class CommitContext(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     diff: str
     branch_name: str
     lang: Lang = "en"
     commit_history: Optional[str] = None
+    parsed_diff: Optional[ParsedDiff] = None
+
+    def diff_text(self) -> str:
+        """Diff a incluir en el prompt, renderizado desde la estructura si existe"""
+        return self.parsed_diff.render() if self.parsed_diff is not None else self.diff
@@ -0,0 +1,287 @@
+# domain/models/diff.py
+"""
+Representación estructurada de un diff unificado de git.
+
+Los ficheros y hunks no copian el texto: guardan desplazamientos sobre el
+diff original, de modo que filtrar o reordenar ficheros y volver a
+renderizar no requiere re-escanear ni duplicar el contenido.
+"""
+import re
+from typing import Iterable, List, Optional
+
+# Las líneas de nota (resúmenes, avisos de truncado) van tras el último fichero
+NOTE_PREFIX = "# "
+
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class DiffText(str):
+    """
+    Texto de un diff con el modo de renderizado con que se generó (para el
+    modo verbose). Viaja con el diff y no en el adaptador, que puede estar
+    generando varios diffs a la vez (p. ej. `pr generate --pr 12 15`).
+    """
+    mode: Optional[str] = None
+
+    def __new__(cls, text: str, mode: Optional[str]):
+        diff = super().__new__(cls, text)
+        diff.mode = mode
+        return diff
+
+
+def diff_mode(text: str) -> Optional[str]:
+    """Modo de renderizado de un diff, si el adaptador lo indicó"""
+    return getattr(text, "mode", None)
+
+
+class Hunk:
+    __slots__ = ("old_start", "old_lines", "new_start", "new_lines", "start", "end")
+
+    def __init__(self, old_start: int, old_lines: int, new_start: int, new_lines: int, start: int):
+        self.old_start = old_start
+        self.old_lines = old_lines
+        self.new_start = new_start
+        self.new_lines = new_lines
+        self.start = start
+        self.end = start
+
+    def __repr__(self) -> str:
+        return f"Hunk(-{self.old_start},{self.old_lines} +{self.new_start},{self.new_lines})"
+
+
+class FileDiff:
+    __slots__ = (
+        "old_path", "new_path", "start", "end", "hunks", "additions", "deletions",
+        "is_binary", "is_new", "is_deleted", "is_rename", "is_copy", "similarity",
+        "old_mode", "new_mode", "changed_chars",
+    )
+
+    def __init__(self, old_path: str, new_path: str, start: int):
+        self.old_path = old_path
+        self.new_path = new_path
+        self.start = start
+        self.end = start
+        self.hunks: List[Hunk] = []
+        self.additions = 0
+        self.deletions = 0
+        # Caracteres de las líneas +/- (sin el marcador): la cabecera y el
+        # contexto no cuentan para decidir si un fichero está minificado
+        self.changed_chars = 0
+        self.is_binary = False
+        self.is_new = False
+        self.is_deleted = False
+        self.is_rename = False
+        self.is_copy = False
+        self.similarity: Optional[int] = None
+        self.old_mode: Optional[str] = None
+        self.new_mode: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return self.old_path if self.is_deleted else self.new_path
+
+    @property
+    def is_mode_change(self) -> bool:
+        return self.old_mode is not None and self.new_mode is not None and self.old_mode != self.new_mode
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    @property
+    def average_line_length(self) -> float:
+        changed = self.additions + self.deletions
+        return self.changed_chars / changed if changed else 0.0
+
+    def stat_line(self) -> str:
+        """Resumen de una línea: ruta, tipo de cambio y líneas añadidas/eliminadas"""
+        if self.is_rename:
+            path = f"{self.old_path} → {self.new_path}"
+        else:
+            path = self.path
+        flags = [
+            flag for flag, enabled in (
+                ("new", self.is_new), ("deleted", self.is_deleted), ("renamed", self.is_rename),
+                ("copied", self.is_copy), ("binary", self.is_binary), ("mode", self.is_mode_change),
+            ) if enabled
+        ]
+        suffix = f" [{', '.join(flags)}]" if flags else ""
+        return f"{path} (+{self.additions} -{self.deletions}){suffix}"
+
+    def __repr__(self) -> str:
+        return f"FileDiff({self.stat_line()!r})"
+
+
+def _clean_path(path: str, prefixed: bool = True) -> str:
+    # git añade un tabulador tras rutas con espacios y entrecomilla las no ASCII
+    path = path.rstrip("\t")
+    if len(path) > 1 and path[0] == path[-1] == '"':
+        path = path[1:-1]
+    if prefixed and path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def _split_header_paths(rest: str):
+    """
+    Extrae las rutas de `diff --git a/x b/y` (o `x y` con --no-prefix),
+    incluso con espacios en el nombre. Indica además si llevan prefijo.
+    """
+    prefixed = rest.startswith("a/") and " b/" in rest
+    middle = (len(rest) - 1) // 2
+    old, new = rest[:middle], rest[middle + 1:]
+    if rest[middle:middle + 1] == " " and _clean_path(old, prefixed) == _clean_path(new, prefixed):
+        path = _clean_path(old, prefixed)
+        return path, path, prefixed
+    if prefixed:
+        old, new = rest.rsplit(" b/", 1)
+        return _clean_path(old), new, prefixed
+    old, _, new = rest.partition(" ")
+    return old, new, prefixed
+
+
+class ParsedDiff:
+    __slots__ = ("text", "files", "notes")
+
+    def __init__(self, text: str, files: List[FileDiff], notes: Optional[List[str]] = None):
+        self.text = text
+        self.files = files
+        # Líneas añadidas al renderizar (p. ej. resúmenes de ficheros omitidos)
+        self.notes = notes or []
+
+    @classmethod
+    def parse(cls, text: str) -> "ParsedDiff":
+        """Construye la estructura en una sola pasada sobre la salida de `git diff`"""
+        files: List[FileDiff] = []
+        notes: List[str] = []
+        notes_start: Optional[int] = None
+        current: Optional[FileDiff] = None
+        hunk: Optional[Hunk] = None
+        prefixed = True
+        pos = 0
+        length = len(text)
+
+        while pos < length:
+            end = text.find("\n", pos)
+            end = length if end == -1 else end + 1
+            line = text[pos:end].rstrip("\n")
+
+            if line.startswith("diff --git ") or line.startswith("diff --cc "):
+                if current is not None:
+                    current.end = pos
+                    if hunk is not None:
+                        hunk.end = pos
+                old_path, new_path, prefixed = _split_header_paths(line.split(" ", 2)[2])
+                current = FileDiff(old_path, new_path, pos)
+                hunk = None
+                files.append(current)
+
+            elif line.startswith(NOTE_PREFIX):
+                if notes_start is None:
+                    notes_start = pos
+                notes.append(line)
+
+            elif current is None:
+                pass
+
+            elif hunk is not None and line[:1] in ("+", "-", " ", "\\"):
+                if line[:1] == "+":
+                    current.additions += 1
+                    current.changed_chars += len(line) - 1
+                elif line[:1] == "-":
+                    current.deletions += 1
+                    current.changed_chars += len(line) - 1
+
+            elif line.startswith("@@"):
+                match = _HUNK_RE.match(line)
+                if match:
+                    if hunk is not None:
+                        hunk.end = pos
+                    old_start, old_lines, new_start, new_lines = match.groups()
+                    hunk = Hunk(
+                        int(old_start), int(old_lines or 1),
+                        int(new_start), int(new_lines or 1),
+                        pos,
+                    )
+                    current.hunks.append(hunk)
+
+            elif line.startswith("--- "):
+                path = line[4:]
+                if path != "/dev/null":
+                    current.old_path = _clean_path(path, prefixed)
+            elif line.startswith("+++ "):
+                path = line[4:]
+                if path != "/dev/null":
+                    current.new_path = _clean_path(path, prefixed)
+            elif line.startswith("new file mode "):
+                current.is_new = True
+                current.new_mode = line[14:]
+            elif line.startswith("deleted file mode "):
+                current.is_deleted = True
+                current.old_mode = line[18:]
+            elif line.startswith("old mode "):
+                current.old_mode = line[9:]
+            elif line.startswith("new mode "):
+                current.new_mode = line[9:]
+            elif line.startswith("rename from "):
+                current.is_rename = True
+                current.old_path = line[12:]
+            elif line.startswith("rename to "):
+                current.new_path = line[10:]
+            elif line.startswith("copy from "):
+                current.is_copy = True
+                current.old_path = line[10:]
+            elif line.startswith("copy to "):
+                current.new_path = line[8:]
+            elif line.startswith("similarity index "):
+                current.similarity = int(line[17:].rstrip("%") or 0)
+            elif line.startswith("Binary files ") or line == "GIT binary patch":
+                current.is_binary = True
+
+            pos = end
+
+        end = length if notes_start is None else notes_start
+        if current is not None:
+            current.end = end
+            if hunk is not None:
+                hunk.end = end
+
+        return cls(text, files, notes)
+
+    @property
+    def additions(self) -> int:
+        return sum(f.additions for f in self.files)
+
+    @property
+    def deletions(self) -> int:
+        return sum(f.deletions for f in self.files)
+
+    def select(self, files: Iterable[FileDiff], notes: Optional[List[str]] = None) -> "ParsedDiff":
+        """Nueva vista sobre el mismo texto con un subconjunto de ficheros"""
+        return ParsedDiff(self.text, list(files), self.notes + (notes or []))
+
+    def without_noise(self, max_line_length: int = 300) -> "ParsedDiff":
+        """
+        Sustituye por su resumen de una línea los ficheros binarios y los que
+        parecen minificados (líneas cambiadas de longitud media excesiva)
+        """
+        kept, notes = [], []
+        for file in self.files:
+            if file.is_binary:
+                notes.append(f"{NOTE_PREFIX}omitted (binary): {file.stat_line()}")
+            elif file.average_line_length > max_line_length:
+                notes.append(f"{NOTE_PREFIX}omitted (minified): {file.stat_line()}")
+            else:
+                kept.append(file)
+        if not notes:
+            return self
+        return self.select(kept, notes)
+
+    def render(self) -> str:
+        parts = [self.text[f.start:f.end] for f in self.files]
+        if self.notes:
+            parts.append("\n".join(self.notes) + "\n")
+        return "".join(parts)
+
+    def __len__(self) -> int:
+        return len(self.files)
@@ -1,18 +1,47 @@
 # domain/models/pull_request.py
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
 
 from gclit.domain.models.common import Lang
+from gclit.domain.models.diff import ParsedDiff
+
+# Marca invisible al final de las descripciones escritas por gclit
+GCLIT_MARKER = "<!-- gclit -->"
+
+
+def mark_generated(body: str) -> str:
+    return body if is_generated(body) else f"{body.rstrip()}\n\n{GCLIT_MARKER}"
+
+
+def is_generated(body: Optional[str]) -> bool:
+    return bool(body) and GCLIT_MARKER in body
 
 
 class PullRequestContext(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     diff: str
     from_branch: str
     to_branch: str
     lang: Lang = "en"
     commit_history: Optional[str] = None
+    parsed_diff: Optional[ParsedDiff] = None
+    # Resúmenes por bloques cuando el diff no cabe en la ventana del modelo
+    change_summaries: Optional[List[str]] = None
+
+    def diff_text(self) -> str:
+        """Diff a incluir en el prompt, renderizado desde la estructura si existe"""
+        if self.change_summaries:
+            return "\n\n".join(self.change_summaries)
+        return self.parsed_diff.render() if self.parsed_diff is not None else self.diff
+
 
 class PullRequestInfo(BaseModel):
     pr_number: int
     from_branch: str
     to_branch: str
+    title: Optional[str] = None
+    author: Optional[str] = None
+    url: Optional[str] = None
+    # La descripción actual la escribió gclit (lleva GCLIT_MARKER)
+    generated: bool = False
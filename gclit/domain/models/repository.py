@@ -0,0 +1,24 @@
+# domain/models/repository.py
+from typing import Optional
+from pydantic import BaseModel
+
+
+class RepositoryInfo(BaseModel):
+    git_dir: str
+    remote: str
+    remote_url: str
+    provider: str
+    # GitHub: owner/repo | Azure DevOps: organization/project/repo
+    owner: Optional[str] = None
+    organization: Optional[str] = None
+    project: Optional[str] = None
+    repo: str
+    default_branch: Optional[str] = None
+    # mtime de .git/config con el que se resolvió (invalida la caché)
+    config_mtime: float = 0.0
+
+    @property
+    def full_name(self) -> str:
+        if self.provider == "github":
+            return f"{self.owner}/{self.repo}"
+        return f"{self.organization}/{self.project}/{self.repo}"
@@ -1,5 +1,6 @@
 # gclit/domain/ports/git.py
 from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Tuple
 from gclit.domain.models.pull_request import PullRequestInfo
 
 
@@ -24,10 +25,45 @@ class GitProvider(ABC):
     def get_pr_diff_by_number(self, pr_number: int) -> PullRequestInfo:
         pass
 
+    def fetch_pr_diff(self, pr_number: int) -> Optional[str]:
+        """Diff of the PR served by the provider API, for when its branches are not local"""
+        return None
+
+    def list_prs(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        author: Optional[str] = None
+    ) -> Iterator[PullRequestInfo]:
+        """Open pull requests, filtered by the provider; pages are fetched lazily"""
+        return iter(())
+
+    def find_existing_pr(self, from_branch: str, to_branch: str) -> Optional[int]:
+        """Returns the number of an open PR between both branches, if any"""
+        return None
+
+    def get_default_branch(self) -> Optional[str]:
+        """Default branch of the remote repository, if it can be resolved"""
+        return None
+
     @abstractmethod
     def update_pr(self, pr_number: int, title: str, body: str) -> None:
         pass
 
+    def update_prs(self, updates: List[Tuple[int, str, str]]) -> Dict[int, Optional[str]]:
+        """
+        Updates several PRs given (number, title, body).
+        Returns number -> error message (None when the update succeeded).
+        """
+        results = {}
+        for pr_number, title, body in updates:
+            try:
+                self.update_pr(pr_number, title=title, body=body)
+                results[pr_number] = None
+            except Exception as e:
+                results[pr_number] = str(e)
+        return results
+
     @abstractmethod
     def create_pr(self, from_branch: str, to_branch: str, title: str, body: str) -> str:
         """Returns PR URL or ID"""
@@ -1,9 +1,54 @@
 # domain/services/llm.py
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional
 from gclit.domain.models.commit_message import CommitContext
 from gclit.domain.models.pull_request import PullRequestContext 
 
+# Recibe (campo, texto) según se genera: "message" para commits; "title"
+# (completo, de una vez) y "body" (fragmentos) para PRs
+TokenCallback = Callable[[str, str], None]
+
+
+class ServedText(str):
+    """
+    Texto generado con los datos de la respuesta que lo produjo: qué
+    proveedor lo dio (en los compuestos, p. ej. hedged, o "cache") y los
+    tokens consumidos. Viaja con la respuesta y no en el proveedor, que
+    puede estar atendiendo varias peticiones a la vez.
+    """
+    served_by: Optional[str] = None
+    usage: Optional[dict] = None
+
+    def __new__(cls, text: str, served_by: Optional[str] = None, usage: Optional[dict] = None):
+        served = super().__new__(cls, text)
+        served.served_by = served_by
+        served.usage = usage
+        return served
+
+
+def served_by(result: Any) -> Optional[str]:
+    """Proveedor que dio `result`: un texto, una lista de propuestas o la documentación de un PR"""
+    if isinstance(result, dict):
+        return result.get("provider")
+    if isinstance(result, list):
+        return served_by(result[0]) if result else None
+    return getattr(result, "served_by", None)
+
+
+def usage_of(result: Any) -> Optional[dict]:
+    """Tokens consumidos por la petición que dio `result` (las propuestas comparten petición)"""
+    if isinstance(result, dict):
+        return result.get("usage")
+    if isinstance(result, list):
+        return usage_of(result[0]) if result else None
+    return getattr(result, "usage", None)
+
+
 class LLMProvider(ABC):
+    # Modelo que atiende las peticiones (determina la ventana de contexto)
+    model: str = ""
+
     @abstractmethod
     def generate_commit_message(self, context: CommitContext) -> str:
         pass
@@ -11,4 +56,59 @@ class LLMProvider(ABC):
     @abstractmethod
     def generate_pr_documentation(self, context: PullRequestContext) -> dict:
         """Returns dict with 'title' and 'body' keys"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def summarize_changes(self, context: PullRequestContext) -> str:
+        """Summarises one chunk of a PR (a partial diff or earlier summaries)"""
+        pass
+
+    def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        """`n` propuestas distintas para el mismo contexto. Sin soporte del proveedor, una llamada por propuesta"""
+        return list(dict.fromkeys(self.generate_commit_message(context) for _ in range(n)))
+
+    def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        """Como generate_commit_message, avisando de cada fragmento. Sin streaming llega todo de una vez"""
+        message = self.generate_commit_message(context)
+        on_token("message", message)
+        return message
+
+    def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        """Como generate_pr_documentation, avisando del título y de cada fragmento de la descripción"""
+        result = self.generate_pr_documentation(context)
+        on_token("title", result["title"])
+        on_token("body", result["body"])
+        return result
+
+
+class AsyncLLMProvider(ABC):
+    """Variante asíncrona de LLMProvider, con las mismas operaciones"""
+    model: str = ""
+
+    @abstractmethod
+    async def generate_commit_message(self, context: CommitContext) -> str:
+        pass
+
+    @abstractmethod
+    async def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        """Returns dict with 'title' and 'body' keys"""
+        pass
+
+    @abstractmethod
+    async def summarize_changes(self, context: PullRequestContext) -> str:
+        pass
+
+    async def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        messages = await asyncio.gather(*(self.generate_commit_message(context) for _ in range(n)))
+        return list(dict.fromkeys(messages))
+
+    async def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        message = await self.generate_commit_message(context)
+        on_token("message", message)
+        return message
+
+    async def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        result = await self.generate_pr_documentation(context)
+        on_token("title", result["title"])
+        on_token("body", result["body"])
+        return result
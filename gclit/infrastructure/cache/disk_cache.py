@@ -0,0 +1,114 @@
+# gclit/infrastructure/cache/disk_cache.py
+"""
+Caché clave-valor en disco compartida por los distintos subsistemas.
+
+Cada entrada es un fichero JSON cuyo nombre es el hash de la clave. Las
+escrituras son atómicas (fichero temporal + os.replace), de modo que varios
+procesos de gclit pueden usar la misma caché a la vez. El mtime de cada
+fichero hace de marca LRU: se actualiza en cada lectura y, al superar
+`max_bytes`, se eliminan primero las entradas usadas hace más tiempo.
+
+El modo de caché es global al proceso (`--no-cache` y `--refresh` lo cambian
+para la ejecución en curso): "use" lee y escribe, "refresh" no lee pero
+guarda los resultados nuevos y "off" ignora la caché por completo.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+CacheMode = Literal["use", "refresh", "off"]
+
+_mode: CacheMode = "use"
+
+
+def set_cache_mode(mode: CacheMode) -> None:
+    global _mode
+    _mode = mode
+
+
+def get_cache_mode() -> CacheMode:
+    return _mode
+
+
+class DiskCache:
+    def __init__(self, directory: Path, max_bytes: int = 0, ttl: int = 0):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        if _mode != "use":
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl and time.time() - entry.get("created", 0) > self.ttl:
+            self.delete(key)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        if _mode == "off":
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        if self.max_bytes:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Elimina las entradas menos usadas hasta quedar por debajo de `max_bytes`"""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,42 @@
+# gclit/infrastructure/event_loop.py
+"""
+Bucle de eventos compartido por los adaptadores síncronos.
+
+Los comandos son síncronos, pero las llamadas asíncronas de todo el proceso
+(también las de los hilos de batch y map-reduce) se ejecutan en un único
+bucle que vive en un hilo daemon. Así los clientes asíncronos (p. ej.
+AsyncOpenAI) siempre se usan desde el mismo bucle y comparten conexiones.
+"""
+import asyncio
+import threading
+from contextvars import copy_context
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="gclit-event-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Ejecuta `coroutine` en el bucle compartido y espera su resultado desde el
+    hilo actual. La tarea hereda las ContextVar del hilo (p. ej. el plazo de --timeout).
+    """
+    context = copy_context()
+
+    async def in_context() -> T:
+        for var, value in context.items():
+            var.set(value)
+        return await coroutine
+
+    return asyncio.run_coroutine_threadsafe(in_context(), get_event_loop()).result()
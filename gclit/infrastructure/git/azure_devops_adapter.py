@@ -1,17 +1,40 @@
 # gclit/infrastructure/git/azure_devops_adapter.py
 
+import re
 import requests
-from gclit.domain.models.pull_request import PullRequestInfo
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+from gclit.config.settings import HttpSettings
+from gclit.domain.deadline import bind_context
+from gclit.domain.exceptions.exception import GitProviderException
+from gclit.domain.models.diff import NOTE_PREFIX
+from gclit.domain.models.pull_request import PullRequestInfo, is_generated
+from gclit.infrastructure.cache.disk_cache import DiskCache
 from gclit.infrastructure.git.base_git_adapter import BaseGitAdapter
+from gclit.infrastructure.git.remote_diff import PathFilter, bounded_map, unified_file_diff
+from gclit.infrastructure.http.transport import HttpTransport
+
+_GUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
 
 
 class AzureDevOpsAdapter(BaseGitAdapter):
-    def __init__(self, token: str, organization: str, project: str, repo: str):
+    def __init__(
+        self,
+        token: str,
+        organization: str,
+        project: str,
+        repo: str,
+        http_settings: Optional[HttpSettings] = None,
+        http_cache: Optional[DiskCache] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
         self.token = token
         self.organization = organization
         self.project = project
         self.repo = repo
         self.api_url = f"https://dev.azure.com/{organization}/{project}/_apis/git/repositories/{repo}"
+        self.http = HttpTransport("Azure DevOps", self._headers(), http_settings, cache=http_cache)
 
     def _headers(self):
         return {
@@ -24,10 +47,7 @@ class AzureDevOpsAdapter(BaseGitAdapter):
         return base64.b64encode(f":{self.token}".encode()).decode()
 
     def get_pr_diff_by_number(self, pr_number: int) -> PullRequestInfo:
-        res = requests.get(
-            f"{self.api_url}/pullrequests/{pr_number}?api-version=7.1-preview.1",
-            headers=self._headers()
-        )
+        res = self.http.get(f"{self.api_url}/pullrequests/{pr_number}?api-version=7.1-preview.1")
         res.raise_for_status()
         data = res.json()
         return PullRequestInfo(
@@ -36,17 +56,171 @@ class AzureDevOpsAdapter(BaseGitAdapter):
             to_branch=data["targetRefName"].replace("refs/heads/", "")
         )
 
+    def _fetch_default_branch(self) -> Optional[str]:
+        try:
+            res = self.http.get(f"{self.api_url}?api-version=7.1-preview.1")
+            res.raise_for_status()
+        except requests.RequestException as e:
+            raise GitProviderException(f"Al obtener la rama por defecto: {e}") from e
+        default_branch = res.json().get("defaultBranch")
+        return default_branch.replace("refs/heads/", "") if default_branch else None
+
+    def list_prs(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        author: Optional[str] = None
+    ) -> Iterator[PullRequestInfo]:
+        """
+        PRs activos página a página: con el token de continuación si la API
+        lo devuelve y, si no, con $skip. El autor se filtra en el servidor
+        cuando es un id (GUID); si es un nombre, sobre cada página.
+        """
+        params = {"searchCriteria.status": "active", "$top": 100, "$skip": 0}
+        if base:
+            params["searchCriteria.targetRefName"] = f"refs/heads/{base}"
+        if head:
+            params["searchCriteria.sourceRefName"] = f"refs/heads/{head}"
+        author_id = author if author and _GUID_RE.match(author) else None
+        if author_id:
+            params["searchCriteria.creatorId"] = author_id
+
+        while True:
+            res = self.http.get(f"{self.api_url}/pullrequests?api-version=7.1-preview.1", params=params)
+            res.raise_for_status()
+            page = res.json().get("value", [])
+            for pr in page:
+                created_by = pr.get("createdBy") or {}
+                names = {created_by.get("uniqueName"), created_by.get("displayName")}
+                if author and not author_id and author not in names:
+                    continue
+                yield PullRequestInfo(
+                    pr_number=pr["pullRequestId"],
+                    from_branch=pr["sourceRefName"].replace("refs/heads/", ""),
+                    to_branch=pr["targetRefName"].replace("refs/heads/", ""),
+                    title=pr.get("title"),
+                    author=created_by.get("uniqueName") or created_by.get("displayName"),
+                    url=f"https://dev.azure.com/{self.organization}/{self.project}/_git/{self.repo}/pullrequest/{pr['pullRequestId']}",
+                    generated=is_generated(pr.get("description"))
+                )
+
+            continuation = res.headers.get("x-ms-continuationtoken")
+            if continuation:
+                params["continuationToken"] = continuation
+            elif len(page) < params["$top"]:
+                return
+            else:
+                params["$skip"] += params["$top"]
+
+    def find_existing_pr(self, from_branch: str, to_branch: str) -> Optional[int]:
+        """Verifica si ya hay un PR activo desde from_branch a to_branch"""
+        res = self.http.get(
+            f"{self.api_url}/pullrequests?api-version=7.1-preview.1",
+            params={
+                "searchCriteria.status": "active",
+                "searchCriteria.sourceRefName": f"refs/heads/{from_branch}",
+                "searchCriteria.targetRefName": f"refs/heads/{to_branch}",
+            }
+        )
+        res.raise_for_status()
+        prs = res.json().get("value", [])
+        if prs:
+            return prs[0]["pullRequestId"]
+        return None
+
+    def fetch_pr_diff(self, pr_number: int) -> Optional[str]:
+        """
+        Diff del PR desde la API: Azure DevOps no sirve diffs unificados, así
+        que se descargan las dos versiones de cada fichero de la última
+        iteración (frente al merge-base) y se comparan en local
+        """
+        pr_url = f"{self.api_url}/pullRequests/{pr_number}"
+        res = self.http.get(f"{pr_url}/iterations", params={"api-version": "7.1"})
+        res.raise_for_status()
+        iterations = res.json().get("value", [])
+        if not iterations:
+            return None
+        last = iterations[-1]
+        base_sha = last["commonRefCommit"]["commitId"]
+        head_sha = last["sourceRefCommit"]["commitId"]
+
+        keep = PathFilter(self.diff_settings)
+        changes, notes = [], []
+        for entry in self._iteration_changes(pr_url, last["id"]):
+            item = entry.get("item", {})
+            if item.get("isFolder") or item.get("gitObjectType") == "tree":
+                continue
+            path = item["path"].lstrip("/")
+            if keep(path):
+                changes.append((entry, path))
+            else:
+                notes.append(f"{NOTE_PREFIX}excluded: {path}")
+
+        def file_diff(change) -> bytes:
+            entry, path = change
+            change_type = entry.get("changeType", "edit")
+            old_path = (entry.get("sourceServerItem") or entry.get("originalPath") or path).lstrip("/")
+            status = (
+                "added" if "add" in change_type else
+                "removed" if "delete" in change_type else
+                "renamed" if "rename" in change_type else
+                "modified"
+            )
+            old = b"" if status == "added" else self._item_content(old_path, base_sha)
+            new = b"" if status == "removed" else self._item_content(path, head_sha)
+            return unified_file_diff(old_path, path, status, old, new).encode("utf-8")
+
+        workers = self.http.settings.pool_size
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Las descargas avanzan al ritmo que se consume el diff: al agotar el presupuesto se cancelan
+            downloads = bounded_map(executor, bind_context(file_diff), changes, window=2 * workers)
+            try:
+                return self._read_remote_diff(downloads, notes)
+            finally:
+                downloads.close()
+
+    def _iteration_changes(self, pr_url: str, iteration_id: int):
+        """Cambios de la iteración, paginados con $top / $skip"""
+        skip = 0
+        while True:
+            res = self.http.get(
+                f"{pr_url}/iterations/{iteration_id}/changes",
+                params={"$top": 2000, "$skip": skip, "api-version": "7.1"}
+            )
+            res.raise_for_status()
+            data = res.json()
+            yield from data.get("changeEntries", [])
+            if not data.get("nextSkip"):
+                return
+            skip = data["nextSkip"]
+
+    def _item_content(self, path: str, commit: str) -> bytes:
+        # Sin caché HTTP: el contenido puede ser binario y la caché guarda texto
+        res = self.http.request(
+            "GET",
+            f"{self.api_url}/items",
+            params={
+                "path": path,
+                "versionDescriptor.version": commit,
+                "versionDescriptor.versionType": "commit",
+                "$format": "octetStream",
+                "api-version": "7.1",
+            }
+        )
+        if res.status_code == 404:
+            return b""
+        res.raise_for_status()
+        return res.content
+
     def update_pr(self, pr_number: int, title: str, body: str) -> None:
-        requests.patch(
+        self.http.patch(
             f"{self.api_url}/pullrequests/{pr_number}?api-version=7.1-preview.1",
-            headers=self._headers(),
             json={"title": title, "description": body}
         ).raise_for_status()
 
     def create_pr(self, from_branch: str, to_branch: str, title: str, body: str) -> str:
-        res = requests.post(
+        res = self.http.post(
             f"{self.api_url}/pullrequests?api-version=7.1-preview.1",
-            headers=self._headers(),
             json={
                 "sourceRefName": f"refs/heads/{from_branch}",
                 "targetRefName": f"refs/heads/{to_branch}",
@@ -1,23 +1,255 @@
 # gclit/infrastructure/git/base_git_adapter.py
 import subprocess
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from gclit.config.settings import DiffSettings, GitSettings
+from gclit.domain.exceptions.exception import GclitException, GitProviderException
+from gclit.domain.models.diff import NOTE_PREFIX, DiffText
+from gclit.domain.models.repository import RepositoryInfo
 from gclit.domain.ports.git import GitProvider
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.git import process
+from gclit.infrastructure.git.diff_reader import DiffBuffer, byte_budget, read_chunks, read_diff
+from gclit.infrastructure.git.pathspec import build_pathspec, parse_numstat
+from gclit.infrastructure.git.remote_diff import DiffStreamFilter, PathFilter
+from gclit.infrastructure.git.repo_metadata import RepoMetadataStore
+
+MODE_FLAGS = {
+    "full": [],
+    "compact": ["-U0"],
+    "function": ["--function-context"],
+}
+
+WHITESPACE_FLAGS = ["-w", "--ignore-blank-lines"]
+
+
+def _changed_lines(stats: Dict[str, Tuple[str, str]]) -> int:
+    # Los binarios aparecen como "-" en --numstat
+    return sum(int(added) + int(deleted) for added, deleted in stats.values() if added != "-")
 
 
 class BaseGitAdapter(GitProvider):
+    def __init__(
+        self,
+        diff_settings: Optional[DiffSettings] = None,
+        git_settings: Optional[GitSettings] = None,
+        merge_base_cache: Optional[DiskCache] = None,
+        repository: Optional[RepositoryInfo] = None,
+        metadata_store: Optional[RepoMetadataStore] = None
+    ):
+        self.diff_settings = diff_settings or DiffSettings()
+        self.git_settings = git_settings or GitSettings()
+        # merge-base por (sha origen, sha destino): inmutable, se puede cachear sin caducidad
+        self.merge_base_cache = merge_base_cache
+        # Metadatos cacheados del repo: la rama por defecto se guarda tras resolverla
+        self.repository = repository
+        self.metadata_store = metadata_store
+
+    def get_default_branch(self) -> Optional[str]:
+        """Rama por defecto del remoto: se consulta una vez y queda en la caché del repo"""
+        if self.repository is not None and self.repository.default_branch:
+            return self.repository.default_branch
+        try:
+            branch = self._fetch_default_branch()
+        except (GitProviderException, OSError):
+            # Sin red o sin permisos: se recurre a refs/remotes/<remote>/HEAD
+            branch = None
+        branch = branch or self._local_default_branch()
+        if branch and self.repository is not None:
+            self.repository.default_branch = branch
+            if self.metadata_store is not None:
+                self.metadata_store.save(self.repository)
+        return branch
+
+    def _fetch_default_branch(self) -> Optional[str]:
+        """Consulta la API del proveedor; los adaptadores la sobrescriben"""
+        return None
+
+    def _local_default_branch(self) -> Optional[str]:
+        # refs/remotes/<remote>/HEAD existe tras un `git clone`
+        remote = self.git_settings.remote
+        result = process.run(
+            ["git", "symbolic-ref", "--quiet", "--short", f"refs/remotes/{remote}/HEAD"],
+            capture_output=True, text=True
+        )
+        ref = result.stdout.strip()
+        return ref[len(remote) + 1:] if result.returncode == 0 and ref.startswith(f"{remote}/") else None
+
+    def _read_diff(self, diff_args: List[str]) -> DiffText:
+        """
+        Lee el diff en streaming respetando el presupuesto configurado.
+        En modo auto, los ficheros excluidos por pathspec se resumen en notas
+        de una línea.
+        """
+        pathspec = build_pathspec(self.diff_settings)
+        mode = self.diff_settings.mode
+        # Solo se lanzan las estadísticas que el modo usa: las de los ficheros
+        # incluidos y con -w, si se pueden ignorar espacios (auto y compact);
+        # las de todas las rutas, para las notas de excluidos, solo en auto
+        measure_whitespace = mode in ("auto", "compact")
+        list_excluded = mode == "auto"
+
+        # Las estadísticas se calculan en paralelo; en modo auto deciden el renderizado
+        numstat = ["git", "diff", "--numstat", "-z", "-M", *diff_args, "--"]
+        all_stats = self._spawn(numstat) if list_excluded else None
+        kept_stats = self._spawn([*numstat, *pathspec]) if measure_whitespace else None
+        whitespace_stats = (
+            self._spawn([*numstat[:5], *WHITESPACE_FLAGS, *numstat[5:], *pathspec]) if measure_whitespace else None
+        )
+
+        try:
+            kept = parse_numstat(process.communicate(kept_stats, numstat)[0]) if measure_whitespace else {}
+            whitespace = parse_numstat(process.communicate(whitespace_stats, numstat)[0]) if measure_whitespace else None
+            flags, mode, whitespace_only = self._diff_flags(kept, whitespace)
+
+            cmd = ["git", "diff", *flags, *diff_args, "--", *pathspec]
+            max_bytes = byte_budget(self.diff_settings.max_bytes, self.diff_settings.max_tokens)
+            buffer = read_diff(cmd, max_bytes=max_bytes, spill_bytes=self.diff_settings.spill_bytes)
+            text = buffer.text()
+            all_paths = parse_numstat(process.communicate(all_stats, numstat)[0]) if list_excluded else {}
+        except GclitException:
+            # Plazo agotado: no se dejan procesos git huérfanos
+            for spawned in (all_stats, kept_stats, whitespace_stats):
+                if spawned is not None and spawned.poll() is None:
+                    process.kill_tree(spawned)
+                    spawned.wait()
+            raise
+
+        notes = [
+            f"{NOTE_PREFIX}excluded: {path} " + ("(binary)" if added == "-" else f"(+{added} -{deleted})")
+            for path, (added, deleted) in all_paths.items()
+            if path not in kept
+        ]
+        if whitespace_only:
+            notes.append(f"{NOTE_PREFIX}whitespace-only change")
+        return DiffText(self._append_notes(text, buffer, notes), mode)
+
+    def _read_remote_diff(self, chunks: Iterable[bytes], notes: Optional[List[str]] = None) -> DiffText:
+        """
+        Pasa un diff descargado de la API por el mismo filtrado y presupuesto
+        que el diff local
+        """
+        stream_filter = DiffStreamFilter(PathFilter(self.diff_settings))
+        max_bytes = byte_budget(self.diff_settings.max_bytes, self.diff_settings.max_tokens)
+        buffer = read_chunks(stream_filter(chunks), max_bytes=max_bytes, spill_bytes=self.diff_settings.spill_bytes)
+        return DiffText(self._append_notes(buffer.text(), buffer, stream_filter.notes() + (notes or [])), "full (api)")
+
+    @staticmethod
+    def _append_notes(text: str, buffer: DiffBuffer, notes: List[str]) -> str:
+        if buffer.truncated:
+            notes.append(f"{NOTE_PREFIX}diff truncated at {buffer.size} bytes")
+        if notes:
+            text += ("" if not text or text.endswith("\n") else "\n") + "\n".join(notes) + "\n"
+        return text
+
+    @staticmethod
+    def _spawn(cmd: List[str]) -> subprocess.Popen:
+        return process.spawn(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+    def _diff_flags(
+        self,
+        kept: Dict[str, Tuple[str, str]],
+        whitespace: Optional[Dict[str, Tuple[str, str]]]
+    ) -> Tuple[List[str], str, bool]:
+        """
+        Elige las opciones de `git diff` según el modo configurado. En modo
+        auto, los diffs grandes pasan a -U0 y los dominados por cambios de
+        formato ignoran espacios. Devuelve las opciones, el modo elegido y si
+        el cambio es solo de formato.
+
+        Ignorar espacios nunca puede vaciar el diff: si el cambio es solo de
+        formato se muestra completo.
+        """
+        mode = self.diff_settings.mode
+        changed = _changed_lines(kept)
+        ignore_whitespace = mode == "compact"
+
+        if mode == "auto":
+            mode = "compact" if changed > self.diff_settings.compact_threshold_lines else "full"
+            ignore_whitespace = changed > 0 and _changed_lines(whitespace) < changed * self.diff_settings.whitespace_ratio
+
+        whitespace_only = ignore_whitespace and changed > 0 and _changed_lines(whitespace or {}) == 0
+        if whitespace_only:
+            ignore_whitespace = False
+
+        # Renombrados y copias colapsan a su cabecera; sin prefijos a/ b/
+        flags = ["-M", "-C", "--no-prefix", *MODE_FLAGS[mode]]
+        if ignore_whitespace:
+            flags.extend(WHITESPACE_FLAGS)
+
+        label = mode + (", ignore-whitespace" if ignore_whitespace else "") + (
+            ", whitespace-only" if whitespace_only else ""
+        )
+        return flags, label, whitespace_only
+
     def get_branch_name(self) -> str:
         cmd = ["git", "rev-parse", "--abbrev-ref", "HEAD"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = process.run(cmd, capture_output=True, text=True)
         return result.stdout.strip()
 
     def get_stash_diff(self) -> str:
-        cmd = ["git", "diff", "--cached"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.stdout
+        return self._read_diff(["--cached"])
 
     def get_branch_diff(self, from_branch: str, to_branch: str) -> str:
-        cmd = ["git", "diff", f"{to_branch}..{from_branch}"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.stdout
+        """
+        Diff del PR: cambios de `from_branch` desde su punto de bifurcación
+        con `to_branch` (semántica de tres puntos), no frente a la punta actual
+        de `to_branch`.
+
+        Sin ancestro común (p. ej. un clon superficial de CI) no hay diff
+        fiable: el diff frente a la punta de `to_branch` atribuiría al PR los
+        cambios de la rama destino. Se lanza GitProviderException para que,
+        con `--pr`, se recurra al diff de la API.
+        """
+        from_sha = self._resolve_commit(from_branch)
+        to_sha = self._resolve_commit(to_branch)
+        base = self._merge_base(from_sha, to_sha)
+        if base is None:
+            raise GitProviderException(
+                f"No se encontró el merge-base de `{from_branch}` y `{to_branch}` "
+                f"(¿historia superficial?). Prueba `git fetch --unshallow` o usa --pr."
+            )
+        return self._read_diff([base, from_sha])
+
+    def _rev_parse(self, ref: str) -> Optional[str]:
+        cmd = ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]
+        result = process.run(cmd, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _resolve_commit(self, branch: str) -> str:
+        """SHA de la rama local o, en su defecto, de la rama remota"""
+        remote = self.git_settings.remote
+        sha = self._rev_parse(branch) or self._rev_parse(f"{remote}/{branch}")
+        if sha is None and self.git_settings.fetch_missing:
+            self._fetch_shallow(branch)
+            sha = self._rev_parse(f"{remote}/{branch}")
+        if sha is None:
+            raise GitProviderException(
+                f"La rama `{branch}` no existe en local ni en `{remote}`. "
+                f"Haz `git fetch {remote} {branch}` o activa `gclit config set git.fetch_missing true`."
+            )
+        return sha
+
+    def _fetch_shallow(self, branch: str) -> None:
+        remote = self.git_settings.remote
+        cmd = [
+            "git", "fetch", "--quiet", f"--depth={self.git_settings.fetch_depth}", remote,
+            f"+refs/heads/{branch}:refs/remotes/{remote}/{branch}",
+        ]
+        process.run(cmd, capture_output=True, text=True)
+
+    def _merge_base(self, from_sha: str, to_sha: str) -> Optional[str]:
+        key = f"{from_sha}:{to_sha}"
+        if self.merge_base_cache is not None:
+            cached = self.merge_base_cache.get(key)
+            if cached:
+                return cached
+
+        result = process.run(["git", "merge-base", to_sha, from_sha], capture_output=True, text=True)
+        base = result.stdout.strip() or None
+        if base and self.merge_base_cache is not None:
+            self.merge_base_cache.set(key, base)
+        return base
 
     def get_recent_commits(self, branch: str = None, limit: int = 5) -> str:
         """Obtiene los últimos commits para contexto histórico"""
@@ -25,13 +257,13 @@ class BaseGitAdapter(GitProvider):
         if branch:
             cmd.append(branch)
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = process.run(cmd, capture_output=True, text=True)
         return result.stdout.strip()
 
     def create_commit(self, message: str) -> str:
         try:
             cmd = ["git", "commit", "-m", message]
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            process.run(cmd, capture_output=True, text=True, check=True)
 
             return "Commit created successfully"
             # hash_result = subprocess.run(
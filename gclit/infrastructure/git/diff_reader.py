@@ -0,0 +1,81 @@
+# gclit/infrastructure/git/diff_reader.py
+"""
+Lectura incremental de la salida de `git diff`.
+
+El diff se lee en bloques de bytes desde el proceso, se corta al alcanzar el
+presupuesto configurado y, si supera el umbral de memoria, se vuelca a un
+fichero temporal. La decodificación se hace una sola vez y bajo demanda.
+"""
+import subprocess
+import tempfile
+from typing import Iterable, List, Optional
+
+from gclit.infrastructure.git.process import kill_at_deadline, kill_tree, spawn
+
+CHUNK_SIZE = 64 * 1024
+BYTES_PER_TOKEN = 4
+
+
+class DiffBuffer:
+    """Bytes de un diff en memoria, o en disco a partir de `spill_bytes`"""
+
+    def __init__(self, spill_bytes: int):
+        self._file = tempfile.SpooledTemporaryFile(max_size=spill_bytes)
+        self._text: Optional[str] = None
+        self.size = 0
+        self.truncated = False
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def truncate_at_line(self, limit: int) -> None:
+        """Recorta a `limit` bytes sin dejar una línea a medias"""
+        start = max(0, limit - CHUNK_SIZE)
+        self._file.seek(start)
+        cut = self._file.read(limit - start).rfind(b"\n")
+        if cut != -1:
+            limit = start + cut + 1
+        self._file.truncate(limit)
+        self.size = limit
+        self.truncated = True
+
+    def text(self, errors: str = "replace") -> str:
+        if self._text is None:
+            self._file.seek(0)
+            self._text = self._file.read().decode("utf-8", errors=errors)
+            self._file.close()
+        return self._text
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+
+def byte_budget(max_bytes: int, max_tokens: int = 0) -> int:
+    """Límite efectivo en bytes combinando el de bytes y el de tokens (0 = sin límite)"""
+    limits = [limit for limit in (max_bytes, max_tokens * BYTES_PER_TOKEN) if limit > 0]
+    return min(limits) if limits else 0
+
+
+def read_chunks(chunks: Iterable[bytes], max_bytes: int = 0, spill_bytes: int = 1024 * 1024) -> DiffBuffer:
+    """Acumula `chunks` hasta `max_bytes` (0 = sin límite) y deja de consumirlos al llegar"""
+    buffer = DiffBuffer(spill_bytes)
+    for chunk in chunks:
+        buffer.write(chunk)
+        if max_bytes and buffer.size > max_bytes:
+            buffer.truncate_at_line(max_bytes)
+            break
+    return buffer
+
+
+def read_diff(cmd: List[str], max_bytes: int = 0, spill_bytes: int = 1024 * 1024) -> DiffBuffer:
+    """Ejecuta `cmd` y lee su salida hasta `max_bytes` (0 = sin límite)"""
+    process = spawn(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        with kill_at_deadline(process, cmd):
+            return read_chunks(iter(lambda: process.stdout.read1(CHUNK_SIZE), b""), max_bytes, spill_bytes)
+    finally:
+        if process.poll() is None:
+            kill_tree(process)
+        process.stdout.close()
+        process.wait()
@@ -1,19 +1,49 @@
 # gclit/infrastructure/git/github_adapter.py
 
+import time
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from requests.exceptions import HTTPError, RequestException
 
-from gclit.domain.exceptions.exception import GitProviderException
-from gclit.domain.models.pull_request import PullRequestInfo
+from gclit.config.settings import HttpSettings
+from gclit.domain.deadline import bind_context
+from gclit.domain.exceptions.exception import ExistingPullRequestException, GitProviderException
+from gclit.domain.models.diff import NOTE_PREFIX, DiffText
+from gclit.domain.models.pull_request import PullRequestInfo, is_generated
+from gclit.infrastructure.cache.disk_cache import DiskCache
 from gclit.infrastructure.git.base_git_adapter import BaseGitAdapter
+from gclit.infrastructure.git.diff_reader import CHUNK_SIZE
+from gclit.infrastructure.git.github_graphql import GitHubGraphQL, GraphQLUnavailable
+from gclit.infrastructure.git.remote_diff import file_header
+from gclit.infrastructure.http.transport import HttpTransport
+
+# Vigencia de los datos precargados por GraphQL (el adaptador vive en el daemon)
+OVERVIEW_TTL = 30.0
 
 
 class GitHubAdapter(BaseGitAdapter):
-    def __init__(self, token: str, repo: str):
+    def __init__(
+        self,
+        token: str,
+        repo: str,
+        http_settings: Optional[HttpSettings] = None,
+        http_cache: Optional[DiskCache] = None,
+        graphql: bool = True,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
         self.token = token
         self.repo = repo
-        self.api_url = f"https://api.github.com/repos/{self.repo}"
+        self.api_root = "https://api.github.com"
+        self.api_url = f"{self.api_root}/repos/{self.repo}"
+        self.http = HttpTransport("GitHub", self._headers(), http_settings, cache=http_cache)
+        # Con GraphQL varias consultas REST se resuelven en una; si falla, se desactiva y se usa REST
+        self.graphql = GitHubGraphQL(self.http, self.api_root, self.repo) if graphql and self.token else None
+        # Resultados de la última consulta agrupada: PR -> (info, id) y rama -> PRs abiertos
+        self._prs: Dict[int, Tuple[float, PullRequestInfo, str]] = {}
+        self._open_from_head: Dict[str, Tuple[float, List[Tuple[int, str]]]] = {}
+        self._default_branch_hint: Optional[str] = None
 
     def _headers(self):
         return {
@@ -42,8 +72,54 @@ class GitHubAdapter(BaseGitAdapter):
         except RequestException as e:
             raise GitProviderException(f"{context} - Error de red al conectar con GitHub.") from e
 
-    def _find_existing_pr(self, from_branch: str, to_branch: str) -> Optional[int]:
+    def _overview(self, pr_number: Optional[int] = None, head: Optional[str] = None) -> bool:
+        """
+        Una consulta GraphQL con la rama por defecto, el PR y los PRs abiertos
+        desde `head`. Devuelve False si GraphQL no está disponible.
+        """
+        if self.graphql is None:
+            return False
+        try:
+            data = self.graphql.overview(pr_number=pr_number, head=head)
+        except GraphQLUnavailable:
+            self.graphql = None
+            return False
+
+        now = time.monotonic()
+        if data.get("defaultBranchRef"):
+            self._default_branch_hint = data["defaultBranchRef"]["name"]
+        pr = data.get("pullRequest")
+        if pr:
+            info = PullRequestInfo(
+                pr_number=pr["number"],
+                from_branch=pr["headRefName"],
+                to_branch=pr["baseRefName"],
+                title=pr["title"],
+                author=(pr.get("author") or {}).get("login"),
+                url=pr["url"],
+                generated=is_generated(pr.get("body"))
+            )
+            self._prs[pr["number"]] = (now, info, pr["id"])
+        if head is not None:
+            # headRefName no distingue forks: un PR desde `fork:main` también aparece
+            owner = self.repo.split("/")[0].lower()
+            nodes = [
+                node for node in data.get("openFromHead", {}).get("nodes", [])
+                if ((node.get("headRepositoryOwner") or {}).get("login") or "").lower() == owner
+            ]
+            self._open_from_head[head] = (now, [(node["number"], node["baseRefName"]) for node in nodes])
+        return True
+
+    @staticmethod
+    def _fresh(entry) -> bool:
+        return entry is not None and time.monotonic() - entry[0] < OVERVIEW_TTL
+
+    def find_existing_pr(self, from_branch: str, to_branch: str) -> Optional[int]:
         """Verifica si ya hay un PR abierto desde from_branch a to_branch"""
+        if self._fresh(self._open_from_head.get(from_branch)) or self._overview(head=from_branch):
+            _, prs = self._open_from_head[from_branch]
+            return next((number for number, base in prs if base == to_branch), None)
+
         url = f"{self.api_url}/pulls"
         owner = self.repo.split("/")[0]
         params = {
@@ -51,16 +127,89 @@ class GitHubAdapter(BaseGitAdapter):
             "head": f"{owner}:{from_branch}",
             "base": to_branch
         }
-        res = requests.get(url, headers=self._headers(), params=params)
+        res = self.http.get(url, params=params)
         self._handle_http_error(res, "Al buscar PR existente")
         prs = res.json()
         if prs:
             return prs[0]["number"]
         return None
 
+    def _fetch_default_branch(self) -> Optional[str]:
+        # Junto a la rama por defecto se precargan los PRs abiertos desde la rama
+        # actual: es lo siguiente que comprueba `pr generate`
+        if self._default_branch_hint or self._overview(head=self.get_branch_name()):
+            return self._default_branch_hint
+        res = self.http.get(self.api_url)
+        self._handle_http_error(res, "Al obtener la rama por defecto")
+        return res.json().get("default_branch")
+
+    def list_prs(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        author: Optional[str] = None
+    ) -> Iterator[PullRequestInfo]:
+        """
+        PRs abiertos página a página siguiendo la cabecera `Link`. `/pulls`
+        no filtra por autor: en ese caso se usa la API de búsqueda y el
+        detalle de cada PR se pide en paralelo.
+        """
+        if author:
+            yield from self._search_prs(base, head, author)
+            return
+
+        params = {"state": "open", "per_page": 100}
+        if base:
+            params["base"] = base
+        if head:
+            params["head"] = head if ":" in head else f"{self.repo.split('/')[0]}:{head}"
+        url = f"{self.api_url}/pulls"
+        while url:
+            res = self.http.get(url, params=params)
+            self._handle_http_error(res, "Al listar PRs")
+            yield from (self._pr_info(pr) for pr in res.json())
+            # La URL de `next` ya incluye los parámetros
+            url, params = res.links.get("next", {}).get("url"), None
+
+    def _search_prs(self, base: Optional[str], head: Optional[str], author: str) -> Iterator[PullRequestInfo]:
+        query = f"repo:{self.repo} is:pr is:open author:{author}"
+        if base:
+            query += f" base:{base}"
+        if head:
+            query += f" head:{head}"
+        url = f"{self.api_root}/search/issues"
+        params = {"q": query, "per_page": 100}
+        with ThreadPoolExecutor(max_workers=self.http.settings.pool_size) as executor:
+            while url:
+                res = self.http.get(url, params=params)
+                self._handle_http_error(res, "Al buscar PRs")
+                numbers = [item["number"] for item in res.json().get("items", [])]
+                yield from executor.map(bind_context(self._get_pr), numbers)
+                url, params = res.links.get("next", {}).get("url"), None
+
+    def _get_pr(self, pr_number: int) -> PullRequestInfo:
+        res = self.http.get(f"{self.api_url}/pulls/{pr_number}")
+        self._handle_http_error(res, f"Al obtener PR #{pr_number}")
+        return self._pr_info(res.json())
+
+    @staticmethod
+    def _pr_info(data: dict) -> PullRequestInfo:
+        return PullRequestInfo(
+            pr_number=data["number"],
+            from_branch=data["head"]["ref"],
+            to_branch=data["base"]["ref"],
+            title=data.get("title"),
+            author=(data.get("user") or {}).get("login"),
+            url=data.get("html_url"),
+            generated=is_generated(data.get("body"))
+        )
+
     def get_pr_diff_by_number(self, pr_number: int) -> PullRequestInfo:
+        if self._fresh(self._prs.get(pr_number)) or self._overview(pr_number=pr_number):
+            if pr_number in self._prs:
+                return self._prs[pr_number][1]
         url = f"{self.api_url}/pulls/{pr_number}"
-        res = requests.get(url, headers=self._headers())
+        res = self.http.get(url)
         self._handle_http_error(res, f"Al obtener PR #{pr_number}")
         data = res.json()
         return PullRequestInfo(
@@ -69,23 +218,83 @@ class GitHubAdapter(BaseGitAdapter):
             to_branch=data["base"]["ref"]
         )
 
+    def fetch_pr_diff(self, pr_number: int) -> Optional[str]:
+        """
+        Diff del PR desde la API: formato diff en streaming y, si GitHub lo
+        rechaza por tamaño, reconstruido a partir de `/pulls/N/files`
+        """
+        res = self.http.get(
+            f"{self.api_url}/pulls/{pr_number}",
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True
+        )
+        if res.status_code in (406, 422):
+            return self._diff_from_files(pr_number)
+        self._handle_http_error(res, f"Al obtener el diff del PR #{pr_number}")
+        return self._read_remote_diff(res.iter_content(CHUNK_SIZE))
+
+    def _diff_from_files(self, pr_number: int) -> str:
+        notes = []
+
+        def chunks():
+            page = 1
+            while True:
+                res = self.http.get(f"{self.api_url}/pulls/{pr_number}/files", params={"per_page": 100, "page": page})
+                self._handle_http_error(res, f"Al obtener los ficheros del PR #{pr_number}")
+                files = res.json()
+                for file in files:
+                    old_path = file.get("previous_filename") or file["filename"]
+                    if "patch" not in file:
+                        # GitHub no incluye el parche de binarios ni de ficheros enormes
+                        notes.append(
+                            f"{NOTE_PREFIX}omitted (no patch from API): {file['filename']} "
+                            f"(+{file['additions']} -{file['deletions']})"
+                        )
+                        continue
+                    text = file_header(old_path, file["filename"], file["status"])
+                    text += "--- /dev/null\n" if file["status"] == "added" else f"--- a/{old_path}\n"
+                    text += "+++ /dev/null\n" if file["status"] == "removed" else f"+++ b/{file['filename']}\n"
+                    yield (text + file["patch"] + "\n").encode("utf-8")
+                if len(files) < 100:
+                    return
+                page += 1
+
+        # Las notas se completan mientras se consume el generador
+        text = self._read_remote_diff(chunks())
+        return DiffText(text + "".join(f"{note}\n" for note in notes), text.mode)
+
     def update_pr(self, pr_number: int, title: str, body: str) -> None:
         url = f"{self.api_url}/pulls/{pr_number}"
-        res = requests.patch(url, headers=self._headers(), json={"title": title, "body": body})
+        res = self.http.patch(url, json={"title": title, "body": body})
         self._handle_http_error(res, f"Al actualizar PR #{pr_number}")
 
+    def update_prs(self, updates: List[Tuple[int, str, str]]) -> Dict[int, Optional[str]]:
+        """Actualizaciones en lote: una mutación GraphQL por cada grupo de PRs"""
+        if self.graphql is not None:
+            try:
+                ids = {n: entry[2] for n, entry in self._prs.items() if self._fresh(entry)}
+                missing = [number for number, _, _ in updates if number not in ids]
+                if missing:
+                    ids.update(self.graphql.node_ids(missing))
+                results = self.graphql.update_prs([
+                    (number, ids[number], title, body)
+                    for number, title, body in updates if number in ids
+                ])
+                results.update((number, f"PR #{number} no encontrado") for number, _, _ in updates if number not in ids)
+                return results
+            except GraphQLUnavailable:
+                self.graphql = None
+        return super().update_prs(updates)
+
     def create_pr(self, from_branch: str, to_branch: str, title: str, body: str) -> str:
-        existing_pr = self._find_existing_pr(from_branch, to_branch)
+        existing_pr = self.find_existing_pr(from_branch, to_branch)
         if existing_pr:
-            raise GitProviderException(
-                f"Ya existe un Pull Request abierto de `{from_branch}` hacia `{to_branch}` (PR #{existing_pr}).\n"
-                f"Puedes usar `gclit pr --pr {existing_pr}` para actualizarlo."
-            )
+            raise ExistingPullRequestException(from_branch, to_branch, existing_pr)
 
-        res = requests.post(
+        res = self.http.post(
             f"{self.api_url}/pulls",
-            headers=self._headers(),
             json={"head": from_branch, "base": to_branch, "title": title, "body": body}
         )
         self._handle_http_error(res, f"Al crear PR de `{from_branch}` a `{to_branch}`")
+        self._open_from_head.pop(from_branch, None)
         return res.json()["html_url"]
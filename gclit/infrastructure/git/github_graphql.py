@@ -0,0 +1,107 @@
+# gclit/infrastructure/git/github_graphql.py
+"""
+Cliente mínimo de la API GraphQL de GitHub.
+
+Agrupa en una sola petición lo que por REST son varias idas y vueltas
+(datos del PR, ramas, PRs abiertos desde una rama, rama por defecto) y
+envía las actualizaciones de varios PRs en una única mutación con alias.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from gclit.domain.exceptions.exception import GitProviderException
+from gclit.infrastructure.http.transport import HttpTransport
+
+# Límite prudente de alias por petición (GitHub limita la complejidad)
+MAX_ALIASES = 20
+
+OVERVIEW_QUERY = """
+query Overview($owner: String!, $name: String!, $number: Int!, $withPr: Boolean!, $head: String, $withHead: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { name }
+    pullRequest(number: $number) @include(if: $withPr) {
+      id number title body url headRefName baseRefName author { login }
+    }
+    openFromHead: pullRequests(states: OPEN, headRefName: $head, first: 20) @include(if: $withHead) {
+      nodes { id number baseRefName headRepositoryOwner { login } }
+    }
+  }
+}
+"""
+
+
+class GraphQLUnavailable(GitProviderException):
+    """GraphQL no se puede usar (token sin permisos, GHES antiguo...): se vuelve a REST"""
+
+
+class GitHubGraphQL:
+    def __init__(self, http: HttpTransport, api_root: str, repo: str):
+        self.http = http
+        self.url = f"{api_root}/graphql"
+        self.owner, self.name = repo.split("/", 1)
+
+    def execute(self, query: str, variables: Optional[dict] = None) -> Tuple[dict, List[dict]]:
+        """Devuelve (data, errors); sin `data` la API se considera no disponible"""
+        try:
+            res = self.http.post(self.url, json={"query": query, "variables": variables or {}})
+        except GitProviderException as e:
+            # Red o límite de peticiones: REST tiene su propia cuota y sus reintentos
+            raise GraphQLUnavailable(str(e)) from e
+        if res.status_code != 200:
+            raise GraphQLUnavailable(f"GitHub GraphQL error {res.status_code}")
+        payload = res.json()
+        if not payload.get("data"):
+            messages = "; ".join(error.get("message", "") for error in payload.get("errors", []))
+            raise GraphQLUnavailable(f"GitHub GraphQL error: {messages}")
+        return payload["data"], payload.get("errors", [])
+
+    def overview(self, pr_number: Optional[int] = None, head: Optional[str] = None) -> dict:
+        """Rama por defecto, datos del PR `pr_number` y PRs abiertos desde `head`, en una petición"""
+        data, _ = self.execute(OVERVIEW_QUERY, {
+            "owner": self.owner,
+            "name": self.name,
+            "number": pr_number or 0,
+            "withPr": pr_number is not None,
+            "head": head,
+            "withHead": head is not None,
+        })
+        return data["repository"]
+
+    def node_ids(self, pr_numbers: List[int]) -> Dict[int, str]:
+        """Ids GraphQL de varios PRs con una petición por cada MAX_ALIASES"""
+        ids = {}
+        for start in range(0, len(pr_numbers), MAX_ALIASES):
+            chunk = pr_numbers[start:start + MAX_ALIASES]
+            fields = " ".join(f"p{number}: pullRequest(number: {int(number)}) {{ id }}" for number in chunk)
+            query = f"query Ids($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            data, _ = self.execute(query, {"owner": self.owner, "name": self.name})
+            ids.update(
+                (number, data["repository"][f"p{number}"]["id"])
+                for number in chunk if data["repository"].get(f"p{number}")
+            )
+        return ids
+
+    def update_prs(self, updates: List[Tuple[int, str, str, str]]) -> Dict[int, Optional[str]]:
+        """
+        Actualiza (número, id, título, cuerpo) en mutaciones agrupadas.
+        Devuelve número -> mensaje de error (None si se actualizó).
+        """
+        results: Dict[int, Optional[str]] = {}
+        for start in range(0, len(updates), MAX_ALIASES):
+            chunk = updates[start:start + MAX_ALIASES]
+            declarations, fields, variables = [], [], {}
+            for i, (_, node_id, title, body) in enumerate(chunk):
+                declarations.append(f"$id{i}: ID!, $title{i}: String!, $body{i}: String!")
+                fields.append(
+                    f"u{i}: updatePullRequest(input: {{pullRequestId: $id{i}, title: $title{i}, body: $body{i}}}) "
+                    "{ pullRequest { number } }"
+                )
+                variables.update({f"id{i}": node_id, f"title{i}": title, f"body{i}": body})
+            query = f"mutation Update({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+
+            _, errors = self.execute(query, variables)
+            failed = {
+                error["path"][0]: error.get("message", "error")
+                for error in errors if error.get("path")
+            }
+            results.update((number, failed.get(f"u{i}")) for i, (number, *_) in enumerate(chunk))
+        return results
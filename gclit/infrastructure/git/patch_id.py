@@ -0,0 +1,27 @@
+# gclit/infrastructure/git/patch_id.py
+import hashlib
+import subprocess
+
+from gclit.infrastructure.git import process
+
+
+def stable_patch_id(diff: str) -> str:
+    """
+    Identificador del contenido de un diff con `git patch-id --stable`: no
+    depende de números de línea ni del orden de los ficheros, así que un
+    rebase sin conflictos conserva el mismo valor. Si git no reconoce el
+    texto como parche se usa el sha256 del diff.
+    """
+    try:
+        result = process.run(
+            ["git", "patch-id", "--stable"],
+            input=diff.encode("utf-8"),
+            capture_output=True,
+            check=True
+        )
+        patch_id = result.stdout.split(maxsplit=1)
+        if patch_id:
+            return patch_id[0].decode("ascii")
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return hashlib.sha256(diff.encode("utf-8")).hexdigest()
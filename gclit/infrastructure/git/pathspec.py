@@ -0,0 +1,72 @@
+# gclit/infrastructure/git/pathspec.py
+"""
+Construcción de pathspecs para que git no llegue a generar el diff de los
+ficheros excluidos (lockfiles, bundles minificados, código generado...).
+"""
+from typing import Dict, List, Tuple
+
+from gclit.config.settings import DiffSettings
+
+DEFAULT_EXCLUDES = [
+    # Lockfiles
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml",
+    "poetry.lock", "Pipfile.lock", "uv.lock", "Cargo.lock", "composer.lock",
+    "Gemfile.lock", "go.sum", "packages.lock.json",
+    # Bundles minificados y source maps
+    "*.min.js", "*.min.css", "*.map",
+    # Snapshots de tests
+    "*.snap", "__snapshots__/**",
+    # Código generado (protobuf, gRPC, etc.)
+    "*_pb2.py", "*_pb2_grpc.py", "*_pb2.pyi", "*.pb.go", "*.pb.cc", "*.pb.h",
+    "*.g.dart", "*.designer.cs", "*.generated.*",
+]
+
+GITATTRIBUTES_EXCLUDES = ["linguist-generated", "-diff"]
+
+
+def _glob(pattern: str) -> str:
+    # Igual que en .gitignore: un patrón sin "/" aplica en cualquier directorio
+    # y uno terminado en "/" abarca todo el directorio
+    pattern = pattern.strip()
+    if pattern.endswith("/"):
+        pattern += "**"
+    if "/" not in pattern:
+        return f"**/{pattern}"
+    return pattern.lstrip("/")
+
+
+def build_pathspec(settings: DiffSettings) -> List[str]:
+    """
+    Pathspec para `git diff -- <pathspec>` según la configuración. Todos los
+    patrones se anclan a la raíz del repo (`top`): lanzado desde un
+    subdirectorio, el diff sigue cubriendo el repositorio entero.
+    """
+    pathspec = [f":(top,glob){_glob(p)}" for p in settings.include] or [":/"]
+
+    excludes = list(settings.exclude)
+    if settings.exclude_defaults:
+        excludes.extend(DEFAULT_EXCLUDES)
+    pathspec.extend(f":(top,exclude,glob){_glob(p)}" for p in excludes)
+
+    if settings.use_gitattributes:
+        pathspec.extend(f":(top,exclude,attr:{attr})" for attr in GITATTRIBUTES_EXCLUDES)
+    return pathspec
+
+
+def parse_numstat(output: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Interpreta `git diff --numstat -z`: ruta -> (añadidas, eliminadas).
+    Los binarios aparecen como "-" y los renombrados con su ruta nueva.
+    """
+    stats = {}
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields) - 1:
+        added, deleted, path = fields[i].split("\t", 2)
+        i += 1
+        if not path:
+            # Renombrado o copia: siguen la ruta antigua y la nueva
+            path = fields[i + 1]
+            i += 2
+        stats[path] = (added, deleted)
+    return stats
@@ -0,0 +1,96 @@
+# gclit/infrastructure/git/process.py
+"""
+Ejecución de comandos git acotada al plazo de --timeout.
+
+Con plazo, cada comando va en su propia sesión: al agotarse se mata el
+grupo entero, incluidos los hijos (hooks, textconv, alias) que de otro modo
+mantendrían abierta la salida. Sin plazo se ejecutan como siempre, así que
+los hooks interactivos conservan la terminal.
+"""
+import os
+import signal
+import subprocess
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from gclit.domain.deadline import exceeded, remaining
+from gclit.domain.exceptions.exception import DeadlineExceededException
+
+
+def _describe(cmd: List[str]) -> str:
+    return " ".join(cmd[:2])
+
+
+def session_options(cmd: List[str]) -> dict:
+    """Opciones de Popen / create_subprocess_exec para poder matar el comando con sus hijos"""
+    if os.name == "posix" and remaining(operation=_describe(cmd)) is not None:
+        return {"start_new_session": True}
+    return {}
+
+
+def kill_tree(process) -> None:
+    """Mata el proceso y, si encabeza su propio grupo, también a sus hijos"""
+    try:
+        if os.name == "posix" and os.getpgid(process.pid) == process.pid:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def spawn(cmd: List[str], **kwargs) -> subprocess.Popen:
+    return subprocess.Popen(cmd, **session_options(cmd), **kwargs)
+
+
+def run(cmd: List[str], input=None, capture_output: bool = False, check: bool = False, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run con el tiempo restante como timeout"""
+    if capture_output:
+        kwargs.update(stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if input is not None:
+        kwargs["stdin"] = subprocess.PIPE
+    process = spawn(cmd, **kwargs)
+    stdout, stderr = communicate(process, cmd, input)
+    result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    if check:
+        result.check_returncode()
+    return result
+
+
+def communicate(process: subprocess.Popen, cmd: List[str], input=None) -> Tuple[Optional[str], Optional[str]]:
+    """Popen.communicate con el tiempo restante como timeout"""
+    operation = _describe(cmd)
+    try:
+        return process.communicate(input, timeout=remaining(operation=operation))
+    except (subprocess.TimeoutExpired, DeadlineExceededException):
+        kill_tree(process)
+        process.communicate()
+        raise exceeded(operation) from None
+
+
+@contextmanager
+def kill_at_deadline(process: subprocess.Popen, cmd: List[str]):
+    """Mata `process` si el plazo se agota mientras se lee su salida en streaming"""
+    operation = _describe(cmd)
+    left = remaining(operation=operation)
+    if left is None:
+        yield
+        return
+
+    fired = threading.Event()
+
+    def kill():
+        fired.set()
+        kill_tree(process)
+
+    timer = threading.Timer(left, kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+    # La salida leída está incompleta: no debe tratarse como un diff válido
+    if fired.is_set():
+        raise exceeded(operation)
@@ -0,0 +1,161 @@
+# gclit/infrastructure/git/remote_diff.py
+"""
+Diffs obtenidos de la API del proveedor cuando las ramas no están en local
+(p. ej. clones superficiales de CI).
+
+La API no entiende de pathspecs, así que las mismas reglas de inclusión y
+exclusión se aplican aquí sobre el flujo de bytes: los ficheros excluidos
+se descartan antes de llegar al buffer y quedan resumidos en notas.
+"""
+import difflib
+import re
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, Iterator, List, TypeVar
+
+from gclit.config.settings import DiffSettings
+from gclit.domain.models.diff import NOTE_PREFIX
+from gclit.infrastructure.git.pathspec import DEFAULT_EXCLUDES, _glob
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _glob_regex(pattern: str) -> "re.Pattern":
+    """Traduce un glob de pathspec (`**`, `*`, `?`) a expresión regular"""
+    glob = _glob(pattern)
+    regex, i = "", 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif glob.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif glob[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif glob[i] == "?":
+            regex += "[^/]"
+            i += 1
+        else:
+            regex += re.escape(glob[i])
+            i += 1
+    return re.compile(regex + "$")
+
+
+class PathFilter:
+    """Equivalente en Python de `build_pathspec` (sin atributos de .gitattributes)"""
+
+    def __init__(self, settings: DiffSettings):
+        self.include = [_glob_regex(p) for p in settings.include]
+        excludes = list(settings.exclude)
+        if settings.exclude_defaults:
+            excludes.extend(DEFAULT_EXCLUDES)
+        self.exclude = [_glob_regex(p) for p in excludes]
+
+    def __call__(self, path: str) -> bool:
+        path = path.lstrip("/")
+        if self.include and not any(p.match(path) for p in self.include):
+            return False
+        return not any(p.match(path) for p in self.exclude)
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Reagrupa bloques de bytes arbitrarios en líneas completas"""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+    if pending:
+        yield pending
+
+
+class DiffStreamFilter:
+    """Deja pasar las líneas de los ficheros incluidos y contabiliza los excluidos"""
+
+    def __init__(self, keep: Callable[[str], bool]):
+        self.keep = keep
+        # ruta -> [añadidas, eliminadas, binario]
+        self.excluded: Dict[str, list] = {}
+
+    def __call__(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        dropped, in_hunk = None, False
+        for line in iter_lines(chunks):
+            if line.startswith(b"diff --git "):
+                # Los diffs de la API siempre llevan prefijos a/ y b/
+                path = line.decode("utf-8", errors="replace").rstrip("\n").rsplit(" b/", 1)[-1]
+                dropped = None if self.keep(path) else self.excluded.setdefault(path, [0, 0, False])
+                in_hunk = False
+            if dropped is None:
+                yield line
+            elif line.startswith(b"@@"):
+                in_hunk = True
+            elif in_hunk and line.startswith(b"+"):
+                dropped[0] += 1
+            elif in_hunk and line.startswith(b"-"):
+                dropped[1] += 1
+            elif line.startswith(b"Binary files ") or line.startswith(b"GIT binary patch"):
+                dropped[2] = True
+
+    def notes(self) -> List[str]:
+        return [
+            f"{NOTE_PREFIX}excluded: {path} " + ("(binary)" if binary else f"(+{added} -{deleted})")
+            for path, (added, deleted, binary) in self.excluded.items()
+        ]
+
+
+def file_header(old_path: str, new_path: str, status: str) -> str:
+    """Cabecera `diff --git` equivalente a la de git para un fichero de la API"""
+    header = f"diff --git a/{old_path} b/{new_path}\n"
+    if status == "added":
+        header += "new file mode 100644\n"
+    elif status == "removed":
+        header += "deleted file mode 100644\n"
+    elif status == "renamed":
+        header += f"rename from {old_path}\nrename to {new_path}\n"
+    return header
+
+
+def unified_file_diff(old_path: str, new_path: str, status: str, old: bytes, new: bytes) -> str:
+    """Diff unificado de un fichero a partir de sus dos versiones"""
+    header = file_header(old_path, new_path, status)
+    if b"\0" in old[:8000] or b"\0" in new[:8000]:
+        return header + f"Binary files a/{old_path} and b/{new_path} differ\n"
+
+    lines = difflib.unified_diff(
+        old.decode("utf-8", errors="replace").splitlines(keepends=True),
+        new.decode("utf-8", errors="replace").splitlines(keepends=True),
+        fromfile="/dev/null" if status == "added" else f"a/{old_path}",
+        tofile="/dev/null" if status == "removed" else f"b/{new_path}",
+    )
+    body = "".join(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n" for line in lines)
+    return header + body
+
+
+def bounded_map(executor: Executor, func: Callable[[T], R], items: Iterable[T], window: int) -> Iterator[R]:
+    """
+    Como `executor.map`, pero con a lo sumo `window` tareas en vuelo: cada
+    resultado consumido encarga la siguiente descarga. Si se deja de leer
+    (presupuesto de bytes agotado) y se cierra el generador, las tareas
+    pendientes se cancelan en lugar de seguir descargando.
+    """
+    items = iter(items)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                break
+        while pending:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
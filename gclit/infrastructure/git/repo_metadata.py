@@ -0,0 +1,113 @@
+# gclit/infrastructure/git/repo_metadata.py
+"""
+Metadatos del repositorio (proveedor, owner/repo u org/proyecto, rama por
+defecto) resueltos leyendo `.git/config` directamente, sin lanzar git, y
+cacheados en disco por directorio git. La caché se invalida cuando cambia
+el mtime de `.git/config`.
+"""
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from gclit.domain.exceptions.exception import GitProviderException
+from gclit.domain.models.repository import RepositoryInfo
+from gclit.infrastructure.cache.disk_cache import DiskCache
+
+_SECTION_RE = re.compile(r'^\s*\[\s*remote\s+"(?P<name>[^"]+)"\s*\]')
+_OTHER_SECTION_RE = re.compile(r"^\s*\[")
+_URL_RE = re.compile(r"^\s*url\s*=\s*(?P<url>.+?)\s*$")
+
+_GITHUB_RE = re.compile(r"github\.com[:/](?P<owner>[^/]+)/(?P<repo>.+?)(?:\.git)?/?$")
+_AZURE_RES = [
+    # https://[user@]dev.azure.com/org/project/_git/repo
+    re.compile(r"dev\.azure\.com/(?P<organization>[^/]+)/(?P<project>[^/]+)/_git/(?P<repo>[^/]+?)/?$"),
+    # git@ssh.dev.azure.com:v3/org/project/repo
+    re.compile(r"ssh\.dev\.azure\.com:v3/(?P<organization>[^/]+)/(?P<project>[^/]+)/(?P<repo>[^/]+?)/?$"),
+    # https://org.visualstudio.com/[DefaultCollection/]project/_git/repo
+    re.compile(r"(?P<organization>[^/@.]+)\.visualstudio\.com/(?:DefaultCollection/)?(?P<project>[^/]+)/_git/(?P<repo>[^/]+?)/?$"),
+]
+
+
+def find_git_dir(start: Path) -> Optional[Path]:
+    """Directorio git del repositorio que contiene `start` (admite worktrees)"""
+    for directory in (start, *start.parents):
+        candidate = directory / ".git"
+        if candidate.is_dir():
+            return candidate
+        if candidate.is_file():
+            content = candidate.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                return (directory / content[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def config_path(git_dir: Path) -> Path:
+    # Los worktrees comparten la configuración del repositorio principal
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve() / "config"
+    return git_dir / "config"
+
+
+def read_remotes(config_file: Path) -> Dict[str, str]:
+    remotes, current = {}, None
+    for line in config_file.read_text(encoding="utf-8").splitlines():
+        section = _SECTION_RE.match(line)
+        if section:
+            current = section.group("name")
+            continue
+        if _OTHER_SECTION_RE.match(line):
+            current = None
+            continue
+        url = _URL_RE.match(line)
+        if current and url and current not in remotes:
+            remotes[current] = url.group("url")
+    return remotes
+
+
+def parse_remote_url(url: str) -> dict:
+    match = _GITHUB_RE.search(url)
+    if match:
+        return {"provider": "github", **match.groupdict()}
+    for pattern in _AZURE_RES:
+        match = pattern.search(url)
+        if match:
+            return {"provider": "azure_devops", **match.groupdict()}
+    raise GitProviderException(f"Proveedor Git no reconocido en la URL del repo: {url}")
+
+
+class RepoMetadataStore:
+    def __init__(self, cache: Optional[DiskCache] = None, preferred_remote: str = "origin"):
+        self.cache = cache
+        self.preferred_remote = preferred_remote
+
+    def load(self, cwd: Optional[Path] = None) -> RepositoryInfo:
+        git_dir = find_git_dir((cwd or Path.cwd()).resolve())
+        if git_dir is None:
+            raise GitProviderException("No es un repositorio git")
+        config_file = config_path(git_dir)
+        mtime = config_file.stat().st_mtime
+
+        if self.cache is not None:
+            cached = self.cache.get(str(git_dir))
+            if cached and cached.get("config_mtime") == mtime:
+                return RepositoryInfo(**cached)
+
+        remotes = read_remotes(config_file)
+        if not remotes:
+            raise GitProviderException("El repositorio no tiene remotos configurados")
+        remote = self.preferred_remote if self.preferred_remote in remotes else next(iter(remotes))
+
+        info = RepositoryInfo(
+            git_dir=str(git_dir),
+            remote=remote,
+            remote_url=remotes[remote],
+            config_mtime=mtime,
+            **parse_remote_url(remotes[remote])
+        )
+        self.save(info)
+        return info
+
+    def save(self, info: RepositoryInfo) -> None:
+        if self.cache is not None:
+            self.cache.set(info.git_dir, info.model_dump())
@@ -0,0 +1,236 @@
+# gclit/infrastructure/http/transport.py
+"""
+Transporte HTTP compartido por los adaptadores de GitHub y Azure DevOps:
+sesión con conexiones persistentes, timeouts, reintentos con backoff
+exponencial (respetando `Retry-After`) y control de límites de peticiones
+mediante `X-RateLimit-Remaining` / `X-RateLimit-Reset`. Con --timeout, cada
+intento y cada espera se acortan al tiempo que queda del plazo.
+
+Con una caché en disco, los GET se hacen condicionales (`If-None-Match` /
+`If-Modified-Since`): un 304 se sirve desde la caché y, en GitHub, no
+consume cuota. Solo se guardan respuestas JSON: las descargas en streaming
+(diffs) y los contenidos de ficheros, que pueden ser binarios, van siempre
+a la red.
+"""
+import hashlib
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gclit.config.settings import HttpSettings
+from gclit.domain.deadline import exceeded, expired, remaining
+from gclit.domain.exceptions.exception import GitProviderException, RateLimitException
+from gclit.infrastructure.cache.disk_cache import DiskCache
+
+RETRY_STATUSES = {500, 502, 503, 504}
+RATE_LIMIT_STATUSES = {403, 429}
+# PATCH solo fija título y descripción, así que repetirlo es seguro; POST no
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+# GitHub pide esperar al menos un minuto ante un límite secundario sin cabeceras
+SECONDARY_RATE_LIMIT_WAIT = 60.0
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Segundos indicados por `Retry-After` (entero o fecha HTTP)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _rate_limit_reset(response: requests.Response) -> Optional[float]:
+    """Instante (epoch) en que se repone la cuota si esta se ha agotado"""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    reset = response.headers.get("X-RateLimit-Reset")
+    try:
+        return float(reset) if reset else None
+    except ValueError:
+        return None
+
+
+def _is_json(response: requests.Response) -> bool:
+    """application/json y variantes como application/vnd.github+json"""
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    return content_type.endswith("/json") or content_type.endswith("+json")
+
+
+class HttpTransport:
+    def __init__(
+        self,
+        service: str,
+        headers: Dict[str, str],
+        settings: Optional[HttpSettings] = None,
+        cache: Optional[DiskCache] = None
+    ):
+        self.service = service
+        self.settings = settings or HttpSettings()
+        self.cache = cache
+        # Las respuestas dependen de los permisos del token: forma parte de la clave
+        self._scope = hashlib.sha256(headers.get("Authorization", "").encode("utf-8")).hexdigest()[:16]
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.settings.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Cuota agotada según la última respuesta: evita peticiones condenadas a fallar
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        # Leer `.text` de una respuesta en streaming la descargaría entera en memoria
+        if self.cache is None or kwargs.get("stream"):
+            return self.request("GET", url, **kwargs)
+
+        key = self._cache_key(url, kwargs.get("params"), kwargs.get("headers"))
+        cached = self.cache.get(key)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.request("GET", url, headers=headers, **kwargs)
+        if cached and response.status_code == 304:
+            return self._from_cache(cached, response)
+
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified) and _is_json(response):
+            self.cache.set(key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": response.headers.get("Content-Type"),
+                # La paginación de GitHub viaja en `Link`, que un 304 no siempre repite
+                "link": response.headers.get("Link"),
+                "body": response.text,
+            })
+        return response
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        timeout = kwargs.pop("timeout", (self.settings.connect_timeout, self.settings.read_timeout))
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        operation = f"{self.service} {method.upper()}"
+        attempt = 0
+
+        while True:
+            self._wait_for_quota(operation)
+            try:
+                response = self.session.request(method, url, timeout=self._bounded(timeout, operation), **kwargs)
+            except requests.ConnectionError as e:
+                if expired():
+                    raise exceeded(operation) from e
+                # Sin conexión la petición no llegó a procesarse: se reintenta siempre
+                if attempt >= self.settings.max_retries:
+                    raise GitProviderException(f"Error de red al conectar con {self.service}: {e}") from e
+            except requests.Timeout as e:
+                if expired():
+                    raise exceeded(operation) from e
+                if not retryable or attempt >= self.settings.max_retries:
+                    raise GitProviderException(
+                        f"{self.service} no respondió en {self.settings.read_timeout} s ({method} {url})"
+                    ) from e
+            else:
+                wait = self._rate_limit_wait(response)
+                if wait is not None:
+                    if wait > self.settings.rate_limit_max_wait or attempt >= self.settings.max_retries:
+                        raise RateLimitException(self.service, wait)
+                    self._sleep(wait, operation)
+                    attempt += 1
+                    continue
+                if response.status_code not in RETRY_STATUSES or not retryable or attempt >= self.settings.max_retries:
+                    return response
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    self._sleep(min(retry_after, self.settings.max_backoff), operation)
+                    attempt += 1
+                    continue
+
+            self._sleep(self._backoff(attempt), operation)
+            attempt += 1
+
+    @staticmethod
+    def _bounded(timeout: Union[float, Tuple[float, float]], operation: str) -> Union[float, Tuple[float, float]]:
+        """Timeout de requests acortado al tiempo que queda del plazo"""
+        if isinstance(timeout, tuple):
+            return tuple(remaining(value, operation=operation) for value in timeout)
+        return remaining(timeout, operation=operation)
+
+    @staticmethod
+    def _sleep(seconds: float, operation: str) -> None:
+        """Espera entre intentos; si no cabe en el plazo se falla ya en lugar de esperar en vano"""
+        left = remaining(operation=operation)
+        if left is not None and seconds >= left:
+            raise exceeded(operation)
+        time.sleep(seconds)
+
+    def _cache_key(self, url: str, params: Optional[dict], headers: Optional[dict]) -> str:
+        # El Accept cambia la representación (JSON, diff...)
+        accept = (headers or {}).get("Accept") or self.session.headers.get("Accept", "")
+        query = urlencode(sorted((params or {}).items()))
+        return f"{self._scope} {accept} {url}?{query}"
+
+    @staticmethod
+    def _from_cache(cached: dict, not_modified: requests.Response) -> requests.Response:
+        """Respuesta 200 reconstruida a partir de la entrada cacheada"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = not_modified.url
+        response.headers.update(not_modified.headers)
+        if cached.get("content_type"):
+            response.headers["Content-Type"] = cached["content_type"]
+        if cached.get("link"):
+            response.headers["Link"] = cached["link"]
+        response._content = cached["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.request = not_modified.request
+        return response
+
+    def _backoff(self, attempt: int) -> float:
+        # Backoff exponencial con jitter completo
+        return random.uniform(0, min(self.settings.max_backoff, self.settings.backoff_factor * 2 ** attempt))
+
+    def _rate_limit_wait(self, response: requests.Response) -> Optional[float]:
+        """Segundos a esperar si la respuesta indica límite de peticiones (None si no)"""
+        reset = _rate_limit_reset(response)
+        if reset is not None:
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, reset)
+        if response.status_code not in RATE_LIMIT_STATUSES:
+            return None
+
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        if reset is not None:
+            return max(0.0, reset - time.time())
+        # Límite secundario de GitHub: 403/429 sin cabeceras de espera
+        if response.status_code == 429 or "rate limit" in response.text.lower():
+            return SECONDARY_RATE_LIMIT_WAIT
+        return None
+
+    def _wait_for_quota(self, operation: str) -> None:
+        wait = self._blocked_until - time.time()
+        if wait <= 0:
+            return
+        if wait > self.settings.rate_limit_max_wait:
+            raise RateLimitException(self.service, wait)
+        self._sleep(wait, operation)
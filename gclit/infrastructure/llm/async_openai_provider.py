@@ -0,0 +1,134 @@
+# gclit/infrastructure/llm/async_openai_provider.py
+import openai
+from typing import List, Optional
+from gclit.domain.deadline import within_deadline
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.domain.ports.llm import AsyncLLMProvider, ServedText, TokenCallback
+from gclit.infrastructure.llm.prompts import (
+    SUMMARY_MAX_TOKENS,
+    build_commit_messages,
+    build_pr_messages,
+    build_summary_messages,
+)
+from gclit.infrastructure.llm.streaming import PullRequestStreamParser, parse_pr_response
+
+CANDIDATES_TEMPERATURE = 0.8
+
+
+def usage_dict(response) -> dict:
+    """Tokens consumidos según la respuesta de la API (vacío si no lo informa)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return {}
+    result = {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens}
+    # Tokens del prompt servidos desde la caché de prefijos del proveedor
+    details = getattr(usage, "prompt_tokens_details", None)
+    if details is not None and getattr(details, "cached_tokens", None) is not None:
+        result["cached_tokens"] = details.cached_tokens
+    return result
+
+
+class AsyncOpenAIProvider(AsyncLLMProvider):
+    def __init__(self, model: str, api_key: str, base_url: Optional[str] = None):
+        self.model = model
+        self.api_key = api_key
+        self.client = openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url)
+        # Parámetros añadidos a todas las peticiones (p. ej. pistas propias de un servidor local)
+        self.request_options: dict = {}
+
+    @property
+    def _operation(self) -> str:
+        return f"LLM {self.model}"
+
+    async def _create(self, **kwargs):
+        # Con --timeout la petición (y los reintentos del cliente) se cancela al agotarse el plazo
+        return await within_deadline(
+            self.client.chat.completions.create(model=self.model, **self.request_options, **kwargs),
+            self._operation
+        )
+
+    async def generate_commit_message(self, context: CommitContext) -> str:
+        response = await self._create(
+            messages=build_commit_messages(context),
+            temperature=0.3,
+            max_tokens=150,
+        )
+
+        return ServedText(response.choices[0].message.content.strip(), usage=usage_dict(response))
+
+    async def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        # Todas las propuestas en una petición; con más temperatura para que difieran
+        response = await self._create(
+            messages=build_commit_messages(context),
+            temperature=0.3 if n == 1 else CANDIDATES_TEMPERATURE,
+            max_tokens=150,
+            n=n,
+        )
+        usage = usage_dict(response)
+        return list(dict.fromkeys(
+            ServedText(choice.message.content.strip(), usage=usage) for choice in response.choices
+        ))
+
+    async def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        started = False
+
+        def on_delta(text: str):
+            nonlocal started
+            if not started:
+                text = text.lstrip()
+                started = bool(text)
+            if text:
+                on_token("message", text)
+
+        content, usage = await self._stream(build_commit_messages(context), on_delta, max_tokens=150)
+        return ServedText(content.strip(), usage=usage)
+
+    async def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        response = await self._create(
+            messages=build_pr_messages(context),
+            temperature=0.3,  # Reducir temperatura para más consistencia
+        )
+
+        result = parse_pr_response(response.choices[0].message.content.strip())
+        result["usage"] = usage_dict(response)
+        return result
+
+    async def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        # El título se muestra en cuanto se completa su línea, la descripción según llega
+        parser = PullRequestStreamParser(on_token)
+        _, usage = await self._stream(build_pr_messages(context), parser.feed)
+        result = parser.result()
+        result["usage"] = usage
+        return result
+
+    async def summarize_changes(self, context: PullRequestContext) -> str:
+        response = await self._create(
+            messages=build_summary_messages(context),
+            temperature=0.3,
+            max_tokens=SUMMARY_MAX_TOKENS,
+        )
+        return response.choices[0].message.content.strip()
+
+    async def _stream(self, messages: list, on_delta, **kwargs):
+        """Petición en streaming: devuelve (texto completo, uso de tokens)"""
+        # El plazo cubre también la lectura de los fragmentos, no solo la respuesta inicial
+        return await within_deadline(self._read_stream(messages, on_delta, **kwargs), self._operation)
+
+    async def _read_stream(self, messages: list, on_delta, **kwargs):
+        stream = await self._create(
+            messages=messages,
+            temperature=0.3,
+            stream=True,
+            stream_options={"include_usage": True},
+            **kwargs
+        )
+        parts, usage = [], {}
+        async for chunk in stream:
+            # El último fragmento no trae `choices`, solo el uso de tokens
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                on_delta(chunk.choices[0].delta.content)
+            if getattr(chunk, "usage", None) is not None:
+                usage = usage_dict(chunk)
+        return "".join(parts), usage
@@ -0,0 +1,104 @@
+# gclit/infrastructure/llm/cached_provider.py
+"""
+Caché de respuestas del LLM direccionada por contenido.
+
+Repetir la misma petición (mensaje de commit rechazado y regenerado,
+`pr generate --dry-run` seguido de la ejecución real, un hook que falla)
+no vuelve a pagar la llamada. La clave combina el patch-id estable del diff
+(un rebase sigue acertando), proveedor, modelo, idioma, ramas y versión de
+la plantilla del prompt. TTL, tamaño máximo y expulsión LRU los gestiona DiskCache.
+"""
+import hashlib
+import json
+from typing import List, Optional
+
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.domain.ports.llm import LLMProvider, ServedText, TokenCallback
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.git.patch_id import stable_patch_id
+from gclit.infrastructure.llm.prompts import build_summary_messages, get_template
+
+
+class CachedLLMProvider(LLMProvider):
+    def __init__(self, provider: LLMProvider, cache: DiskCache, provider_name: str):
+        self.provider = provider
+        self.cache = cache
+        self.provider_name = provider_name
+        self.model = provider.model
+
+    def _key(self, kind: str, lang: str, *parts: str) -> str:
+        version = get_template(kind, lang).version
+        return json.dumps([kind, self.provider_name, self.model, lang, version, *parts])
+
+    def _commit_key(self, context: CommitContext) -> str:
+        return self._key("commit", context.lang, context.branch_name, stable_patch_id(context.diff))
+
+    def _pr_key(self, context: PullRequestContext) -> str:
+        return self._key("pr", context.lang, context.from_branch, context.to_branch, stable_patch_id(context.diff))
+
+    def _get(self, key: str) -> Optional[ServedText]:
+        cached = self.cache.get(key)
+        return ServedText(cached, "cache") if cached is not None else None
+
+    def generate_commit_message(self, context: CommitContext) -> str:
+        key = self._commit_key(context)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        message = self.provider.generate_commit_message(context)
+        self.cache.set(key, message)
+        return message
+
+    def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        # Se piden propuestas nuevas (p. ej. "regenerar"): no se lee ni se escribe la caché
+        return self.provider.generate_commit_messages(context, n)
+
+    def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        key = self._commit_key(context)
+        cached = self._get(key)
+        if cached is not None:
+            on_token("message", cached)
+            return cached
+        message = self.provider.stream_commit_message(context, on_token)
+        self.cache.set(key, message)
+        return message
+
+    def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        key = self._pr_key(context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._cached_pr(cached)
+        return self._store_pr(key, self.provider.generate_pr_documentation(context))
+
+    def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        key = self._pr_key(context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            on_token("title", cached["title"])
+            on_token("body", cached["body"])
+            return self._cached_pr(cached)
+        return self._store_pr(key, self.provider.stream_pr_documentation(context, on_token))
+
+    @staticmethod
+    def _cached_pr(cached: dict) -> dict:
+        # Sin consumo de tokens: la respuesta sale de disco
+        return {**cached, "usage": {}, "cached": True}
+
+    def _store_pr(self, key: str, result: dict) -> dict:
+        # Las respuestas de respaldo (sin `usage`) no salen del modelo: no se guardan
+        if "usage" in result:
+            # Solo título y cuerpo: ni el consumo ni el proveedor que respondió
+            self.cache.set(key, {"title": result["title"], "body": result["body"]})
+        return result
+
+    def summarize_changes(self, context: PullRequestContext) -> str:
+        # Un bloque de map-reduce no es un parche completo: se usa el hash del prompt
+        messages = json.dumps(build_summary_messages(context), sort_keys=True)
+        key = self._key("summary", context.lang, hashlib.sha256(messages.encode("utf-8")).hexdigest())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        summary = self.provider.summarize_changes(context)
+        self.cache.set(key, summary)
+        return summary
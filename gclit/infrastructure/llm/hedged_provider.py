@@ -0,0 +1,169 @@
+# gclit/infrastructure/llm/hedged_provider.py
+"""
+Peticiones cubiertas (hedged) entre varios proveedores de LLM.
+
+Cada petición va al proveedor principal; si no ha respondido (o empezado a
+emitir tokens) en `delay` segundos, la misma petición se lanza también al
+secundario. Gana la primera respuesta y el resto se cancela. Un fallo del
+principal lanza el secundario de inmediato, sin esperar al retardo.
+
+Con streaming gana el primero que emite un token: a partir de ese momento
+solo se reenvían los suyos y ya no se cambia de proveedor.
+"""
+import asyncio
+import threading
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from gclit.domain.exceptions.exception import LLMProviderException
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.domain.ports.llm import AsyncLLMProvider, LLMProvider, ServedText, TokenCallback, usage_of
+from gclit.infrastructure.llm.sync_provider import SyncLLMProvider
+
+# (etiqueta, proveedor) en orden de preferencia
+HedgeMember = Tuple[str, AsyncLLMProvider]
+# Recibe el proveedor y el callback de tokens (None sin streaming)
+HedgeCall = Callable[[AsyncLLMProvider, Optional[TokenCallback]], Awaitable]
+
+
+class ThreadedLLMProvider(AsyncLLMProvider):
+    """
+    AsyncLLMProvider sobre un proveedor solo síncrono: cada llamada corre en un
+    hilo. Cancelarla descarta la respuesta, pero la petición HTTP termina igual.
+    """
+
+    def __init__(self, provider: LLMProvider):
+        self.provider = provider
+        self.model = provider.model
+
+    async def generate_commit_message(self, context: CommitContext) -> str:
+        return await asyncio.to_thread(self.provider.generate_commit_message, context)
+
+    async def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        return await asyncio.to_thread(self.provider.generate_commit_messages, context, n)
+
+    async def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        return await asyncio.to_thread(self.provider.stream_commit_message, context, on_token)
+
+    async def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        return await asyncio.to_thread(self.provider.generate_pr_documentation, context)
+
+    async def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        return await asyncio.to_thread(self.provider.stream_pr_documentation, context, on_token)
+
+    async def summarize_changes(self, context: PullRequestContext) -> str:
+        return await asyncio.to_thread(self.provider.summarize_changes, context)
+
+
+class AsyncHedgedProvider(AsyncLLMProvider):
+    def __init__(self, members: List[HedgeMember], delay: float = 2.0):
+        if not members:
+            raise LLMProviderException("Hedged provider needs at least one provider")
+        self.members = members
+        self.delay = delay
+        # El presupuesto de tokens se calcula con el modelo principal
+        self.model = members[0][1].model
+
+    async def generate_commit_message(self, context: CommitContext) -> str:
+        return await self._hedge(lambda provider, _: provider.generate_commit_message(context))
+
+    async def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        return await self._hedge(lambda provider, _: provider.generate_commit_messages(context, n))
+
+    async def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        return await self._hedge(lambda provider, callback: provider.stream_commit_message(context, callback), on_token)
+
+    async def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        result, winner = await self._hedge_with_winner(
+            lambda provider, _: provider.generate_pr_documentation(context)
+        )
+        return {**result, "provider": winner}
+
+    async def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        result, winner = await self._hedge_with_winner(
+            lambda provider, callback: provider.stream_pr_documentation(context, callback), on_token
+        )
+        return {**result, "provider": winner}
+
+    async def summarize_changes(self, context: PullRequestContext) -> str:
+        return await self._hedge(lambda provider, _: provider.summarize_changes(context))
+
+    async def _hedge(self, call: HedgeCall, on_token: Optional[TokenCallback] = None):
+        """Respuesta del ganador, con su etiqueta en cada texto (ver ServedText)"""
+        result, winner = await self._hedge_with_winner(call, on_token)
+        if isinstance(result, list):
+            return [ServedText(text, winner, usage_of(text)) for text in result]
+        return ServedText(result, winner, usage_of(result))
+
+    async def _hedge_with_winner(self, call: HedgeCall, on_token: Optional[TokenCallback] = None):
+        """Devuelve (respuesta, etiqueta del proveedor que la dio)"""
+        loop = asyncio.get_running_loop()
+        waiting = list(self.members)
+        attempts = {}
+        # Con streaming, el primer proveedor que emite un token se queda la respuesta
+        streaming = {"winner": None}
+        claimed = asyncio.Event()
+        lock = threading.Lock()
+        last_error: Optional[Exception] = None
+
+        def token_callback(label: str) -> Optional[TokenCallback]:
+            if on_token is None:
+                return None
+
+            def forward(field: str, text: str):
+                # Los proveedores en hilos (ThreadedLLMProvider) avisan desde fuera del bucle
+                with lock:
+                    if streaming["winner"] is None:
+                        streaming["winner"] = label
+                        loop.call_soon_threadsafe(claimed.set)
+                if streaming["winner"] == label:
+                    on_token(field, text)
+            return forward
+
+        def launch():
+            label, provider = waiting.pop(0)
+            attempts[asyncio.ensure_future(call(provider, token_callback(label)))] = label
+
+        launch()
+        claim = asyncio.ensure_future(claimed.wait())
+        hedge_at = loop.time() + self.delay
+        try:
+            while attempts:
+                timeout = max(0.0, hedge_at - loop.time()) if waiting and streaming["winner"] is None else None
+                watched = [*attempts] if claim.done() else [*attempts, claim]
+                done, _ = await asyncio.wait(watched, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    hedge_at = loop.time() + self.delay
+                    continue
+
+                for task in done - {claim}:
+                    label = attempts.pop(task)
+                    if task.exception() is None:
+                        return task.result(), label
+                    last_error = task.exception()
+                    if label == streaming["winner"]:
+                        # Sus tokens ya se han mostrado: no se puede cambiar de proveedor
+                        raise last_error
+                    if waiting and streaming["winner"] is None:
+                        launch()
+                        hedge_at = loop.time() + self.delay
+
+                if streaming["winner"] is not None:
+                    # Solo queda esperar al ganador; los demás se cancelan ya
+                    for task, label in list(attempts.items()):
+                        if label != streaming["winner"]:
+                            task.cancel()
+                            del attempts[task]
+            raise last_error
+        finally:
+            claim.cancel()
+            for task in attempts:
+                task.cancel()
+
+
+class HedgedProvider(SyncLLMProvider):
+    """Adaptador síncrono de AsyncHedgedProvider para los comandos actuales"""
+
+    def __init__(self, members: List[HedgeMember], delay: float = 2.0):
+        super().__init__(AsyncHedgedProvider(members, delay=delay))
@@ -0,0 +1,63 @@
+# gclit/infrastructure/llm/local_provider.py
+"""
+Proveedor para un servidor local compatible con la API de OpenAI (Ollama,
+llama.cpp, LM Studio, vLLM...). Sin dependencia de red externa: pensado
+para entornos aislados y diffs pequeños con modelos de ~7B.
+"""
+import threading
+from typing import Optional
+
+import requests
+
+from gclit.infrastructure.llm.async_openai_provider import AsyncOpenAIProvider
+from gclit.infrastructure.llm.sync_provider import SyncLLMProvider
+
+# La carga del modelo puede tardar; si no termina, la primera petición la completará
+WARM_UP_TIMEOUT = 120
+
+
+class AsyncLocalProvider(AsyncOpenAIProvider):
+    def __init__(
+        self,
+        model: str,
+        endpoint: str,
+        api_key: str = "",
+        keep_alive: Optional[str] = "30m",
+        warm_up: bool = True
+    ):
+        self.root = endpoint.rstrip("/").removesuffix("/v1")
+        # Los servidores locales no validan la clave, pero el cliente exige una
+        super().__init__(model=model, api_key=api_key or "local", base_url=f"{self.root}/v1")
+        self.keep_alive = keep_alive
+        if keep_alive:
+            # Ollama mantiene el modelo en memoria ese tiempo tras cada petición
+            self.request_options = {"extra_body": {"keep_alive": keep_alive}}
+        if warm_up:
+            threading.Thread(target=self._warm_up, name="gclit-warm-up", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """
+        Pide a Ollama que cargue el modelo mientras la CLI recopila el diff,
+        de modo que la primera petición no pague la carga.
+        """
+        body = {"model": self.model}
+        if self.keep_alive:
+            body["keep_alive"] = self.keep_alive
+        try:
+            requests.post(f"{self.root}/api/generate", json=body, timeout=WARM_UP_TIMEOUT)
+        except requests.RequestException:
+            # Otro servidor compatible sin esa ruta, o aún no arrancado
+            pass
+
+
+class LocalProvider(SyncLLMProvider):
+    """Adaptador síncrono de AsyncLocalProvider para los comandos actuales"""
+
+    def __init__(self, model: str, endpoint: str, api_key: str = "", keep_alive: Optional[str] = "30m", warm_up: bool = True):
+        super().__init__(AsyncLocalProvider(
+            model=model,
+            endpoint=endpoint,
+            api_key=api_key,
+            keep_alive=keep_alive,
+            warm_up=warm_up
+        ))
@@ -1,11 +1,25 @@
-# gclit/infrastructure/llm/openai_provider.py
+# gclit/infrastructure/llm/openai_with_func_provider.py
 import openai
+from gclit.domain.deadline import exceeded, expired, remaining
+from gclit.domain.exceptions.exception import LLMProviderException
 from gclit.domain.models.commit_message import CommitContext
 from gclit.domain.models.pull_request import PullRequestContext
-from gclit.domain.ports.llm import LLMProvider
+from gclit.domain.ports.llm import LLMProvider, ServedText
+from gclit.infrastructure.llm.async_openai_provider import CANDIDATES_TEMPERATURE, usage_dict
+from gclit.infrastructure.llm.prompts import (
+    SUMMARY_MAX_TOKENS,
+    build_commit_messages,
+    build_pr_messages,
+    build_summary_messages,
+)
 
 from pydantic import BaseModel, Field, ValidationError
-from typing import Optional
+from typing import List
+
+
+# Respuesta recibida pero sin el esquema esperado (sin `parsed`, cortada por longitud...):
+# solo en esos casos se recurre al mensaje genérico
+UNPARSEABLE_ERRORS = (ValidationError, AttributeError, openai.OpenAIError)
 
 
 class CommitMessageResponse(BaseModel):
@@ -34,148 +48,68 @@ class OpenAIWithFuncProvider(LLMProvider):
         self.api_key = api_key
         self.client = openai.OpenAI(api_key=self.api_key)
 
-    def generate_commit_message(self, context: CommitContext) -> str:
-        lang_prompts = {
-            "en": {
-                "system": "You are an expert Git commit message generator. Create concise, descriptive commit messages following conventional commits format when appropriate.",
-                "instructions": "Generate a Git commit message based on the provided information",
-                "diff_label": "Code changes",
-                "branch_label": "Branch",
-                "history_label": "Recent commit history for context",
-                "guidelines": """
-                    Guidelines:
-                    - Use imperative mood (e.g., "Add", "Fix", "Update", not "Added", "Fixed", "Updated")
-                    - Keep the subject line under 72 characters
-                    - Use conventional commits format when appropriate (feat:, fix:, docs:, style:, refactor:, test:, chore:)
-                    - Be specific about what changed
-                    - Consider the branch name and commit history for context
-                    - Focus on the 'why' and 'what', not the 'how'
-                """
-            },
-            "es": {
-                "system": "Eres un experto generador de mensajes de commit de Git. Crea mensajes de commit concisos y descriptivos siguiendo el formato de commits convencionales cuando sea apropiado.",
-                "instructions": "Genera un mensaje de commit de Git basado en la información proporcionada",
-                "diff_label": "Cambios en el código",
-                "branch_label": "Rama",
-                "history_label": "Historial de commits recientes para contexto",
-                "guidelines": """
-                    Pautas:
-                    - Usa modo imperativo (ej: "Agregar", "Corregir", "Actualizar", no "Agregado", "Corregido", "Actualizado")
-                    - Mantén la línea de asunto bajo 72 caracteres
-                    - Usa formato de commits convencionales cuando sea apropiado (feat:, fix:, docs:, style:, refactor:, test:, chore:)
-                    - Sé específico sobre lo que cambió
-                    - Considera el nombre de la rama y el historial de commits para contexto
-                    - Enfócate en el 'por qué' y 'qué', no en el 'cómo'
-                """
-            }
-        }
-
-        texts = lang_prompts.get(context.lang, lang_prompts["en"])
-
-        prompt_parts = [
-            texts["instructions"] + ":\n",
-            f"**{texts['branch_label']}:** {context.branch_name}",
-        ]
-
-        if context.commit_history:
-            prompt_parts.append(f"**{texts['history_label']}:**")
-            prompt_parts.append(context.commit_history)
-            prompt_parts.append("")
+    def _client(self) -> openai.OpenAI:
+        """Con --timeout, cada petición se acota al plazo restante y no se reintenta"""
+        left = remaining(operation=self._operation)
+        return self.client if left is None else self.client.with_options(timeout=left, max_retries=0)
 
-        prompt_parts.extend([
-            f"**{texts['diff_label']}:**",
-            "```diff",
-            context.diff,
-            "```",
-            "",
-            texts["guidelines"]
-        ])
-
-        prompt = "\n".join(prompt_parts)
+    @property
+    def _operation(self) -> str:
+        return f"LLM {self.model}"
 
+    def generate_commit_message(self, context: CommitContext) -> str:
+        client = self._client()
         try:
-            response = self.client.beta.chat.completions.parse(
+            response = client.beta.chat.completions.parse(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": texts["system"]},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=build_commit_messages(context, with_format=False),
                 response_format=CommitMessageResponse,
                 temperature=0.3,
                 max_tokens=150,
             )
 
             commit_response = response.choices[0].message.parsed
-            return commit_response.message
+            return ServedText(commit_response.message, usage=usage_dict(response))
 
-        except ValidationError as e:
+        except openai.BadRequestError as e:
+            self._raise_if_context_overflow(e)
             return self._fallback_commit_message(context)
-        except Exception as e:
+        except openai.APIError as e:
+            raise self._api_error(e) from e
+        except UNPARSEABLE_ERRORS:
             return self._fallback_commit_message(context)
 
-    def generate_pr_documentation(self, context: PullRequestContext) -> dict:
-        lang_prompts = {
-            "en": {
-                "system": "You are an expert Git assistant specialized in creating clear, actionable Pull Request documentation.",
-                "title_guidelines": """
-                    For the title:
-                    - Create a specific, actionable title that describes WHAT was changed
-                    - Use imperative mood (e.g., "Add user authentication", "Refactor payment processing")
-                    - Keep it under 60 characters
-                    - Be specific about the component/feature affected
-                    - Avoid generic words like "update", "change", "modify"
-                """,
-                "description_guidelines": """
-                    For the description:
-                    - Start with a clear summary of the purpose/motivation
-                    - List the most important technical changes
-                    - Include any breaking changes or migration notes if applicable
-                    - Use markdown formatting for readability
-                """
-            },
-            "es": {
-                "system": "Eres un experto asistente de Git especializado en crear documentación clara y accionable de Pull Requests.",
-                "title_guidelines": """
-                    Para el título:
-                    - Crea un título específico y accionable que describa QUÉ se cambió
-                    - Usa modo imperativo (ej: "Agregar autenticación de usuario", "Refactorizar procesamiento de pagos")
-                    - Mantén menos de 60 caracteres
-                    - Sé específico sobre el componente/característica afectada
-                    - Evita palabras genéricas como "actualizar", "cambiar", "modificar"
-                """,
-                "description_guidelines": """
-                    Para la descripción:
-                    - Comienza con un resumen claro del propósito/motivación
-                    - Lista los cambios técnicos más importantes
-                    - Incluye cualquier cambio disruptivo o notas de migración si aplica
-                    - Usa formato markdown para legibilidad
-                """
-            }
-        }
-
-        texts = lang_prompts.get(context.lang, lang_prompts["en"])
-
-        prompt = f"""
-            {texts["system"]}
-
-            {texts["title_guidelines"]}
-
-            {texts["description_guidelines"]}
-
-            ### Context:
-            - Language: {context.lang}
-            - Source branch: `{context.from_branch}` 
-            - Target branch: `{context.to_branch}`
-            - Historical context: {context.commit_history if hasattr(context, 'commit_history') else 'Not available'}
-
-            ### Git Diff:
-            {context.diff}
-        """
+    def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        client = self._client()
+        try:
+            response = client.beta.chat.completions.parse(
+                model=self.model,
+                messages=build_commit_messages(context, with_format=False),
+                response_format=CommitMessageResponse,
+                temperature=0.3 if n == 1 else CANDIDATES_TEMPERATURE,
+                max_tokens=150,
+                n=n,
+            )
+            usage = usage_dict(response)
+            messages = [
+                ServedText(choice.message.parsed.message, usage=usage)
+                for choice in response.choices if choice.message.parsed
+            ]
+        except openai.BadRequestError as e:
+            self._raise_if_context_overflow(e)
+            messages = []
+        except openai.APIError as e:
+            raise self._api_error(e) from e
+        except UNPARSEABLE_ERRORS:
+            messages = []
+        return list(dict.fromkeys(messages)) or [self._fallback_commit_message(context)]
 
+    def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        client = self._client()
         try:
-            response = self.client.beta.chat.completions.parse(
+            response = client.beta.chat.completions.parse(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=build_pr_messages(context, with_format=False),
                 response_format=PullRequestResponse,
                 temperature=0.3,
             )
@@ -183,14 +117,44 @@ class OpenAIWithFuncProvider(LLMProvider):
             pr_response = response.choices[0].message.parsed
             return {
                 "title": pr_response.title,
-                "body": pr_response.body
+                "body": pr_response.body,
+                "usage": usage_dict(response)
             }
 
-        except ValidationError as e:
+        except openai.BadRequestError as e:
+            self._raise_if_context_overflow(e)
             return self._fallback_pr_documentation(context)
-        except Exception as e:
+        except openai.APIError as e:
+            raise self._api_error(e) from e
+        except UNPARSEABLE_ERRORS:
             return self._fallback_pr_documentation(context)
 
+    def summarize_changes(self, context: PullRequestContext) -> str:
+        try:
+            response = self._client().chat.completions.create(
+                model=self.model,
+                messages=build_summary_messages(context),
+                temperature=0.3,
+                max_tokens=SUMMARY_MAX_TOKENS,
+            )
+        except openai.APIError as e:
+            raise self._api_error(e) from e
+        return response.choices[0].message.content.strip()
+
+    def _api_error(self, error: openai.APIError) -> Exception:
+        """Los fallos de la API (red, timeout, cuota) no deben pasar por una respuesta válida"""
+        if isinstance(error, openai.APITimeoutError) and expired():
+            return exceeded(self._operation)
+        return LLMProviderException(f"OpenAI request failed: {error}")
+
+    def _raise_if_context_overflow(self, error: openai.BadRequestError):
+        """Un prompt demasiado grande no debe ocultarse tras el fallback genérico"""
+        if getattr(error, "code", None) == "context_length_exceeded":
+            raise LLMProviderException(
+                f"The prompt exceeds the context window of {self.model}. "
+                "Lower budget.max_prompt_tokens or use --explain-budget to inspect it."
+            ) from error
+
     def _fallback_commit_message(self, context: CommitContext) -> str:
         """Fallback method for commit message generation"""
         return f"Update {context.branch_name.replace('-', ' ').replace('_', ' ')}"
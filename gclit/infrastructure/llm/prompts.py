@@ -0,0 +1,219 @@
+# gclit/infrastructure/llm/prompts.py
+"""
+Registro de plantillas de prompt, versionadas por comando e idioma.
+
+Cada plantilla separa la parte fija (rol, pautas y formato de respuesta),
+que va en el mensaje de sistema, de los datos de la petición (ramas,
+historial, diff), que van al final. Así todas las llamadas de un mismo
+comando comparten un prefijo idéntico y el proveedor puede reutilizar su
+caché de prefijos. Las plantillas se construyen una sola vez al importar
+el módulo.
+"""
+from textwrap import dedent
+from typing import Dict, List, Optional, Tuple
+
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+
+SUMMARY_MAX_TOKENS = 400
+
+
+class PromptTemplate:
+    def __init__(
+        self,
+        command: str,
+        lang: str,
+        version: str,
+        system: str,
+        guidelines: str,
+        labels: Dict[str, str],
+        response_format: str = ""
+    ):
+        self.command = command
+        self.lang = lang
+        # Cambiar el texto obliga a subir la versión: es parte de la clave de la caché de respuestas
+        self.version = version
+        self.labels = labels
+        static = [dedent(system).strip(), dedent(guidelines).strip()]
+        # Con salida estructurada (function calling) el formato lo fija el esquema
+        self.system_without_format = "\n\n".join(static)
+        self.system = "\n\n".join(static + [dedent(response_format).strip()]) if response_format else self.system_without_format
+
+    def messages(self, fields: List[Tuple[str, Optional[str]]], with_format: bool = True) -> list:
+        """Mensajes con la parte fija primero; `fields` son (etiqueta, valor) y se omiten los vacíos"""
+        user = "\n\n".join(f"**{self.labels[key]}:**\n{value}" for key, value in fields if value)
+        return [
+            {"role": "system", "content": self.system if with_format else self.system_without_format},
+            {"role": "user", "content": user},
+        ]
+
+
+_TEMPLATES = [
+    PromptTemplate(
+        command="commit",
+        lang="en",
+        version="2",
+        system="You are an expert Git commit message generator. Create concise, descriptive commit messages following conventional commits format when appropriate.",
+        guidelines="""
+            Generate a Git commit message based on the information provided by the user.
+
+            Guidelines:
+            - Use imperative mood (e.g., "Add", "Fix", "Update", not "Added", "Fixed", "Updated")
+            - Keep the subject line under 72 characters
+            - Use conventional commits format when appropriate (feat:, fix:, docs:, style:, refactor:, test:, chore:)
+            - Be specific about what changed
+            - Consider the branch name and commit history for context
+            - Focus on the 'why' and 'what', not the 'how'
+        """,
+        response_format="""
+            Response format:
+            - Return ONLY the commit message text, without any markdown formatting
+            - Provide just the plain text commit message, without code blocks
+            - Do not wrap the response in backticks or code blocks
+        """,
+        labels={"branch": "Branch", "history": "Recent commit history for context", "diff": "All code changes"},
+    ),
+    PromptTemplate(
+        command="commit",
+        lang="es",
+        version="2",
+        system="Eres un experto generador de mensajes de commit de Git. Crea mensajes de commit concisos y descriptivos siguiendo el formato de commits convencionales cuando sea apropiado.",
+        guidelines="""
+            Genera un mensaje de commit de Git basado en la información que proporciona el usuario.
+
+            Pautas:
+            - Usa modo imperativo (ej: "Agregar", "Corregir", "Actualizar", no "Agregado", "Corregido", "Actualizado")
+            - Mantén la línea de asunto bajo 72 caracteres
+            - Usa formato de commits convencionales cuando sea apropiado (feat:, fix:, docs:, style:, refactor:, test:, chore:)
+            - Sé específico sobre lo que cambió
+            - Considera el nombre de la rama y el historial de commits para contexto
+            - Enfócate en el 'por qué' y 'qué', no en el 'cómo'
+        """,
+        response_format="""
+            Formato de respuesta:
+            - Devuelve SOLO el texto del mensaje de commit, sin formato Markdown
+            - Proporciona solo el texto sin formato del mensaje de commit, sin bloques de código
+            - No encierres la respuesta entre comillas invertidas ni bloques de código
+        """,
+        labels={"branch": "Rama", "history": "Historial de commits recientes para contexto", "diff": "Todos los cambios en el código"},
+    ),
+    PromptTemplate(
+        command="pr",
+        lang="en",
+        version="2",
+        system="You are an expert Git assistant specialized in creating clear, actionable Pull Request documentation.",
+        guidelines="""
+            Write the title and the description in English.
+
+            **IMPORTANT for the title:**
+            - Create a specific, actionable title that describes WHAT was changed, not just "update" or "fix"
+            - Use imperative mood (e.g., "Add user authentication", "Refactor payment processing", "Fix memory leak in parser")
+            - Keep it under 60 characters
+            - Be specific about the component/feature affected
+            - Avoid generic words like "update", "change", "modify" unless they're the most accurate
+
+            **For the description:**
+            - Start with a clear summary of the purpose/motivation
+            - List the most important technical changes (avoid formatting/whitespace noise)
+            - Include any breaking changes or migration notes if applicable
+            - Use markdown formatting for readability
+        """,
+        response_format="""
+            Please respond EXACTLY in the following format (do not change the headers):
+            **Title:** [your specific, actionable title here]
+
+            **Description:**
+            [your markdown description here]
+        """,
+        labels={"branches": "Branches", "history": "Historical context", "diff": "Git Diff"},
+    ),
+    PromptTemplate(
+        command="pr",
+        lang="es",
+        version="2",
+        system="Eres un experto asistente de Git especializado en crear documentación clara y accionable de Pull Requests.",
+        guidelines="""
+            Escribe el título y la descripción en español.
+
+            **IMPORTANTE para el título:**
+            - Crea un título específico y accionable que describa QUÉ se cambió, no solo "actualizar" o "corregir"
+            - Usa modo imperativo (ej: "Agregar autenticación de usuario", "Refactorizar procesamiento de pagos")
+            - Mantén menos de 60 caracteres
+            - Sé específico sobre el componente/característica afectada
+            - Evita palabras genéricas como "actualizar", "cambiar", "modificar" salvo que sean las más precisas
+
+            **Para la descripción:**
+            - Comienza con un resumen claro del propósito/motivación
+            - Lista los cambios técnicos más importantes (sin ruido de formato o espacios)
+            - Incluye cualquier cambio disruptivo o notas de migración si aplica
+            - Usa formato markdown para legibilidad
+        """,
+        response_format="""
+            Responde EXACTAMENTE en el siguiente formato (no cambies las cabeceras, déjalas en inglés):
+            **Title:** [tu título específico y accionable]
+
+            **Description:**
+            [tu descripción en markdown]
+        """,
+        labels={"branches": "Ramas", "history": "Contexto histórico", "diff": "Diff de Git"},
+    ),
+    PromptTemplate(
+        command="summary",
+        lang="en",
+        version="2",
+        system="You are an expert code reviewer who summarises parts of large pull requests.",
+        guidelines="""
+            The user sends one part of a pull request too large to review at once.
+            Summarise it for someone who will write the PR description:
+            - List the behavioural and API changes, grouped by component
+            - Mention breaking changes, migrations and new dependencies
+            - Skip formatting and whitespace noise
+            - Use at most 200 words of plain markdown bullets
+        """,
+        labels={"branches": "Branches", "diff": "Changes"},
+    ),
+    PromptTemplate(
+        command="summary",
+        lang="es",
+        version="2",
+        system="Eres un revisor de código experto que resume partes de Pull Requests grandes.",
+        guidelines="""
+            El usuario envía una parte de un Pull Request demasiado grande para revisarlo de una vez.
+            Resúmela para quien escribirá la descripción del PR:
+            - Enumera los cambios de comportamiento y de API, agrupados por componente
+            - Menciona cambios disruptivos, migraciones y nuevas dependencias
+            - Omite el ruido de formato y espacios
+            - Usa como máximo 200 palabras en viñetas markdown
+        """,
+        labels={"branches": "Ramas", "diff": "Cambios"},
+    ),
+]
+
+TEMPLATES: Dict[Tuple[str, str], PromptTemplate] = {(t.command, t.lang): t for t in _TEMPLATES}
+
+
+def get_template(command: str, lang: str) -> PromptTemplate:
+    return TEMPLATES.get((command, lang)) or TEMPLATES[(command, "en")]
+
+
+def build_commit_messages(context: CommitContext, with_format: bool = True) -> list:
+    return get_template("commit", context.lang).messages([
+        ("branch", context.branch_name),
+        ("history", context.commit_history),
+        ("diff", f"```diff\n{context.diff_text()}\n```"),
+    ], with_format=with_format)
+
+
+def build_pr_messages(context: PullRequestContext, with_format: bool = True) -> list:
+    return get_template("pr", context.lang).messages([
+        ("branches", f"`{context.from_branch}` → `{context.to_branch}`"),
+        ("history", context.commit_history),
+        ("diff", context.diff_text()),
+    ], with_format=with_format)
+
+
+def build_summary_messages(context: PullRequestContext) -> list:
+    return get_template("summary", context.lang).messages([
+        ("branches", f"`{context.from_branch}` → `{context.to_branch}`"),
+        ("diff", context.diff_text()),
+    ])
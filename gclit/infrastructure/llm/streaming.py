@@ -0,0 +1,82 @@
+# gclit/infrastructure/llm/streaming.py
+"""
+Lectura de la respuesta de PR en formato `**Title:**` / `**Description:**`,
+completa o incremental mientras llegan los tokens.
+"""
+from typing import List
+
+from gclit.domain.ports.llm import TokenCallback
+
+TITLE_HEADERS = ("**title:**", "### title:")
+DESCRIPTION_HEADERS = ("**description:**", "### description:")
+
+
+def _title(line: str) -> str:
+    # Se quita la cabecera completa: `split(':')` dejaba los `**` de cierre en el título
+    header = next(header for header in TITLE_HEADERS if line.lower().startswith(header))
+    return line[len(header):].strip()
+
+
+def parse_pr_response(content: str) -> dict:
+    lines = content.split('\n')
+    title = ""
+    body_lines = []
+
+    in_description = False
+    for line in lines:
+        if line.lower().startswith(TITLE_HEADERS):
+            title = _title(line)
+        elif line.lower().startswith(DESCRIPTION_HEADERS):
+            in_description = True
+        elif in_description:
+            body_lines.append(line)
+
+    if not title:
+        # Fallback: tomar la primera línea no vacía
+        title = next((line.strip() for line in lines if line.strip()), "Update changes")
+
+    return {"title": title, "body": '\n'.join(body_lines).strip()}
+
+
+class PullRequestStreamParser:
+    """
+    Emite el título en cuanto su línea está completa y la descripción
+    fragmento a fragmento. El resultado final lo da `parse_pr_response`
+    sobre el texto completo, igual que sin streaming.
+    """
+
+    def __init__(self, on_token: TokenCallback):
+        self.on_token = on_token
+        self._chunks: List[str] = []
+        self._line = ""
+        self._in_description = False
+        self._body_started = False
+
+    def feed(self, text: str) -> None:
+        self._chunks.append(text)
+        if self._in_description:
+            self._emit_body(text)
+            return
+
+        self._line += text
+        while "\n" in self._line and not self._in_description:
+            line, self._line = self._line.split("\n", 1)
+            if line.lower().startswith(TITLE_HEADERS):
+                self.on_token("title", _title(line))
+            elif line.lower().startswith(DESCRIPTION_HEADERS):
+                self._in_description = True
+        if self._in_description and self._line:
+            pending, self._line = self._line, ""
+            self._emit_body(pending)
+
+    def _emit_body(self, text: str) -> None:
+        if not self._body_started:
+            # Las líneas en blanco tras la cabecera no se muestran
+            text = text.lstrip()
+            if not text:
+                return
+            self._body_started = True
+        self.on_token("body", text)
+
+    def result(self) -> dict:
+        return parse_pr_response("".join(self._chunks).strip())
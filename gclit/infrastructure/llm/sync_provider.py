@@ -0,0 +1,36 @@
+# gclit/infrastructure/llm/sync_provider.py
+from typing import List
+
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.domain.ports.llm import AsyncLLMProvider, LLMProvider, TokenCallback
+from gclit.infrastructure.event_loop import run_sync
+
+
+class SyncLLMProvider(LLMProvider):
+    """
+    Puerto síncrono sobre un AsyncLLMProvider: cada llamada se ejecuta en el
+    bucle compartido. Los callbacks de `on_token` llegan desde ese bucle.
+    """
+
+    def __init__(self, provider: AsyncLLMProvider):
+        self.provider = provider
+        self.model = provider.model
+
+    def generate_commit_message(self, context: CommitContext) -> str:
+        return run_sync(self.provider.generate_commit_message(context))
+
+    def generate_commit_messages(self, context: CommitContext, n: int) -> List[str]:
+        return run_sync(self.provider.generate_commit_messages(context, n))
+
+    def stream_commit_message(self, context: CommitContext, on_token: TokenCallback) -> str:
+        return run_sync(self.provider.stream_commit_message(context, on_token))
+
+    def generate_pr_documentation(self, context: PullRequestContext) -> dict:
+        return run_sync(self.provider.generate_pr_documentation(context))
+
+    def stream_pr_documentation(self, context: PullRequestContext, on_token: TokenCallback) -> dict:
+        return run_sync(self.provider.stream_pr_documentation(context, on_token))
+
+    def summarize_changes(self, context: PullRequestContext) -> str:
+        return run_sync(self.provider.summarize_changes(context))
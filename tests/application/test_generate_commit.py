@@ -0,0 +1,78 @@
+# tests/application/test_generate_commit.py
+import pytest
+
+from gclit.application.use_cases.generate_commit import GenerateCommitMessage
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.llm.cached_provider import CachedLLMProvider
+
+DIFF = "diff --git a/app.py b/app.py\n--- a/app.py\n+++ b/app.py\n@@ -1 +1 @@\n-x = 1\n+x = 2\n"
+
+
+class CountingGitProvider:
+    def __init__(self):
+        self.diffs = 0
+
+    def get_stash_diff(self):
+        self.diffs += 1
+        return DIFF
+
+    def get_recent_commits(self, branch=None, limit=5):
+        return "abc123 previous commit"
+
+    def get_branch_name(self):
+        return "feature"
+
+
+class SequenceLLMProvider:
+    """Cada respuesta es distinta: permite saber si vino del modelo o de la caché"""
+    model = "gpt-4o"
+
+    def __init__(self):
+        self.requests = []
+
+    def generate_commit_message(self, context):
+        self.requests.append(1)
+        return f"fix: message {len(self.requests)}"
+
+    def generate_commit_messages(self, context, n):
+        self.requests.append(n)
+        return [f"fix: candidate {len(self.requests)}.{i}" for i in range(1, n + 1)]
+
+
+@pytest.fixture
+def use_case(tmp_path):
+    git_provider, llm = CountingGitProvider(), SequenceLLMProvider()
+    provider = CachedLLMProvider(llm, DiskCache(tmp_path / "llm"), provider_name="openai")
+    return GenerateCommitMessage(provider, git_provider), git_provider, llm
+
+
+def test_candidates_come_from_one_request(use_case):
+    use_case, _, llm = use_case
+
+    messages = use_case.generate_candidates(candidates=3)
+
+    assert messages == ["fix: candidate 1.1", "fix: candidate 1.2", "fix: candidate 1.3"]
+    assert llm.requests == [3]
+
+
+def test_regenerate_bypasses_the_response_cache_and_reuses_the_context(use_case):
+    use_case, git_provider, llm = use_case
+    assert use_case.execute() == "fix: message 1"
+    # Un segundo `commit generate` con el mismo diff sale de la caché
+    assert use_case.execute() == "fix: message 1"
+    assert llm.requests == [1]
+
+    assert use_case.regenerate() == ["fix: candidate 2.1"]
+    assert use_case.regenerate(candidates=2) == ["fix: candidate 3.1", "fix: candidate 3.2"]
+
+    assert llm.requests == [1, 1, 2]
+    assert git_provider.diffs == 2
+
+
+def test_regenerate_in_another_language_rebuilds_the_context(use_case):
+    use_case, git_provider, _ = use_case
+    use_case.generate_candidates(candidates=2)
+
+    use_case.regenerate(lang="es")
+
+    assert git_provider.diffs == 2
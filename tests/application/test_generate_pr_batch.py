@@ -0,0 +1,154 @@
+# tests/application/test_generate_pr_batch.py
+import threading
+
+import pytest
+
+from gclit.application.use_cases.generate_pr_batch import GeneratePullRequestDocsBatch
+from gclit.application.use_cases.generate_pr_docs import GeneratePullRequestDocs
+from gclit.domain.models.pull_request import PullRequestInfo
+from tests.conftest import LocalGitAdapter, git
+
+BRANCHES = {1: "whitespace", 2: "feature"}
+
+
+class BatchGitAdapter(LocalGitAdapter):
+    """Los PRs 1 y 2 apuntan a ramas locales; ambos eligen opciones antes de leer el diff"""
+
+    def __init__(self):
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def get_pr_diff_by_number(self, pr_number):
+        return PullRequestInfo(pr_number=pr_number, from_branch=BRANCHES[pr_number], to_branch="main")
+
+    def _diff_flags(self, kept, whitespace):
+        choice = super()._diff_flags(kept, whitespace)
+        self.barrier.wait()
+        return choice
+
+
+class RecordingLLMProvider:
+    model = "gpt-4o"
+
+    def __init__(self):
+        self.diffs = {}
+
+    def generate_pr_documentation(self, context):
+        self.diffs[context.from_branch] = context.diff
+        return {"title": f"Docs for {context.from_branch}", "body": "Body"}
+
+
+def _branch(name: str, path: str, text: str) -> None:
+    git("checkout", "-q", "-b", name, "main")
+    with open(path, "w") as f:
+        f.write(text)
+    git("commit", "-q", "-am", name)
+    git("checkout", "-q", "main")
+
+
+def test_concurrent_prs_keep_their_own_diff_mode(git_repo):
+    body = "".join(f"value_{i} = {i}\n" for i in range(50))
+    (git_repo / "app.py").write_text(body)
+    git("add", "app.py")
+    git("commit", "-q", "-m", "app")
+    _branch("whitespace", "app.py", "".join(f"    {line}" for line in body.splitlines(True)))
+    _branch("feature", "app.py", body.replace("= 1", "= 100"))
+
+    adapter, llm, use_cases = BatchGitAdapter(), RecordingLLMProvider(), []
+
+    def factory():
+        use_cases.append(GeneratePullRequestDocs(llm, adapter))
+        return use_cases[-1]
+
+    result = GeneratePullRequestDocsBatch(adapter, factory, concurrency=2).execute(pr_numbers=[1, 2])
+
+    assert [item["status"] for item in result["items"]] == ["generated", "generated"]
+    assert "whitespace-only change" in llm.diffs["whitespace"]
+    assert "whitespace-only change" not in llm.diffs["feature"]
+    assert "+value_1 = 100" in llm.diffs["feature"]
+    modes = sorted(use_case.diagnostics["diff_mode"] for use_case in use_cases)
+    assert modes == ["full", "full, whitespace-only"]
+
+
+class FakeBatchGitProvider:
+    """PRs 1-3 con ramas y diffs propios; el 2 no tiene diff disponible"""
+
+    def __init__(self):
+        self.updates = []
+
+    def get_pr_diff_by_number(self, pr_number):
+        return PullRequestInfo(pr_number=pr_number, from_branch=f"feature-{pr_number}", to_branch="main")
+
+    def get_branch_diff(self, from_branch, to_branch):
+        if from_branch == "feature-2":
+            raise RuntimeError("git exploded")
+        return f"diff --git a/{from_branch}.py b/{from_branch}.py\n@@ -0,0 +1 @@\n+x\n"
+
+    def get_recent_commits(self, branch=None, limit=5):
+        return ""
+
+    def list_prs(self, base=None):
+        return iter([
+            PullRequestInfo(pr_number=1, from_branch="feature-1", to_branch="release/1.0"),
+            PullRequestInfo(pr_number=3, from_branch="feature-3", to_branch="release/2.0", generated=True),
+            PullRequestInfo(pr_number=4, from_branch="feature-4", to_branch="main"),
+        ])
+
+    def update_prs(self, updates):
+        self.updates.extend(updates)
+        return {number: "forbidden" if number == 3 else None for number, _, _ in updates}
+
+
+class UsageLLMProvider:
+    model = "gpt-4o"
+
+    def generate_pr_documentation(self, context):
+        return {
+            "title": f"Docs for {context.from_branch}",
+            "body": "Body",
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20, "cached_tokens": 64},
+        }
+
+
+@pytest.fixture
+def batch():
+    git_provider = FakeBatchGitProvider()
+    factory = lambda: GeneratePullRequestDocs(UsageLLMProvider(), git_provider)  # noqa: E731
+    return GeneratePullRequestDocsBatch(git_provider, factory, concurrency=3), git_provider
+
+
+def test_a_failing_pr_does_not_affect_the_others(batch):
+    use_case, git_provider = batch
+
+    items = use_case.execute(pr_numbers=[1, 2, 3])["items"]
+
+    assert [(item["pr_number"], item["status"]) for item in items] == [(1, "generated"), (2, "error"), (3, "generated")]
+    assert items[0]["title"] == "Docs for feature-1"
+    assert items[2]["title"] == "Docs for feature-3"
+    assert "git exploded" in items[1]["error"]
+    assert (items[0]["tokens"], items[0]["cached_tokens"]) == (120, 64)
+    assert items[1]["tokens"] == 0
+    assert use_case.diagnostics == {"prs": 3, "failed": 1}
+    assert git_provider.updates == []
+
+
+def test_updates_are_sent_together_and_reported_per_pr(batch):
+    use_case, git_provider = batch
+
+    items = use_case.execute(pr_numbers=[1, 2, 3], auto_confirm=True)["items"]
+
+    assert [number for number, _, _ in git_provider.updates] == [1, 3]
+    assert all(body.endswith("<!-- gclit -->") for _, _, body in git_provider.updates)
+    assert [(item["status"], item["error"]) for item in items] == [
+        ("updated", None),
+        ("error", items[1]["error"]),
+        ("error", "forbidden"),
+    ]
+
+
+def test_prs_are_selected_by_target_branch_glob(batch):
+    use_case, _ = batch
+
+    assert use_case.select("release/*") == [1, 3]
+    assert use_case.select("release/*", skip_generated=True) == [1]
+    assert use_case.execute(to_pattern="hotfix/*") == {"error": "No hay Pull Requests que documentar"}
@@ -0,0 +1,98 @@
+# tests/application/test_generate_pr_docs.py
+import time
+
+import pytest
+
+from gclit.application.token_budget import PROMPT_OVERHEAD_TOKENS, TokenBudget
+from gclit.application.use_cases.generate_pr_docs import GeneratePullRequestDocs
+
+
+def _file_diff(path: str, lines: int) -> str:
+    body = "".join(f"+line {i}\n" for i in range(lines))
+    return f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,{lines} @@\n{body}"
+
+
+class FakeGitProvider:
+    def __init__(self, existing_pr=None, existing_delay: float = 0.0):
+        self.existing_pr = existing_pr
+        self.existing_delay = existing_delay
+
+    def get_branch_name(self):
+        return "feature"
+
+    def get_default_branch(self):
+        return "main"
+
+    def get_branch_diff(self, from_branch, to_branch):
+        return _file_diff("src/app.py", 400) + _file_diff("src/other.py", 400)
+
+    def get_recent_commits(self, branch=None, limit=5):
+        return "abc123 previous commit"
+
+    def find_existing_pr(self, from_branch, to_branch):
+        time.sleep(self.existing_delay)
+        return self.existing_pr
+
+
+class FakeLLMProvider:
+    model = "gpt-4o"
+    served_by = None
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_pr_documentation(self, context):
+        self.calls += 1
+        return {"title": "Title", "body": "Body"}
+
+
+class FakeSummarizer:
+    chunk_count = 1
+
+    def __init__(self):
+        self.calls = 0
+
+    def condense(self, context, source_diff, budget):
+        self.calls += 1
+        return context
+
+
+@pytest.fixture
+def oversized():
+    """Caso de uso cuyo diff no cabe en el presupuesto: necesita map-reduce"""
+    def build(git_provider):
+        llm, summarizer = FakeLLMProvider(), FakeSummarizer()
+        budget = TokenBudget("gpt-4o", max_prompt_tokens=PROMPT_OVERHEAD_TOKENS + 1500)
+        use_case = GeneratePullRequestDocs(llm, git_provider, token_budget=budget, summarizer=summarizer)
+        return use_case, llm, summarizer
+    return build
+
+
+def test_existing_pr_is_reported_before_map_reduce(oversized):
+    use_case, llm, summarizer = oversized(FakeGitProvider(existing_pr=42, existing_delay=0.05))
+
+    result = use_case.execute()
+
+    assert "42" in result["error"]
+    assert summarizer.calls == 0
+    assert llm.calls == 0
+    assert "existing_pr" in use_case.timings
+
+
+def test_map_reduce_runs_when_no_pr_exists(oversized):
+    use_case, llm, summarizer = oversized(FakeGitProvider(existing_pr=None))
+
+    result = use_case.execute(auto_confirm=False)
+
+    assert result["requires_confirmation"] is True
+    assert summarizer.calls == 1
+    assert llm.calls == 1
+
+
+def test_dry_run_skips_the_existing_pr_check(oversized):
+    use_case, _, _ = oversized(FakeGitProvider(existing_pr=42))
+
+    result = use_case.execute(dry_run=True)
+
+    assert result["dry_run"] is True
+    assert "existing_pr" not in use_case.timings
@@ -0,0 +1,110 @@
+# tests/application/test_map_reduce.py
+import threading
+
+import pytest
+
+from gclit.application.map_reduce import DiffSummarizer
+from gclit.application.token_budget import CHARS_PER_TOKEN
+from gclit.domain.models.diff import NOTE_PREFIX, ParsedDiff
+from gclit.domain.models.pull_request import PullRequestContext
+
+
+def _file_diff(path: str, lines: int = 8) -> str:
+    body = "".join(f"+line {i}\n" for i in range(lines))
+    return f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,{lines} @@\n{body}"
+
+
+class SummarizingProvider:
+    """Resume cada bloque con un texto de longitud fija y cada grupo con el número de resúmenes"""
+
+    def __init__(self, chunk_summary_chars: int = 20):
+        self.chunk_summary_chars = chunk_summary_chars
+        self.chunks = []
+        self.reductions = []
+        self._lock = threading.Lock()
+
+    def summarize_changes(self, context: PullRequestContext) -> str:
+        with self._lock:
+            # Un bloque es la cabecera seguida del diff de sus ficheros
+            if context.change_summaries[-1].startswith("diff --git"):
+                self.chunks.append(context.change_summaries)
+                return "s" * self.chunk_summary_chars
+            self.reductions.append(context.change_summaries)
+            return f"reduced {len(context.change_summaries)}"
+
+
+def _diff(*paths: str, notes=()) -> ParsedDiff:
+    text = "".join(_file_diff(path) for path in paths) + "".join(f"{note}\n" for note in notes)
+    return ParsedDiff.parse(text)
+
+
+def _tokens(diff: ParsedDiff) -> int:
+    return diff.files[0].size // CHARS_PER_TOKEN + 1
+
+
+@pytest.fixture
+def context():
+    return PullRequestContext(diff="", from_branch="feature", to_branch="main")
+
+
+def test_files_are_split_into_chunks_sorted_by_path(context):
+    diff = _diff("src/b.py", "doc/a.md", "src/a.py", "tst/t.py", notes=[f"{NOTE_PREFIX}omitted (binary): logo.png (+0 -0)"])
+    provider = SummarizingProvider()
+    summarizer = DiffSummarizer(provider, chunk_tokens=2 * _tokens(diff))
+
+    result = summarizer.condense(context, diff, budget=10_000)
+
+    assert summarizer.chunk_count == 2
+    headers = sorted(chunk[0] for chunk in provider.chunks)
+    assert headers == ["#### Part 1/2: doc/a.md … src/a.py", "#### Part 2/2: src/b.py … tst/t.py"]
+    # Cada bloque lleva el diff completo de sus ficheros y nada más
+    part_one = next(chunk[1] for chunk in provider.chunks if chunk[0].startswith("#### Part 1/2"))
+    assert [f.path for f in ParsedDiff.parse(part_one).files] == ["doc/a.md", "src/a.py"]
+    # El resumen final conserva la cabecera de cada bloque y las notas del diff
+    assert result.change_summaries == [
+        "#### Part 1/2: doc/a.md … src/a.py\n" + "s" * 20,
+        "#### Part 2/2: src/b.py … tst/t.py\n" + "s" * 20,
+        f"{NOTE_PREFIX}omitted (binary): logo.png (+0 -0)",
+    ]
+    assert provider.reductions == []
+
+
+def test_a_file_larger_than_the_chunk_is_truncated(context):
+    diff = ParsedDiff.parse(_file_diff("big.py", lines=200))
+    provider = SummarizingProvider()
+
+    DiffSummarizer(provider, chunk_tokens=50).condense(context, diff, budget=10_000)
+
+    [[header, text]] = provider.chunks
+    assert header == "#### Part 1/1: big.py"
+    assert text.startswith(diff.text[:50 * CHARS_PER_TOKEN])
+    assert text.endswith(f"{NOTE_PREFIX}part truncated at {50 * CHARS_PER_TOKEN} characters\n")
+
+
+def test_summaries_that_do_not_fit_are_reduced_in_groups(context):
+    # Seis ficheros de 37 tokens: tres bloques de dos con un presupuesto de 100
+    diff = _diff(*(f"pkg/m{i}.py" for i in range(6)))
+    assert _tokens(diff) == 37
+    # Cabecera y resumen suman 40 tokens: los tres (120) no caben, dos sí
+    provider = SummarizingProvider(chunk_summary_chars=120)
+    summarizer = DiffSummarizer(provider, chunk_tokens=12_000)
+
+    result = summarizer.condense(context, diff, budget=100)
+
+    assert summarizer.chunk_count == 3
+    assert [len(group) for group in provider.reductions] == [2, 1]
+    assert provider.reductions[0][0].startswith("#### Part 1/3: pkg/m0.py … pkg/m1.py\n")
+    assert result.change_summaries == ["reduced 2", "reduced 1"]
+
+
+def test_reduction_stops_when_summaries_cannot_be_grouped(context):
+    diff = _diff("a.py", "b.py")
+    provider = SummarizingProvider(chunk_summary_chars=400)
+    limit = _tokens(diff)
+
+    result = DiffSummarizer(provider, chunk_tokens=limit).condense(context, diff, budget=limit)
+
+    # Cada resumen ya excede el bloque por sí solo: agruparlos no avanzaría
+    assert len(provider.chunks) == 2
+    assert provider.reductions == []
+    assert len(result.change_summaries) == 2
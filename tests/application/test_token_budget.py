@@ -0,0 +1,139 @@
+# tests/application/test_token_budget.py
+import math
+
+import pytest
+
+from gclit.application.token_budget import (
+    CHARS_PER_TOKEN,
+    DEFAULT_CONTEXT_WINDOW,
+    MAX_OMITTED_LISTED,
+    PROMPT_OVERHEAD_TOKENS,
+    TokenBudget,
+    categorize,
+    context_window,
+)
+from gclit.domain.models.diff import ParsedDiff
+
+
+def _file_diff(path: str, lines: int, width: int = 10) -> str:
+    body = "".join(f"+{str(i).ljust(width)}\n" for i in range(lines))
+    return f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,{lines} @@\n{body}"
+
+
+def _budget(tokens: int) -> TokenBudget:
+    """Presupuesto de exactamente `tokens` para el diff"""
+    return TokenBudget("gpt-4o", max_prompt_tokens=PROMPT_OVERHEAD_TOKENS + tokens)
+
+
+def _tokens(text: str) -> int:
+    return math.ceil(ParsedDiff.parse(text).files[0].size / CHARS_PER_TOKEN)
+
+
+@pytest.mark.parametrize("model, window", [
+    ("gpt-4o-mini", 128_000),
+    ("gpt-4-32k-0613", 32_768),
+    ("gpt-4", 8_192),
+    ("gpt-4.1-nano", 1_047_576),
+    ("llama3", DEFAULT_CONTEXT_WINDOW),
+])
+def test_context_window_uses_the_longest_prefix(model, window):
+    assert context_window(model) == window
+
+
+@pytest.mark.parametrize("path, category", [
+    ("src/app.py", "source"),
+    ("tests/test_app.py", "test"),
+    ("web/button.spec.ts", "test"),
+    ("pkg/server_test.go", "test"),
+    ("pyproject.toml", "config"),
+    (".github/workflows/ci.py", "config"),
+    ("Dockerfile", "config"),
+    ("README.md", "docs"),
+    ("docs/guide/index.py", "docs"),
+])
+def test_categorize(path, category):
+    assert categorize(path) == category
+
+
+def test_available_subtracts_overhead_reserve_and_extra_text():
+    budget = TokenBudget("gpt-4", reserve_output_tokens=1_000)
+
+    assert budget.available() == 8_192 - 1_000 - PROMPT_OVERHEAD_TOKENS
+    assert budget.available("x" * 400) == budget.available() - 100
+    assert TokenBudget("gpt-4", max_prompt_tokens=3_000).available() == 3_000 - PROMPT_OVERHEAD_TOKENS
+    assert TokenBudget("gpt-4", max_prompt_tokens=100).available() == 0
+
+
+def test_diff_that_fits_is_returned_unchanged():
+    parsed = ParsedDiff.parse(_file_diff("a.py", 10) + _file_diff("b.py", 10))
+
+    plan = _budget(10_000).fit(parsed)
+
+    assert plan.parsed_diff is parsed
+    assert plan.omitted == []
+    assert plan.used == sum(entry.tokens for entry in plan.entries)
+
+
+def test_source_is_kept_before_tests_config_and_docs():
+    files = {
+        "README.md": _file_diff("README.md", 20),
+        "tests/test_app.py": _file_diff("tests/test_app.py", 20),
+        "setup.cfg": _file_diff("setup.cfg", 20),
+        "src/app.py": _file_diff("src/app.py", 20),
+    }
+    parsed = ParsedDiff.parse("".join(files.values()))
+
+    plan = _budget(_tokens(files["src/app.py"]) + _tokens(files["tests/test_app.py"])).fit(parsed)
+
+    assert [f.path for f in plan.parsed_diff.files] == ["tests/test_app.py", "src/app.py"]
+    assert [entry.file.path for entry in plan.omitted] == ["README.md", "setup.cfg"]
+
+
+def test_denser_files_win_within_a_category_and_smaller_ones_fill_the_gap():
+    # Mismo tamaño aproximado; "dense" cambia más líneas por token
+    dense = _file_diff("src/dense.py", 40, width=5)
+    sparse = _file_diff("src/sparse.py", 10, width=30)
+    small = _file_diff("src/small.py", 2, width=30)
+    parsed = ParsedDiff.parse(sparse + dense + small)
+
+    plan = _budget(_tokens(dense) + _tokens(small)).fit(parsed)
+
+    assert [f.path for f in plan.parsed_diff.files] == ["src/dense.py", "src/small.py"]
+    assert [entry.file.path for entry in plan.omitted] == ["src/sparse.py"]
+
+
+def test_omitted_files_are_listed_in_a_note():
+    kept = _file_diff("src/app.py", 5)
+    parsed = ParsedDiff.parse(kept + _file_diff("docs/a.md", 200) + _file_diff("docs/b.md", 300))
+
+    plan = _budget(_tokens(kept) + 40).fit(parsed)
+    rendered = plan.parsed_diff.render()
+
+    assert rendered.startswith(kept)
+    assert rendered[len(kept):] == (
+        f"# 2 files omitted to fit the {plan.budget}-token budget:\n"
+        "#   docs/a.md (+200 -0)\n"
+        "#   docs/b.md (+300 -0)\n"
+    )
+    assert plan.source_diff is parsed
+    assert plan.as_dict()["files"][1] == {"path": "docs/a.md", "category": "docs", "tokens": plan.entries[1].tokens, "included": False}
+
+
+def test_long_manifests_are_capped():
+    parsed = ParsedDiff.parse("".join(_file_diff(f"src/m{i}.py", 50) for i in range(MAX_OMITTED_LISTED + 5)))
+
+    plan = _budget(1).fit(parsed)
+
+    assert plan.parsed_diff.files == []
+    assert len(plan.parsed_diff.notes) == MAX_OMITTED_LISTED + 2
+    assert plan.parsed_diff.notes[-1] == "#   ... and 5 more"
+
+
+def test_existing_notes_count_against_the_budget():
+    diff = _file_diff("src/app.py", 5)
+    tokens = _tokens(diff)
+    exact = ParsedDiff.parse(diff)
+    with_notes = ParsedDiff.parse(diff + "# excluded: package-lock.json (+900 -800)\n")
+
+    assert _budget(tokens).fit(exact).omitted == []
+    assert [entry.file.path for entry in _budget(tokens).fit(with_notes).omitted] == ["src/app.py"]
@@ -0,0 +1,14 @@
+# tests/cli/test_cache_flags.py
+import pytest
+
+from gclit.cli.utils import get_use_case
+from gclit.container import container
+from gclit.infrastructure.cache.disk_cache import get_cache_mode
+
+
+@pytest.mark.parametrize("flags, mode", [({}, "use"), ({"refresh": True}, "refresh"), ({"no_cache": True}, "off")])
+def test_cache_flags_set_the_cache_mode(monkeypatch, flags, mode):
+    monkeypatch.setattr(container, "get_use_case", lambda name: name)
+
+    assert get_use_case("commit", **flags) == "commit"
+    assert get_cache_mode() == mode
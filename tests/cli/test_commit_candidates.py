@@ -0,0 +1,70 @@
+# tests/cli/test_commit_candidates.py
+import pytest
+from typer.testing import CliRunner
+
+from gclit.cli.commands import commit as commit_commands
+from gclit.cli.main import app
+
+
+class FakeCandidatesUseCase:
+    def __init__(self):
+        self.calls = []
+        self.applied = None
+
+    def execute(self, lang="en", on_token=None):
+        self.calls.append(("execute", 1))
+        return "fix: first"
+
+    def generate_candidates(self, lang="en", candidates=3):
+        self.calls.append(("generate_candidates", candidates))
+        return [f"fix: option {i}" for i in range(1, candidates + 1)]
+
+    def regenerate(self, lang="en", candidates=1):
+        self.calls.append(("regenerate", candidates))
+        return [f"fix: retry {i}" for i in range(1, candidates + 1)]
+
+    def apply_commit(self, message):
+        self.applied = message
+
+
+@pytest.fixture
+def use_case(monkeypatch):
+    use_case = FakeCandidatesUseCase()
+    monkeypatch.setattr(commit_commands, "get_use_case", lambda name, **options: use_case)
+    monkeypatch.setattr(commit_commands, "can_stream", lambda: False)
+    return use_case
+
+
+def test_candidates_are_listed_and_one_is_picked(use_case):
+    result = CliRunner().invoke(app, ["commit", "generate", "-n", "3"], input="2\n")
+
+    assert result.exit_code == 0, result.output
+    assert use_case.calls == [("generate_candidates", 3)]
+    assert all(f"{i}) fix: option {i}" in result.output for i in (1, 2, 3))
+    assert use_case.applied == "fix: option 2"
+
+
+def test_regenerate_keeps_the_number_of_candidates(use_case):
+    result = CliRunner().invoke(app, ["commit", "generate", "-n", "2"], input="r\nx\n1\n")
+
+    assert result.exit_code == 0, result.output
+    assert use_case.calls == [("generate_candidates", 2), ("regenerate", 2)]
+    assert "Please answer one of" in result.output
+    assert use_case.applied == "fix: retry 1"
+
+
+def test_regenerate_a_single_message(use_case):
+    result = CliRunner().invoke(app, ["commit", "generate"], input="r\nr\nn\n")
+
+    assert result.exit_code == 0, result.output
+    assert use_case.calls == [("execute", 1), ("regenerate", 1), ("regenerate", 1)]
+    assert "fix: retry 1" in result.output
+    assert "Commit cancelled" in result.output
+    assert use_case.applied is None
+
+
+def test_auto_applies_the_first_candidate(use_case):
+    result = CliRunner().invoke(app, ["commit", "generate", "-n", "3", "--auto"])
+
+    assert result.exit_code == 0, result.output
+    assert use_case.applied == "fix: option 1"
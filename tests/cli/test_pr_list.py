@@ -0,0 +1,55 @@
+# tests/cli/test_pr_list.py
+import pytest
+from typer.testing import CliRunner
+
+from gclit.application.use_cases.list_prs import ListPullRequests
+from gclit.cli.commands import pr as pr_commands
+from gclit.cli.main import app
+from gclit.domain.models.pull_request import PullRequestInfo
+
+
+class FakeGitProvider:
+    def __init__(self, prs):
+        self.prs = prs
+        self.filters = None
+
+    def list_prs(self, base=None, head=None, author=None):
+        self.filters = {"base": base, "head": head, "author": author}
+        return iter(self.prs)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = FakeGitProvider([
+        PullRequestInfo(pr_number=12, from_branch="feature/login", to_branch="main", title="Add login", author="octocat", generated=True),
+        PullRequestInfo(pr_number=15, from_branch="fix/typo", to_branch="main", title="Fix typo"),
+    ])
+    monkeypatch.setattr(pr_commands, "get_use_case", lambda name, **options: ListPullRequests(provider))
+    return provider
+
+
+def test_pr_list_output(provider):
+    result = CliRunner().invoke(app, ["pr", "list", "--base", "main", "--author", "octocat"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "🤖 #12     feature/login → main",
+        "          Add login (octocat)",
+        "   #15     fix/typo → main",
+        "          Fix typo",
+    ]
+    assert provider.filters == {"base": "main", "head": None, "author": "octocat"}
+
+
+def test_pr_list_pending_and_limit(provider):
+    result = CliRunner().invoke(app, ["pr", "list", "--pending", "--limit", "1"])
+
+    assert result.output.splitlines() == ["   #15     fix/typo → main", "          Fix typo"]
+
+
+def test_pr_list_without_results(provider):
+    provider.prs = []
+
+    result = CliRunner().invoke(app, ["pr", "list"])
+
+    assert result.output == "No open pull requests found.\n"
@@ -0,0 +1,50 @@
+# tests/cli/test_startup.py
+"""El arranque de la CLI no debe cargar dependencias pesadas (ver Container)"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+HEAVY_MODULES = ("openai", "requests", "asyncio")
+# Tiempo acumulado de `import gclit.cli.main` según -X importtime, typer incluido
+IMPORT_BUDGET_US = 200_000
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _cumulative_us(importtime: str, module: str) -> int:
+    for line in importtime.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise AssertionError(f"{module} no aparece en -X importtime")
+
+
+def test_cli_import_stays_within_budget():
+    result = _python("import gclit.cli.main", "-X", "importtime")
+
+    assert _cumulative_us(result.stderr, "gclit.cli.main") < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("argv", [None, ["commit", "generate", "--help"], ["pr", "generate", "--help"]])
+def test_cli_does_not_import_heavy_modules(argv):
+    code = "import sys\nimport gclit.cli.main\n"
+    if argv is not None:
+        code += (
+            "try:\n"
+            f"    gclit.cli.main.app({argv!r}, standalone_mode=False)\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+    # La ayuda sale por stdout: el resultado va por stderr
+    code += f"sys.stderr.write(repr([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+
+    result = _python(code)
+
+    assert result.stderr == "[]"
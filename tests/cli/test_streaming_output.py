@@ -0,0 +1,84 @@
+# tests/cli/test_streaming_output.py
+import pytest
+from typer.testing import CliRunner
+
+from gclit.cli import utils
+from gclit.cli.commands import commit as commit_commands
+from gclit.cli.commands import pr as pr_commands
+from gclit.cli.main import app
+
+
+class FakeCommitUseCase:
+    def __init__(self):
+        self.on_token = None
+
+    def execute(self, lang="en", on_token=None):
+        self.on_token = on_token
+        if on_token is not None:
+            for chunk in ("feat: add ", "login"):
+                on_token("message", chunk)
+        return "feat: add login"
+
+
+class FakePullRequestUseCase:
+    def __init__(self):
+        self.on_token = None
+
+    def execute(self, on_token=None, **kwargs):
+        self.on_token = on_token
+        if on_token is not None:
+            on_token("title", "Add login")
+            for chunk in ("Adds a ", "login form."):
+                on_token("body", chunk)
+        return {"title": "Add login", "body": "Adds a login form.", "dry_run": True}
+
+
+@pytest.fixture
+def commit_use_case(monkeypatch):
+    use_case = FakeCommitUseCase()
+    monkeypatch.setattr(commit_commands, "get_use_case", lambda name, **options: use_case)
+    return use_case
+
+
+@pytest.fixture
+def pr_use_case(monkeypatch):
+    use_case = FakePullRequestUseCase()
+    monkeypatch.setattr(pr_commands, "get_use_case", lambda name, **options: use_case)
+    return use_case
+
+
+@pytest.mark.parametrize("tty", [False, True])
+def test_commit_message_is_shown_once(commit_use_case, monkeypatch, tty):
+    monkeypatch.setattr(commit_commands, "can_stream", lambda: tty)
+
+    result = CliRunner().invoke(app, ["commit", "generate"], input="n\n")
+
+    # Sin terminal (pipes, CI) no se piden tokens: se muestra el resultado final
+    assert (commit_use_case.on_token is not None) is tty
+    assert result.output.count("Generated commit message") == 1
+    assert result.output.count("feat: add login") == 1
+    assert "Commit cancelled" in result.output
+
+
+@pytest.mark.parametrize("tty", [False, True])
+def test_pr_documentation_is_shown_once(pr_use_case, monkeypatch, tty):
+    monkeypatch.setattr(pr_commands, "can_stream", lambda: tty)
+
+    result = CliRunner().invoke(app, ["pr", "generate", "--dry-run"])
+
+    assert (pr_use_case.on_token is not None) is tty
+    assert result.output.count("PR TITLE") == 1
+    assert result.output.count("Add login") == 1
+    assert result.output.count("Adds a login form.") == 1
+    assert "Dry run mode" in result.output
+
+
+@pytest.mark.parametrize("isatty", [False, True])
+def test_streaming_depends_on_stdout_being_a_terminal(monkeypatch, isatty):
+    class Stdout:
+        def isatty(self):
+            return isatty
+
+    monkeypatch.setattr(utils.sys, "stdout", Stdout())
+
+    assert utils.can_stream() is isatty
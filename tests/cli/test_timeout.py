@@ -0,0 +1,59 @@
+# tests/cli/test_timeout.py
+import importlib
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from gclit.cli.main import app
+from gclit.cli.utils import TIMEOUT_EXIT_CODE
+from gclit.container import container
+from tests.conftest import QuietHandler, git
+
+
+class HangingLLMHandler(QuietHandler):
+    """Servidor compatible con OpenAI que no contesta hasta que termina el test"""
+    release = threading.Event()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.release.wait(10)
+
+
+@pytest.fixture
+def hanging_llm(http_server, git_repo, monkeypatch):
+    HangingLLMHandler.release = threading.Event()
+    endpoint = http_server(HangingLLMHandler)
+    monkeypatch.setenv("GCLIT_PROVIDER", "local")
+    monkeypatch.setenv("GCLIT_LOCAL__ENDPOINT", endpoint)
+    monkeypatch.setenv("GCLIT_LOCAL__WARM_UP", "false")
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+    # El plazo debe agotarse esperando al LLM, no importando openai
+    importlib.import_module("gclit.infrastructure.llm.local_provider")
+    container.reset()
+    yield git_repo
+    HangingLLMHandler.release.set()
+    container.reset()
+
+
+def test_commit_generate_exits_124_when_the_deadline_expires(hanging_llm):
+    (hanging_llm / "app.py").write_text("print('hi')\n")
+    git("add", "app.py")
+    start = time.monotonic()
+
+    result = CliRunner().invoke(app, ["commit", "generate", "--no-cache", "--timeout", "1"])
+
+    assert result.exit_code == TIMEOUT_EXIT_CODE
+    assert "Timeout" in result.output
+    assert "fase `llm`" in result.output
+    assert time.monotonic() - start < 4
+    # Sin commit: el mensaje no llegó a generarse
+    assert git("log", "--format=%s").splitlines() == ["init"]
+
+
+def test_other_errors_within_the_deadline_do_not_exit_124(hanging_llm):
+    result = CliRunner().invoke(app, ["commit", "generate", "--no-cache", "--timeout", "5"])
+
+    assert result.exit_code == 0
+    assert "No staged changes" in result.output
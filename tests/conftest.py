@@ -0,0 +1,94 @@
+# tests/conftest.py
+import os
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Type
+
+import pytest
+
+# Antes de importar gclit: CONFIG_PATH y CACHE_DIR se calculan a partir de HOME al importar
+os.environ["HOME"] = tempfile.mkdtemp(prefix="gclit-tests-")
+
+from gclit.config.settings import reset_settings  # noqa: E402
+from gclit.infrastructure.cache.disk_cache import set_cache_mode  # noqa: E402
+from gclit.infrastructure.git.base_git_adapter import BaseGitAdapter  # noqa: E402
+
+
+def git(*args: str, cwd=None) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch):
+    """Ni la configuración ni las cachés del usuario se tocan durante los tests"""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GCLIT_NO_DAEMON", "1")
+    yield home
+    # --refresh / --no-cache cambian un modo global al proceso
+    set_cache_mode("use")
+    reset_settings()
+
+
+@pytest.fixture
+def http_server() -> Callable[[Type[BaseHTTPRequestHandler]], str]:
+    """Arranca servidores HTTP locales en un puerto libre; devuelve su URL base"""
+    servers = []
+
+    def start(handler: Type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Manejador base de los servidores de prueba, sin log en stderr"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body: bytes, content_type: str, status: int = 200, **headers: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Repositorio vacío con un commit inicial; el cwd pasa a ser su raíz"""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git("init", "-q", "-b", "main", cwd=repo)
+    git("config", "user.name", "Test", cwd=repo)
+    git("config", "user.email", "test@example.com", cwd=repo)
+    git("commit", "-q", "--allow-empty", "-m", "init", cwd=repo)
+    monkeypatch.chdir(repo)
+    return repo
+
+
+class LocalGitAdapter(BaseGitAdapter):
+    """Adaptador git sin proveedor remoto: solo operaciones locales"""
+
+    def create_pr(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def update_pr(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_pr_diff_by_number(self, *args, **kwargs):
+        raise NotImplementedError
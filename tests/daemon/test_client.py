@@ -0,0 +1,145 @@
+# tests/daemon/test_client.py
+import socket
+import threading
+import time
+
+import pytest
+
+from gclit.container import container
+from gclit.daemon import client
+from gclit.daemon.server import DaemonServer
+from gclit.domain.deadline import deadline, phase
+from gclit.domain.exceptions.exception import DeadlineExceededException
+from gclit.infrastructure.git import process
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = tmp_path / "d.sock"
+    monkeypatch.setattr(client, "SOCKET_PATH", path)
+    monkeypatch.delenv("GCLIT_NO_DAEMON")
+    return path
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_unresponsive_daemon_does_not_block_the_cli(socket_path):
+    # Acepta conexiones pero nunca contesta, como un daemon ocupado con otra petición
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+    try:
+        start = time.monotonic()
+        assert client.is_daemon_available() is False
+        assert client.get_remote_use_case("commit", fallback=object) is None
+        assert time.monotonic() - start < 3 * client.PING_TIMEOUT
+    finally:
+        listener.close()
+
+
+def test_daemon_is_used_with_the_same_environment(daemon, git_repo):
+    assert client.is_daemon_available()
+    assert isinstance(client.get_remote_use_case("commit", fallback=object), client.RemoteUseCase)
+
+
+def test_daemon_is_skipped_when_git_environment_differs(daemon, git_repo, monkeypatch):
+    monkeypatch.setenv("GIT_INDEX_FILE", str(git_repo / ".git" / "other-index"))
+
+    assert client.is_daemon_available()
+    assert client.get_remote_use_case("commit", fallback=object) is None
+
+
+def test_daemon_is_skipped_when_dotenv_configures_gclit(daemon, git_repo):
+    (git_repo / ".env").write_text("DATABASE_URL=sqlite://\n")
+    assert client.get_remote_use_case("commit", fallback=object) is not None
+
+    (git_repo / ".env").write_text("GCLIT_MODEL=gpt-4o-mini\n")
+    assert client.get_remote_use_case("commit", fallback=object) is None
+
+
+def test_local_methods_run_in_the_client_process(daemon, git_repo, monkeypatch):
+    def no_daemon(*args, **kwargs):
+        raise AssertionError("apply_commit no debe llegar al daemon")
+
+    monkeypatch.setattr(client, "_request", no_daemon)
+    calls = []
+    use_case = client.RemoteUseCase(
+        "commit", fallback=object, local_methods={"apply_commit": lambda message: calls.append(message) or "ok"}
+    )
+
+    assert use_case.apply_commit(message="feat: x") == "ok"
+    assert calls == ["feat: x"]
+
+
+def test_commit_is_created_by_the_client_not_the_daemon(daemon, git_repo):
+    from gclit.cli.utils import get_use_case
+    from tests.conftest import git
+
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+    (git_repo / "a.txt").write_text("a\n")
+    git("add", "a.txt")
+
+    use_case = get_use_case("commit")
+    assert isinstance(use_case, client.RemoteUseCase)
+    use_case.apply_commit(message="feat: add a")
+
+    assert git("log", "-1", "--format=%s").strip() == "feat: add a"
+    assert not daemon.state._sessions
+
+
+class SlowUseCase:
+    """Caso de uso del daemon que tarda más que el plazo del cliente"""
+
+    def __init__(self, work):
+        self.work = work
+        self.timings = {}
+        self.diagnostics = {}
+
+    def execute(self, **kwargs):
+        with phase("git"):
+            return self.work()
+
+
+@pytest.fixture
+def slow_daemon(daemon, monkeypatch):
+    def install(work):
+        monkeypatch.setattr(container, "get_git_provier", lambda: None)
+        monkeypatch.setattr(container, "get_use_case", lambda name, git_provider=None: SlowUseCase(work))
+        return client.RemoteUseCase("commit", fallback=object)
+    return install
+
+
+def test_daemon_applies_the_client_deadline_to_its_subprocesses(slow_daemon, git_repo):
+    use_case = slow_daemon(lambda: process.run(["sh", "-c", "sleep 30"]))
+    start = time.monotonic()
+
+    with pytest.raises(DeadlineExceededException) as error:
+        with deadline(0.5):
+            use_case.execute()
+
+    assert time.monotonic() - start < 2
+    # El error lo informa el daemon, con la fase y el comando en que se agotó
+    assert "fase `git`" in str(error.value)
+    assert "sh -c" in str(error.value)
+
+
+def test_client_gives_up_on_a_daemon_that_ignores_the_deadline(slow_daemon, git_repo):
+    release = threading.Event()
+    use_case = slow_daemon(lambda: release.wait(10))
+    start = time.monotonic()
+    try:
+        with pytest.raises(DeadlineExceededException, match="gclit daemon"):
+            with deadline(0.5):
+                use_case.execute()
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
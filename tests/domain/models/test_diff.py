@@ -0,0 +1,163 @@
+# tests/domain/models/test_diff.py
+from gclit.domain.models.diff import ParsedDiff
+
+
+def _file_diff(path: str, removed, added: str, context: int = 3) -> str:
+    lines = [f"    line_{i} = compute_value(argument_{i}, other_{i})" for i in range(context)]
+    body = "".join(f" {line}\n" for line in lines)
+    old_lines = context + (removed is not None)
+    changes = (f"-{removed}\n" if removed is not None else "") + f"+{added}\n"
+    return (
+        f"diff --git a/{path} b/{path}\n"
+        f"index 1111111..2222222 100644\n"
+        f"--- a/{path}\n"
+        f"+++ b/{path}\n"
+        f"@@ -1,{old_lines} +1,{context + 1} @@\n"
+        f"{body}{changes}"
+    )
+
+
+def test_one_line_addition_with_context_is_kept():
+    # La sección entera (cabecera + contexto) supera los 300 caracteres
+    parsed = ParsedDiff.parse(_file_diff("c.py", None, "x = 2", context=6))
+    assert parsed.files[0].size > 300
+
+    filtered = parsed.without_noise()
+
+    assert [f.path for f in filtered.files] == ["c.py"]
+    assert filtered.notes == []
+    assert parsed.files[0].average_line_length == 5
+
+
+def test_long_changed_lines_are_omitted_as_minified():
+    bundle = ";".join(f"var a{i}=function(){{return {i}}}" for i in range(200))
+    text = _file_diff("app.py", "x = 1", "x = 2") + _file_diff("bundle.js", bundle[:-10], bundle)
+
+    filtered = ParsedDiff.parse(text).without_noise()
+
+    assert [f.path for f in filtered.files] == ["app.py"]
+    assert filtered.notes == ["# omitted (minified): bundle.js (+1 -1)"]
+    assert "bundle.js" not in filtered.render().split("# omitted")[0]
+
+
+def test_threshold_uses_average_of_changed_lines_only():
+    long_line = "y" * 250
+    text = _file_diff("mixed.py", long_line, long_line + "z" * 100, context=0)
+
+    parsed = ParsedDiff.parse(text)
+
+    assert parsed.files[0].average_line_length == 300
+    assert parsed.without_noise().files == parsed.files
+    assert parsed.without_noise(max_line_length=299).files == []
+
+
+def test_binary_files_are_omitted():
+    text = (
+        "diff --git a/logo.png b/logo.png\n"
+        "index 1111111..2222222 100644\n"
+        "Binary files a/logo.png and b/logo.png differ\n"
+    ) + _file_diff("c.py", "x = 1", "x = 2")
+
+    filtered = ParsedDiff.parse(text).without_noise()
+
+    assert [f.path for f in filtered.files] == ["c.py"]
+    assert filtered.notes == ["# omitted (binary): logo.png (+0 -0) [binary]"]
+
+
+# Salida real de `git diff -M` (con y sin --no-prefix, como el adaptador)
+RENAME_MODE_BINARY = """\
+diff --git img.bin img.bin
+index 88768ef..3e3315e 100644
+Binary files img.bin and img.bin differ
+diff --git my file.txt renamed file.txt
+similarity index 90%
+rename from my file.txt
+rename to renamed file.txt
+index 1111111..2222222 100644
+--- my file.txt\t
++++ renamed file.txt\t
+@@ -1,2 +1,2 @@
+ a
+-b
++c
+diff --git run.sh run.sh
+old mode 100644
+new mode 100755
+"""
+
+NEW_AND_DELETED = """\
+diff --git a/docs/new page.md b/docs/new page.md
+new file mode 100644
+index 0000000..3b18e51
+--- /dev/null
++++ b/docs/new page.md\t
+@@ -0,0 +1,2 @@
++# Title
++text
+diff --git a/old.py b/old.py
+deleted file mode 100644
+index 3b18e51..0000000
+--- a/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-print('old')
+"""
+
+NOTES = "# excluded: package-lock.json (+120 -80)\n# diff truncated at 4096 bytes\n"
+
+
+def test_binary_rename_and_mode_change():
+    binary, rename, mode = ParsedDiff.parse(RENAME_MODE_BINARY).files
+
+    assert binary.is_binary and binary.path == "img.bin"
+    assert (rename.old_path, rename.new_path) == ("my file.txt", "renamed file.txt")
+    assert rename.is_rename and rename.similarity == 90
+    assert (rename.additions, rename.deletions) == (1, 1)
+    assert rename.stat_line() == "my file.txt → renamed file.txt (+1 -1) [renamed]"
+    assert mode.is_mode_change and (mode.old_mode, mode.new_mode) == ("100644", "100755")
+    assert mode.stat_line() == "run.sh (+0 -0) [mode]"
+    assert mode.hunks == []
+
+
+def test_new_and_deleted_files_with_prefixes_and_spaces():
+    new, deleted = ParsedDiff.parse(NEW_AND_DELETED).files
+
+    assert new.is_new and new.path == "docs/new page.md" and new.additions == 2
+    assert new.new_mode == "100644"
+    assert deleted.is_deleted and deleted.path == "old.py" and deleted.deletions == 1
+    assert deleted.stat_line() == "old.py (+0 -1) [deleted]"
+
+
+def test_hunk_ranges_and_offsets():
+    text = _file_diff("a.py", "x = 1", "x = 2") + (
+        "@@ -10 +10,2 @@\n"
+        " kept\n"
+        "+added\n"
+    )
+    file = ParsedDiff.parse(text).files[0]
+
+    first, second = file.hunks
+    assert (first.old_start, first.old_lines, first.new_start, first.new_lines) == (1, 4, 1, 4)
+    assert (second.old_start, second.old_lines, second.new_start, second.new_lines) == (10, 1, 10, 2)
+    assert text[second.start:second.end] == "@@ -10 +10,2 @@\n kept\n+added\n"
+    assert (file.additions, file.deletions) == (2, 1)
+    assert (file.start, file.end) == (0, len(text))
+
+
+def test_note_lines_follow_the_last_file():
+    parsed = ParsedDiff.parse(NEW_AND_DELETED + NOTES)
+
+    assert parsed.notes == NOTES.splitlines()
+    assert parsed.files[-1].end == len(NEW_AND_DELETED)
+    # "+# Title" es una línea añadida, no una nota
+    assert parsed.files[0].additions == 2
+    assert parsed.render() == NEW_AND_DELETED + NOTES
+
+
+def test_select_renders_a_subset_of_the_original_text():
+    parsed = ParsedDiff.parse(RENAME_MODE_BINARY + NOTES)
+
+    subset = parsed.select([parsed.files[2]], notes=["# omitted: img.bin"])
+
+    assert subset.render() == "diff --git run.sh run.sh\nold mode 100644\nnew mode 100755\n" + NOTES + "# omitted: img.bin\n"
+    assert subset.text is parsed.text
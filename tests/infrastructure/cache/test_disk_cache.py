@@ -0,0 +1,68 @@
+# tests/infrastructure/cache/test_disk_cache.py
+import json
+import os
+
+from gclit.infrastructure.cache.disk_cache import DiskCache, set_cache_mode
+
+
+def _age(cache: DiskCache, key: str, seconds: float) -> None:
+    """Retrasa la creación y el último uso de una entrada"""
+    path = cache._path(key)
+    entry = json.loads(path.read_text())
+    entry["created"] -= seconds
+    path.write_text(json.dumps(entry))
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = DiskCache(tmp_path, ttl=60)
+    cache.set("fresh", "a")
+    cache.set("stale", "b")
+    _age(cache, "stale", 61)
+
+    assert cache.get("fresh") == "a"
+    assert cache.get("stale") is None
+    assert not cache._path("stale").exists()
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = DiskCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 100)
+    _age(cache, "a", 30)
+    _age(cache, "b", 20)
+    _age(cache, "c", 10)
+    # Leer `a` la convierte en la más reciente
+    assert cache.get("a") is not None
+
+    # Caben las tres entradas actuales (con holgura por el tamaño variable del timestamp), no una cuarta
+    cache.max_bytes = sum(cache._path(key).stat().st_size for key in "abc") + 16
+    cache.set("d", "x" * 100)
+
+    assert cache.get("b") is None
+    assert {key for key in "acd" if cache.get(key) is not None} == {"a", "c", "d"}
+
+
+def test_refresh_mode_skips_reads_but_stores(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set("key", "old")
+
+    set_cache_mode("refresh")
+    assert cache.get("key") is None
+    cache.set("key", "new")
+
+    set_cache_mode("use")
+    assert cache.get("key") == "new"
+
+
+def test_off_mode_neither_reads_nor_stores(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set("key", "old")
+
+    set_cache_mode("off")
+    assert cache.get("key") is None
+    cache.set("key", "new")
+
+    set_cache_mode("use")
+    assert cache.get("key") == "old"
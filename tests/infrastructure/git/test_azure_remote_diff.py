@@ -0,0 +1,71 @@
+# tests/infrastructure/git/test_azure_remote_diff.py
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from gclit.config.settings import DiffSettings, HttpSettings
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.git.azure_devops_adapter import AzureDevOpsAdapter
+from tests.conftest import QuietHandler
+
+
+class AzureHandler(QuietHandler):
+    # ruta -> {commit: contenido}
+    files = {}
+    item_requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        if url.path.endswith("/iterations"):
+            iteration = {"id": 1, "commonRefCommit": {"commitId": "base"}, "sourceRefCommit": {"commitId": "head"}}
+            return self._json({"value": [iteration]})
+        if url.path.endswith("/changes"):
+            entries = [{"changeType": "edit", "item": {"path": f"/{path}"}} for path in sorted(self.files)]
+            return self._json({"changeEntries": entries})
+        if url.path.endswith("/items"):
+            type(self).item_requests.append((query["path"], self.headers.get("If-None-Match")))
+            content = self.files[query["path"]][query["versionDescriptor.version"]]
+            return self.send_body(content, "application/octet-stream", ETag='"item"')
+        self.send_body(b"{}", "application/json", status=404)
+
+    def _json(self, data: dict):
+        self.send_body(json.dumps(data).encode(), "application/json", ETag='"list"')
+
+
+@pytest.fixture
+def azure(http_server, tmp_path):
+    AzureHandler.item_requests = []
+    base = http_server(AzureHandler)
+    adapter = AzureDevOpsAdapter(
+        "token", "org", "project", "repo",
+        http_settings=HttpSettings(pool_size=2),
+        http_cache=DiskCache(tmp_path / "http"),
+        diff_settings=DiffSettings(max_bytes=4000),
+    )
+    adapter.api_url = f"{base}/repo"
+    return adapter
+
+
+def test_binary_item_content_bypasses_http_cache(azure):
+    blob = bytes(range(256))
+    AzureHandler.files = {"logo.png": {"base": blob, "head": blob[::-1]}}
+
+    first = azure.fetch_pr_diff(1)
+    second = azure.fetch_pr_diff(1)
+
+    assert "Binary files a/logo.png and b/logo.png differ" in first
+    assert second == first
+    assert [etag for _, etag in AzureHandler.item_requests] == [None] * 4
+
+
+def test_downloads_stop_once_the_byte_budget_is_spent(azure):
+    line = b"x" * 99 + b"\n"
+    AzureHandler.files = {f"src/file{i:03}.txt": {"base": b"", "head": line * 10} for i in range(100)}
+
+    diff = azure.fetch_pr_diff(1)
+
+    assert "diff truncated at" in diff
+    # Unos pocos ficheros caben en el presupuesto, más la ventana de descargas en vuelo
+    assert len(AzureHandler.item_requests) <= 20
@@ -0,0 +1,71 @@
+# tests/infrastructure/git/test_diff_modes.py
+import pytest
+
+from gclit.config.settings import DiffSettings
+from gclit.domain.models.diff import diff_mode
+from gclit.infrastructure.git import process
+from tests.conftest import LocalGitAdapter, git
+
+
+def _commit_file(name: str, text: str) -> None:
+    with open(name, "w") as f:
+        f.write(text)
+    git("add", name)
+    git("commit", "-q", "-m", f"add {name}")
+
+
+@pytest.mark.parametrize("mode", ["auto", "compact"])
+def test_whitespace_only_change_is_not_emptied(git_repo, mode):
+    _commit_file("app.py", "def main():\n    return 1\n")
+    (git_repo / "app.py").write_text("def main():\n        return 1\n")
+    git("add", "app.py")
+
+    adapter = LocalGitAdapter(diff_settings=DiffSettings(mode=mode))
+    diff = adapter.get_stash_diff()
+
+    assert "+        return 1" in diff
+    assert "whitespace-only change" in diff
+    assert diff_mode(diff).endswith("whitespace-only")
+
+
+def test_mostly_whitespace_change_still_ignores_whitespace(git_repo):
+    body = "".join(f"x{i} = {i}\n" for i in range(20))
+    _commit_file("values.py", body)
+    (git_repo / "values.py").write_text("".join(f"    {line}" for line in body.splitlines(True)) + "y = 1\n")
+    git("add", "values.py")
+
+    adapter = LocalGitAdapter()
+    diff = adapter.get_stash_diff()
+
+    assert "+y = 1" in diff
+    assert "x0 = 0" not in diff
+    assert diff_mode(diff) == "full, ignore-whitespace"
+    assert "whitespace-only" not in diff
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("auto", ["all", "kept", "whitespace"]),
+    ("compact", ["kept", "whitespace"]),
+    ("full", []),
+    ("function", []),
+])
+def test_only_the_statistics_the_mode_uses_are_computed(git_repo, monkeypatch, mode, expected):
+    _commit_file("app.py", "x = 1\n")
+    (git_repo / "app.py").write_text("x = 2\n")
+    (git_repo / "yarn.lock").write_text("lock\n")
+    git("add", "app.py", "yarn.lock")
+    numstats = []
+    spawn = process.spawn
+
+    def recording_spawn(cmd, *args, **kwargs):
+        if "--numstat" in cmd:
+            numstats.append("whitespace" if "-w" in cmd else "kept" if cmd[-1] != "--" else "all")
+        return spawn(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(process, "spawn", recording_spawn)
+    diff = LocalGitAdapter(diff_settings=DiffSettings(mode=mode)).get_stash_diff()
+
+    assert sorted(numstats) == expected
+    assert "+x = 2" in diff
+    # Las notas de ficheros excluidos solo se calculan en modo auto
+    assert ("excluded: yarn.lock" in diff) is (mode == "auto")
@@ -0,0 +1,111 @@
+# tests/infrastructure/git/test_diff_reader.py
+import time
+
+import pytest
+
+from gclit.config.settings import DiffSettings
+from gclit.domain.models.diff import NOTE_PREFIX
+from gclit.infrastructure.git.diff_reader import byte_budget, read_chunks, read_diff
+from tests.conftest import LocalGitAdapter, git
+
+LINE = b"+" + b"x" * 99 + b"\n"
+
+
+def _lines(count: int, consumed: list):
+    for _ in range(count):
+        consumed.append(1)
+        yield LINE
+
+
+@pytest.mark.parametrize("max_bytes, max_tokens, expected", [
+    (0, 0, 0),
+    (1000, 0, 1000),
+    (0, 100, 400),
+    (1000, 100, 400),
+    (300, 100, 300),
+])
+def test_byte_budget(max_bytes, max_tokens, expected):
+    assert byte_budget(max_bytes, max_tokens) == expected
+
+
+def test_unlimited_read_keeps_everything():
+    buffer = read_chunks(_lines(50, []))
+
+    assert buffer.size == 50 * len(LINE)
+    assert not buffer.truncated
+    assert buffer.text() == (LINE * 50).decode()
+
+
+def test_truncation_stops_at_the_last_full_line_and_stops_reading():
+    consumed = []
+
+    buffer = read_chunks(_lines(1000, consumed), max_bytes=550)
+
+    assert buffer.truncated
+    assert buffer.size == 5 * len(LINE)
+    assert buffer.text() == (LINE * 5).decode()
+    # Deja de consumir en cuanto se supera el límite
+    assert len(consumed) == 6
+
+
+def test_a_line_longer_than_the_limit_is_cut_at_the_limit():
+    buffer = read_chunks([b"y" * 1000], max_bytes=300)
+
+    assert buffer.truncated
+    assert buffer.text() == "y" * 300
+
+
+@pytest.mark.parametrize("spill_bytes, on_disk", [(10_000, False), (1000, True)])
+def test_large_diffs_spill_to_disk(spill_bytes, on_disk):
+    buffer = read_chunks(_lines(50, []), spill_bytes=spill_bytes)
+
+    assert buffer._file._rolled is on_disk
+    assert buffer.text() == (LINE * 50).decode()
+
+
+def test_invalid_utf8_is_replaced():
+    assert read_chunks([b"+caf\xe9\n"]).text() == "+caf�\n"
+
+
+def test_read_diff_kills_the_process_at_the_limit():
+    start = time.monotonic()
+
+    buffer = read_diff(["yes", "+line"], max_bytes=64 * 1024)
+
+    assert buffer.truncated
+    assert buffer.size <= 64 * 1024
+    assert set(buffer.text().splitlines()) == {"+line"}
+    assert time.monotonic() - start < 5
+
+
+@pytest.fixture
+def large_staged_file(git_repo):
+    (git_repo / "big.txt").write_text("".join(f"line {i}\n" for i in range(500)))
+    git("add", "big.txt")
+    return git_repo
+
+
+def test_truncated_diff_ends_with_a_note(large_staged_file):
+    adapter = LocalGitAdapter(diff_settings=DiffSettings(mode="full", max_bytes=500))
+
+    diff = adapter.get_stash_diff()
+
+    body, _, note = diff.rstrip("\n").rpartition("\n")
+    assert note.startswith(f"{NOTE_PREFIX}diff truncated at ")
+    size = int(note.split()[-2])
+    assert size <= 500
+    assert len(body.encode()) + 1 == size
+    assert "line 0" in body and "line 499" not in body
+
+
+def test_token_limit_also_truncates(large_staged_file):
+    adapter = LocalGitAdapter(diff_settings=DiffSettings(mode="full", max_bytes=0, max_tokens=100))
+
+    assert f"{NOTE_PREFIX}diff truncated at " in adapter.get_stash_diff()
+
+
+def test_diff_within_the_limit_has_no_note(large_staged_file):
+    diff = LocalGitAdapter(diff_settings=DiffSettings(mode="full")).get_stash_diff()
+
+    assert "truncated" not in diff
+    assert "line 499" in diff
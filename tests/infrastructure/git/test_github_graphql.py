@@ -0,0 +1,40 @@
+# tests/infrastructure/git/test_github_graphql.py
+import json
+
+import pytest
+
+from gclit.infrastructure.git.github_adapter import GitHubAdapter
+from tests.conftest import QuietHandler
+
+
+def _open_pr(number: int, owner: str, base: str = "main") -> dict:
+    return {"id": f"PR_{number}", "number": number, "baseRefName": base, "headRepositoryOwner": {"login": owner}}
+
+
+class GraphQLHandler(QuietHandler):
+    open_from_head = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        data = {"repository": {"defaultBranchRef": {"name": "main"}, "openFromHead": {"nodes": self.open_from_head}}}
+        self.send_body(json.dumps({"data": data}).encode(), "application/json")
+
+
+@pytest.fixture
+def github(http_server):
+    adapter = GitHubAdapter("token", "Octo/gclit")
+    adapter.graphql.url = f"{http_server(GraphQLHandler)}/graphql"
+    return adapter
+
+
+def test_existing_pr_ignores_forks_with_the_same_branch_name(github):
+    GraphQLHandler.open_from_head = [_open_pr(7, "someone-else"), _open_pr(9, "octo"), _open_pr(11, "Octo", "dev")]
+
+    assert github.find_existing_pr("feature", "main") == 9
+    assert github.find_existing_pr("feature", "dev") == 11
+
+
+def test_fork_only_prs_are_not_existing_prs(github):
+    GraphQLHandler.open_from_head = [_open_pr(7, "someone-else"), {**_open_pr(8, ""), "headRepositoryOwner": None}]
+
+    assert github.find_existing_pr("feature", "main") is None
@@ -0,0 +1,97 @@
+# tests/infrastructure/git/test_github_list_prs.py
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from gclit.application.use_cases.list_prs import ListPullRequests
+from gclit.domain.models.pull_request import GCLIT_MARKER
+from gclit.infrastructure.git.github_adapter import GitHubAdapter
+from tests.conftest import QuietHandler
+
+PAGE_SIZE = 2
+PULLS = [
+    {
+        "number": n,
+        "title": f"PR {n}",
+        "head": {"ref": f"feature-{n}"},
+        "base": {"ref": "main"},
+        "user": {"login": "octocat" if n % 2 else "hubot"},
+        "html_url": f"https://github.com/Octo/gclit/pull/{n}",
+        "body": f"Docs\n\n{GCLIT_MARKER}" if n in (1, 2) else "Manual description",
+    }
+    for n in range(1, 8)
+]
+
+
+class PullsHandler(QuietHandler):
+    """API REST de GitHub con páginas de PAGE_SIZE PRs enlazadas por `Link`"""
+    requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        type(self).requests.append((url.path, query))
+        base = f"http://{self.headers['Host']}"
+
+        if url.path == "/repos/Octo/gclit/pulls":
+            page = int(query.get("page", 1))
+            items = PULLS[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+            links = {}
+            if page * PAGE_SIZE < len(PULLS):
+                links["Link"] = f'<{base}/repos/Octo/gclit/pulls?state=open&page={page + 1}>; rel="next"'
+            return self.send_body(json.dumps(items).encode(), "application/json", **links)
+        if url.path == "/search/issues":
+            items = [{"number": pr["number"]} for pr in PULLS if pr["user"]["login"] == "octocat"]
+            return self.send_body(json.dumps({"items": items}).encode(), "application/json")
+        number = int(url.path.rsplit("/", 1)[1])
+        self.send_body(json.dumps(PULLS[number - 1]).encode(), "application/json")
+
+
+@pytest.fixture
+def github(http_server):
+    PullsHandler.requests = []
+    base = http_server(PullsHandler)
+    adapter = GitHubAdapter("token", "Octo/gclit", graphql=False)
+    adapter.api_root = base
+    adapter.api_url = f"{base}/repos/Octo/gclit"
+    return adapter
+
+
+def _pages():
+    return [int(query.get("page", 1)) for path, query in PullsHandler.requests if path.endswith("/pulls")]
+
+
+def test_pages_are_fetched_only_as_far_as_the_limit_needs(github):
+    prs = ListPullRequests(github).execute(limit=3)
+
+    assert [pr["pr_number"] for pr in prs] == [1, 2, 3]
+    assert _pages() == [1, 2]
+
+
+def test_limit_zero_follows_every_page(github):
+    prs = ListPullRequests(github).execute(limit=0)
+
+    assert [pr["pr_number"] for pr in prs] == list(range(1, 8))
+    assert _pages() == [1, 2, 3, 4]
+
+
+def test_filters_are_sent_to_the_api(github):
+    list(github.list_prs(base="main", head="feature-1"))
+
+    _, query = PullsHandler.requests[0]
+    assert query == {"state": "open", "per_page": "100", "base": "main", "head": "Octo:feature-1"}
+
+
+def test_pending_skips_prs_documented_by_gclit(github):
+    prs = ListPullRequests(github).execute(limit=2, only_pending=True)
+
+    assert [(pr["pr_number"], pr["generated"]) for pr in prs] == [(3, False), (4, False)]
+
+
+def test_author_filter_uses_the_search_api(github):
+    prs = ListPullRequests(github).execute(author="octocat")
+
+    assert [(pr["pr_number"], pr["author"]) for pr in prs] == [(1, "octocat"), (3, "octocat"), (5, "octocat"), (7, "octocat")]
+    search = [query for path, query in PullsHandler.requests if path == "/search/issues"]
+    assert search == [{"q": "repo:Octo/gclit is:pr is:open author:octocat", "per_page": "100"}]
@@ -0,0 +1,161 @@
+# tests/infrastructure/git/test_merge_base.py
+import pytest
+
+from gclit.application.use_cases.generate_pr_docs import GeneratePullRequestDocs
+from gclit.config.settings import GitSettings
+from gclit.domain.exceptions.exception import GitProviderException
+from gclit.domain.models.pull_request import PullRequestInfo
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.git import process
+from tests.conftest import LocalGitAdapter, git
+
+API_DIFF = "diff --git a/api.py b/api.py\n--- a/api.py\n+++ b/api.py\n@@ -0,0 +1 @@\n+from_api = True\n"
+
+
+class ApiFallbackAdapter(LocalGitAdapter):
+    def get_pr_diff_by_number(self, pr_number):
+        return PullRequestInfo(pr_number=pr_number, from_branch="unrelated", to_branch="main")
+
+    def fetch_pr_diff(self, pr_number):
+        return API_DIFF
+
+
+class RecordingLLMProvider:
+    model = "gpt-4o"
+
+    def __init__(self):
+        self.diff = None
+
+    def generate_pr_documentation(self, context):
+        self.diff = context.diff
+        return {"title": "Title", "body": "Body"}
+
+
+@pytest.fixture
+def unrelated_branch(git_repo):
+    """Rama sin ancestro común con main, como tras un fetch superficial"""
+    (git_repo / "main.py").write_text("on_main = True\n")
+    git("add", "main.py")
+    git("commit", "-q", "-m", "main work")
+    git("checkout", "-q", "--orphan", "unrelated")
+    git("rm", "-q", "-r", "--cached", ".")
+    (git_repo / "feature.py").write_text("feature = True\n")
+    git("add", "feature.py")
+    git("commit", "-q", "-m", "feature")
+    git("checkout", "-q", "-f", "main")
+    return git_repo
+
+
+def test_missing_merge_base_raises_instead_of_diffing_against_the_tip(unrelated_branch):
+    with pytest.raises(GitProviderException, match="merge-base"):
+        LocalGitAdapter().get_branch_diff("unrelated", "main")
+
+
+def test_missing_merge_base_falls_back_to_the_api_diff(unrelated_branch):
+    llm = RecordingLLMProvider()
+    use_case = GeneratePullRequestDocs(llm, ApiFallbackAdapter())
+
+    result = use_case.execute(pr_number=7, dry_run=True)
+
+    assert result["dry_run"] is True
+    assert use_case.diagnostics["diff_source"] == "api"
+    assert "from_api = True" in llm.diff
+    assert "on_main" not in llm.diff
+
+
+@pytest.fixture
+def feature_branch(git_repo):
+    """Rama `feature` con un commit propio sobre un main que también ha avanzado"""
+    git("checkout", "-q", "-b", "feature")
+    (git_repo / "feature.py").write_text("feature = True\n")
+    git("add", "feature.py")
+    git("commit", "-q", "-m", "feature")
+    git("checkout", "-q", "main")
+    (git_repo / "main.py").write_text("on_main = True\n")
+    git("add", "main.py")
+    git("commit", "-q", "-m", "main work")
+    return git_repo
+
+
+@pytest.fixture
+def git_commands(monkeypatch):
+    commands = []
+    run = process.run
+
+    def recording_run(cmd, *args, **kwargs):
+        commands.append(cmd[:2])
+        return run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(process, "run", recording_run)
+    return commands
+
+
+def test_merge_base_is_served_from_the_cache(feature_branch, tmp_path, git_commands):
+    cache = DiskCache(tmp_path / "merge-base")
+    base = git("merge-base", "main", "feature").strip()
+
+    first = LocalGitAdapter(merge_base_cache=cache).get_branch_diff("feature", "main")
+    second = LocalGitAdapter(merge_base_cache=cache).get_branch_diff("feature", "main")
+
+    assert first == second
+    assert "feature = True" in first and "on_main" not in first
+    assert git_commands.count(["git", "merge-base"]) == 1
+    from_sha, to_sha = git("rev-parse", "feature").strip(), git("rev-parse", "main").strip()
+    assert cache.get(f"{from_sha}:{to_sha}") == base
+
+
+def test_missing_merge_base_is_not_cached(unrelated_branch, tmp_path, git_commands):
+    adapter = LocalGitAdapter(merge_base_cache=DiskCache(tmp_path / "merge-base"))
+
+    for _ in range(2):
+        with pytest.raises(GitProviderException, match="merge-base"):
+            adapter.get_branch_diff("unrelated", "main")
+
+    # Un fetch posterior puede traer el ancestro: se vuelve a preguntar a git
+    assert git_commands.count(["git", "merge-base"]) == 2
+
+
+@pytest.fixture
+def remote_only_branch(git_repo, tmp_path):
+    """
+    Remoto `origin` con una rama `feature` de dos commits que no existe en
+    el clon local
+    """
+    remote = tmp_path / "remote.git"
+    git("clone", "-q", "--bare", str(git_repo), str(remote))
+    git("remote", "add", "origin", f"file://{remote}")
+    git("fetch", "-q", "origin")
+
+    work = tmp_path / "work"
+    git("clone", "-q", str(remote), str(work))
+    git("checkout", "-q", "-b", "feature", cwd=work)
+    for name in ("one", "two"):
+        (work / f"{name}.py").write_text(f"{name} = True\n")
+        git("add", f"{name}.py", cwd=work)
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", name, cwd=work)
+    git("push", "-q", "origin", "feature", cwd=work)
+    return git_repo
+
+
+def test_missing_branch_without_fetch_missing(remote_only_branch):
+    with pytest.raises(GitProviderException, match="fetch_missing"):
+        LocalGitAdapter().get_branch_diff("feature", "main")
+
+    assert git("branch", "-r").split() == ["origin/main"]
+
+
+def test_missing_branch_is_fetched_shallowly(remote_only_branch):
+    adapter = LocalGitAdapter(git_settings=GitSettings(fetch_missing=True, fetch_depth=10))
+
+    diff = adapter.get_branch_diff("feature", "main")
+
+    assert "one = True" in diff and "two = True" in diff
+    assert "origin/feature" in git("branch", "-r")
+
+
+def test_too_shallow_fetch_reports_the_missing_merge_base(remote_only_branch):
+    # Con profundidad 1 solo llega la punta de la rama: no hay ancestro común
+    adapter = LocalGitAdapter(git_settings=GitSettings(fetch_missing=True, fetch_depth=1))
+
+    with pytest.raises(GitProviderException, match="git fetch --unshallow"):
+        adapter.get_branch_diff("feature", "main")
@@ -0,0 +1,29 @@
+# tests/infrastructure/git/test_pathspec.py
+from gclit.config.settings import DiffSettings
+from gclit.infrastructure.git.pathspec import build_pathspec
+from tests.conftest import LocalGitAdapter, git
+
+
+def test_pathspec_is_anchored_at_repository_root():
+    pathspec = build_pathspec(DiffSettings(include=["src/"], exclude=["*.sql"]))
+
+    assert pathspec[0] == ":(top,glob)src/**"
+    assert ":(top,exclude,glob)**/*.sql" in pathspec
+    assert all(spec.startswith(":(top") for spec in pathspec)
+    assert build_pathspec(DiffSettings())[0] == ":/"
+
+
+def test_staged_diff_from_subdirectory_covers_whole_repo(git_repo, monkeypatch):
+    (git_repo / "sub").mkdir()
+    (git_repo / "root.py").write_text("print('root')\n")
+    (git_repo / "sub" / "inner.py").write_text("print('inner')\n")
+    (git_repo / "package-lock.json").write_text("{}\n")
+    git("add", ".")
+    monkeypatch.chdir(git_repo / "sub")
+
+    diff = LocalGitAdapter().get_stash_diff()
+
+    assert "root.py" in diff
+    assert "sub/inner.py" in diff
+    assert "excluded: root.py" not in diff
+    assert "excluded: package-lock.json" in diff
@@ -0,0 +1,86 @@
+# tests/infrastructure/git/test_process.py
+import os
+import time
+
+import pytest
+
+from gclit.domain.deadline import deadline
+from gclit.domain.exceptions.exception import DeadlineExceededException
+from gclit.infrastructure.git import process
+from gclit.infrastructure.git.diff_reader import read_diff
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc"), reason="comprueba los procesos en /proc")
+
+
+def _running(pid: int) -> bool:
+    # Un zombi ya no se ejecuta: solo falta que su padre lo recoja
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _alive(pid: int) -> bool:
+    # SIGKILL se entrega de forma asíncrona: se da un margen antes de concluir
+    for _ in range(50):
+        if not _running(pid):
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _child_pid(pid_file) -> int:
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text().strip():
+            return int(pid_file.read_text())
+        time.sleep(0.01)
+    raise AssertionError("el comando no llegó a lanzar su hijo")
+
+
+def _hanging_command(pid_file) -> list:
+    # Como un hook o un textconv: un hijo que mantiene abierta la salida
+    return ["sh", "-c", f"sleep 30 & echo $! > {pid_file}; wait"]
+
+
+def test_run_kills_the_command_and_its_children_at_the_deadline(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    start = time.monotonic()
+
+    with pytest.raises(DeadlineExceededException) as error:
+        with deadline(0.3):
+            process.run(_hanging_command(pid_file), capture_output=True, text=True)
+
+    assert time.monotonic() - start < 2
+    assert "sh -c" in str(error.value)
+    assert not _alive(_child_pid(pid_file))
+
+
+def test_streamed_diff_is_killed_at_the_deadline(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    start = time.monotonic()
+
+    with pytest.raises(DeadlineExceededException):
+        with deadline(0.3):
+            read_diff(_hanging_command(pid_file))
+
+    assert time.monotonic() - start < 2
+    assert not _alive(_child_pid(pid_file))
+
+
+def test_expired_deadline_does_not_start_the_command(tmp_path):
+    marker = tmp_path / "ran"
+
+    with pytest.raises(DeadlineExceededException):
+        with deadline(0.01):
+            time.sleep(0.02)
+            process.run(["touch", str(marker)])
+
+    assert not marker.exists()
+
+
+def test_without_deadline_commands_run_to_completion():
+    result = process.run(["sh", "-c", "sleep 0.1; echo done"], capture_output=True, text=True)
+
+    assert result.stdout == "done\n"
+    assert result.returncode == 0
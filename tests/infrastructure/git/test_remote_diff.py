@@ -0,0 +1,39 @@
+# tests/infrastructure/git/test_remote_diff.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from gclit.infrastructure.git.remote_diff import bounded_map
+
+
+def test_bounded_map_submits_within_window_and_keeps_order():
+    pulled = []
+
+    def items():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = bounded_map(executor, lambda x: x * 2, items(), window=4)
+        assert next(results) == 0
+        assert len(pulled) <= 5
+        assert list(results) == [x * 2 for x in range(1, 50)]
+
+
+def test_bounded_map_cancels_pending_work_when_closed():
+    release = threading.Event()
+    started = []
+
+    def slow(x):
+        started.append(x)
+        release.wait(5)
+        return x
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = bounded_map(executor, slow, range(100), window=3)
+        release.set()
+        assert next(results) == 0
+        results.close()
+
+    # La primera tarea ya consumida, la que estaba en curso y ninguna más
+    assert len(started) <= 3
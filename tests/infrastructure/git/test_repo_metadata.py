@@ -0,0 +1,139 @@
+# tests/infrastructure/git/test_repo_metadata.py
+import os
+
+import pytest
+
+from gclit.domain.exceptions.exception import GitProviderException
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.git import repo_metadata
+from gclit.infrastructure.git.repo_metadata import RepoMetadataStore, parse_remote_url, read_remotes
+from tests.conftest import git
+
+CONFIG = """\
+[core]
+\trepositoryformatversion = 0
+\turl = https://example.com/not-a-remote.git
+[remote "upstream"]
+\turl = git@github.com:octo/upstream.git
+\tfetch = +refs/heads/*:refs/remotes/upstream/*
+[branch "main"]
+\tremote = origin
+[remote "origin"]
+\turl = https://github.com/me/fork.git
+\turl = https://github.com/me/mirror.git
+"""
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/octo/gclit.git", {"provider": "github", "owner": "octo", "repo": "gclit"}),
+    ("git@github.com:octo/gclit", {"provider": "github", "owner": "octo", "repo": "gclit"}),
+    ("https://me@dev.azure.com/org/proj/_git/repo",
+     {"provider": "azure_devops", "organization": "org", "project": "proj", "repo": "repo"}),
+    ("git@ssh.dev.azure.com:v3/org/proj/repo",
+     {"provider": "azure_devops", "organization": "org", "project": "proj", "repo": "repo"}),
+    ("https://org.visualstudio.com/DefaultCollection/proj/_git/repo",
+     {"provider": "azure_devops", "organization": "org", "project": "proj", "repo": "repo"}),
+])
+def test_parse_remote_url(url, expected):
+    assert parse_remote_url(url) == expected
+
+
+def test_unknown_remote_host_is_rejected():
+    with pytest.raises(GitProviderException, match="no reconocido"):
+        parse_remote_url("https://gitlab.com/octo/gclit.git")
+
+
+def test_read_remotes_only_takes_remote_sections(tmp_path):
+    config = tmp_path / "config"
+    config.write_text(CONFIG)
+
+    # La primera url de cada remoto, en el orden del fichero
+    assert read_remotes(config) == {
+        "upstream": "git@github.com:octo/upstream.git",
+        "origin": "https://github.com/me/fork.git",
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RepoMetadataStore(DiskCache(tmp_path / "repos"))
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Cuenta las lecturas de .git/config"""
+    calls = []
+    read = repo_metadata.read_remotes
+
+    def counting_read(config_file):
+        calls.append(config_file)
+        return read(config_file)
+
+    monkeypatch.setattr(repo_metadata, "read_remotes", counting_read)
+    return calls
+
+
+def test_load_prefers_the_configured_remote(git_repo):
+    git("remote", "add", "upstream", "https://github.com/octo/gclit.git")
+    git("remote", "add", "origin", "https://github.com/me/gclit.git")
+
+    assert RepoMetadataStore().load().full_name == "me/gclit"
+    assert RepoMetadataStore(preferred_remote="fork").load().remote == "upstream"
+
+
+def test_load_errors(git_repo, tmp_path):
+    with pytest.raises(GitProviderException, match="remotos"):
+        RepoMetadataStore().load()
+    with pytest.raises(GitProviderException, match="No es un repositorio"):
+        RepoMetadataStore().load(tmp_path / "outside")
+
+
+def test_cached_metadata_is_reused_while_the_config_is_unchanged(git_repo, store, reads):
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+
+    (git_repo / "subdir").mkdir()
+
+    first = store.load()
+    second = store.load(git_repo / "subdir")
+
+    assert first == second
+    assert second.git_dir == str((git_repo / ".git").resolve())
+    assert len(reads) == 1
+
+
+def test_cache_is_invalidated_when_the_config_mtime_changes(git_repo, store, reads):
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+    config = git_repo / ".git" / "config"
+    assert store.load().full_name == "octo/gclit"
+
+    git("remote", "set-url", "origin", "https://github.com/octo/renamed.git")
+    # Garantiza un mtime distinto aunque el sistema de ficheros tenga poca resolución
+    mtime = config.stat().st_mtime + 10
+    os.utime(config, (mtime, mtime))
+
+    info = store.load()
+    assert info.full_name == "octo/renamed"
+    assert info.config_mtime == mtime
+    assert len(reads) == 2
+
+
+def test_saved_default_branch_survives_the_cache(git_repo, store, reads):
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+    info = store.load()
+    info.default_branch = "develop"
+
+    store.save(info)
+
+    assert store.load().default_branch == "develop"
+    assert len(reads) == 1
+
+
+def test_worktrees_use_the_main_repository_config(git_repo, tmp_path, store):
+    git("remote", "add", "origin", "https://github.com/octo/gclit.git")
+    worktree = tmp_path / "worktree"
+    git("worktree", "add", "-q", "-b", "side", str(worktree))
+
+    info = store.load(worktree)
+
+    assert info.full_name == "octo/gclit"
+    assert info.git_dir == str((git_repo / ".git" / "worktrees" / "worktree").resolve())
@@ -0,0 +1,167 @@
+# tests/infrastructure/http/test_retries.py
+import pytest
+import requests
+
+from gclit.config.settings import HttpSettings
+from gclit.domain.deadline import deadline
+from gclit.domain.exceptions.exception import DeadlineExceededException, GitProviderException, RateLimitException
+from gclit.infrastructure.http import transport as transport_module
+from gclit.infrastructure.http.transport import HttpTransport
+
+URL = "https://api.example.com/repos/octo/gclit"
+
+
+def _response(status: int, text: str = "{}", **headers: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode("utf-8")
+    response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+    return response
+
+
+class FakeClock:
+    """Sustituye a `time` en el transporte: las esperas avanzan el reloj sin dormir"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class ScriptedSession:
+    """Sesión de requests que devuelve (o lanza) las respuestas indicadas, en orden"""
+
+    def __init__(self, clock: FakeClock, outcomes: list):
+        self.clock = clock
+        self.outcomes = outcomes
+        # (método, instante de la petición)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, self.clock.now))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(transport_module, "time", clock)
+    # Backoff sin jitter: siempre el máximo del intervalo
+    monkeypatch.setattr(transport_module.random, "uniform", lambda low, high: high)
+    return clock
+
+
+@pytest.fixture
+def scripted(clock):
+    def build(*outcomes, **settings) -> HttpTransport:
+        http = HttpTransport("GitHub", {}, settings=HttpSettings(**settings))
+        http.session = ScriptedSession(clock, list(outcomes))
+        return http
+    return build
+
+
+def test_server_errors_are_retried_with_exponential_backoff(scripted, clock):
+    http = scripted(_response(503), _response(502), _response(200, '{"ok": true}'))
+
+    response = http.get(URL)
+
+    assert response.json() == {"ok": True}
+    assert len(http.session.calls) == 3
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_retries_stop_after_max_retries(scripted, clock):
+    http = scripted(*[_response(500)] * 3, max_retries=2)
+
+    assert http.get(URL).status_code == 500
+    assert len(http.session.calls) == 3
+
+
+def test_post_is_not_retried(scripted, clock):
+    http = scripted(_response(503), _response(201))
+
+    assert http.post(URL).status_code == 503
+    assert clock.sleeps == []
+
+
+def test_retry_after_replaces_the_backoff(scripted, clock):
+    http = scripted(_response(503, Retry_After="7"), _response(200))
+
+    assert http.get(URL).status_code == 200
+    assert clock.sleeps == [7.0]
+
+
+def test_connection_errors_are_retried_then_reported(scripted):
+    error = requests.ConnectionError("refused")
+    http = scripted(error, error, error, max_retries=2)
+
+    with pytest.raises(GitProviderException, match="Error de red"):
+        http.get(URL)
+    assert len(http.session.calls) == 3
+
+
+def test_rate_limited_response_waits_for_the_reset(scripted, clock):
+    reset = str(int(clock.now) + 20)
+    http = scripted(
+        _response(403, X_RateLimit_Remaining="0", X_RateLimit_Reset=reset),
+        _response(200),
+    )
+
+    assert http.get(URL).status_code == 200
+    assert clock.sleeps == [20.0]
+    assert http.session.calls[1][1] >= float(reset)
+
+
+def test_429_honours_retry_after(scripted, clock):
+    http = scripted(_response(429, Retry_After="3"), _response(200))
+
+    assert http.get(URL).status_code == 200
+    assert clock.sleeps == [3.0]
+
+
+def test_rate_limit_beyond_max_wait_fails_without_sleeping(scripted, clock):
+    reset = str(int(clock.now) + 600)
+    http = scripted(_response(403, X_RateLimit_Remaining="0", X_RateLimit_Reset=reset))
+
+    with pytest.raises(RateLimitException) as error:
+        http.get(URL)
+    assert error.value.wait_seconds == 600
+    assert clock.sleeps == []
+
+
+def test_secondary_rate_limit_without_headers(scripted):
+    http = scripted(_response(403, '{"message": "You have exceeded a secondary rate limit"}'), rate_limit_max_wait=30)
+
+    with pytest.raises(RateLimitException):
+        http.get(URL)
+
+
+def test_exhausted_quota_delays_the_next_request(scripted, clock):
+    reset = str(int(clock.now) + 10)
+    http = scripted(_response(200, X_RateLimit_Remaining="0", X_RateLimit_Reset=reset), _response(200))
+
+    http.get(URL)
+    assert clock.sleeps == []
+    http.get(URL)
+
+    assert clock.sleeps == [10.0]
+    assert http.session.calls[1][1] >= float(reset)
+
+
+def test_retry_wait_longer_than_the_deadline_fails_at_once(scripted, clock):
+    http = scripted(_response(503, Retry_After="30"), _response(200))
+
+    with pytest.raises(DeadlineExceededException, match="GitHub GET"):
+        with deadline(5):
+            http.get(URL)
+    assert clock.sleeps == []
+    assert len(http.session.calls) == 1
@@ -0,0 +1,60 @@
+# tests/infrastructure/http/test_transport.py
+import json
+
+import pytest
+
+from gclit.infrastructure.cache.disk_cache import DiskCache
+from gclit.infrastructure.http.transport import HttpTransport
+from tests.conftest import QuietHandler
+
+BODIES = {
+    "/repo": (b'{"name": "gclit"}', "application/vnd.github+json; charset=utf-8"),
+    "/diff": (b"diff --git a/x b/x\n", "text/plain; charset=utf-8"),
+    "/blob": (bytes(range(256)), "application/octet-stream"),
+}
+
+
+class ConditionalHandler(QuietHandler):
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("If-None-Match")))
+        body, content_type = BODIES[self.path]
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_body(body, content_type, ETag='"v1"')
+
+
+@pytest.fixture
+def transport(http_server, tmp_path):
+    ConditionalHandler.requests = []
+    base = http_server(ConditionalHandler)
+    cache = DiskCache(tmp_path / "http")
+    return base, HttpTransport("test", {"Authorization": "token x"}, cache=cache), cache
+
+
+def test_json_response_is_revalidated_from_cache(transport):
+    base, http, _ = transport
+
+    assert http.get(f"{base}/repo").json() == {"name": "gclit"}
+    again = http.get(f"{base}/repo")
+
+    assert again.status_code == 200
+    assert json.loads(again.text) == {"name": "gclit"}
+    assert ConditionalHandler.requests == [("/repo", None), ("/repo", '"v1"')]
+
+
+@pytest.mark.parametrize("path, kwargs", [("/diff", {"stream": True}), ("/diff", {}), ("/blob", {})])
+def test_streamed_and_non_json_responses_are_not_cached(transport, path, kwargs):
+    base, http, cache = transport
+
+    first = http.get(f"{base}{path}", **kwargs)
+    assert b"".join(first.iter_content(64)) == BODIES[path][0]
+    second = http.get(f"{base}{path}", **kwargs)
+
+    assert second.content == BODIES[path][0]
+    assert ConditionalHandler.requests == [(path, None), (path, None)]
+    assert not list(cache.directory.glob("*.json"))
@@ -0,0 +1,96 @@
+# tests/infrastructure/llm/test_cached_provider.py
+import pytest
+
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.ports.llm import ServedText, served_by
+from gclit.infrastructure.cache.disk_cache import DiskCache, set_cache_mode
+from gclit.infrastructure.git.patch_id import stable_patch_id
+from gclit.infrastructure.llm.cached_provider import CachedLLMProvider
+from gclit.infrastructure.llm.prompts import get_template
+from tests.conftest import git
+
+
+class CountingProvider:
+    model = "gpt-4o"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_commit_message(self, context):
+        self.calls += 1
+        return ServedText(f"message {self.calls}", "openai:gpt-4o")
+
+
+def _write(path, lines):
+    path.write_text("".join(f"{line}\n" for line in lines))
+
+
+@pytest.fixture
+def rebased_diffs(git_repo):
+    """Diff del mismo commit antes y después de rebasarlo sobre un cambio anterior en el fichero"""
+    _write(git_repo / "app.py", [f"line {i}" for i in range(30)])
+    git("add", "app.py")
+    git("commit", "-q", "-m", "base")
+
+    git("checkout", "-q", "-b", "feature")
+    _write(git_repo / "app.py", [f"line {i}" for i in range(29)] + ["line 29 changed"])
+    git("commit", "-q", "-am", "feature")
+    before = git("show", "--format=", "HEAD")
+
+    git("checkout", "-q", "main")
+    _write(git_repo / "app.py", ["header"] * 5 + [f"line {i}" for i in range(30)])
+    git("commit", "-q", "-am", "header")
+    git("checkout", "-q", "feature")
+    git("rebase", "-q", "main")
+    after = git("show", "--format=", "HEAD")
+    return before, after
+
+
+@pytest.fixture
+def cached(tmp_path):
+    inner = CountingProvider()
+    return inner, CachedLLMProvider(inner, DiskCache(tmp_path / "llm"), provider_name="openai")
+
+
+def test_rebased_diff_hits_the_cache(rebased_diffs, cached):
+    before, after = rebased_diffs
+    inner, provider = cached
+    assert before != after
+    assert stable_patch_id(before) == stable_patch_id(after)
+
+    first = provider.generate_commit_message(CommitContext(diff=before, branch_name="feature"))
+    again = provider.generate_commit_message(CommitContext(diff=after, branch_name="feature"))
+
+    assert again == first
+    assert inner.calls == 1
+    assert served_by(first) == "openai:gpt-4o"
+    assert served_by(again) == "cache"
+
+
+def test_template_version_change_misses_the_cache(rebased_diffs, cached, monkeypatch):
+    before, _ = rebased_diffs
+    inner, provider = cached
+    context = CommitContext(diff=before, branch_name="feature")
+    provider.generate_commit_message(context)
+
+    monkeypatch.setattr(get_template("commit", "en"), "version", "test-bump")
+    message = provider.generate_commit_message(context)
+
+    assert inner.calls == 2
+    assert served_by(message) == "openai:gpt-4o"
+
+
+# --refresh guarda la respuesta nueva; --no-cache no lee ni escribe la caché
+@pytest.mark.parametrize("mode, stored", [("refresh", "message 2"), ("off", "message 1")])
+def test_refresh_and_no_cache_bypass_stored_responses(rebased_diffs, cached, mode, stored):
+    before, _ = rebased_diffs
+    inner, provider = cached
+    context = CommitContext(diff=before, branch_name="feature")
+    provider.generate_commit_message(context)
+
+    set_cache_mode(mode)
+    assert provider.generate_commit_message(context) == "message 2"
+
+    set_cache_mode("use")
+    assert provider.generate_commit_message(context) == stored
+    assert inner.calls == 2
@@ -0,0 +1,141 @@
+# tests/infrastructure/llm/test_hedged_provider.py
+import asyncio
+import time
+from typing import Callable, Union
+
+import pytest
+
+from gclit.domain.ports.llm import AsyncLLMProvider, served_by
+from gclit.infrastructure.llm.hedged_provider import AsyncHedgedProvider, HedgedProvider
+
+
+class FakeProvider(AsyncLLMProvider):
+    """Proveedor con latencia inyectada que registra cuándo empieza y si se cancela"""
+    model = "fake"
+
+    def __init__(self, name: str, latency: Union[float, Callable[[object], float]], fail: bool = False, chunks: int = 3):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.chunks = chunks
+        self.started_at = None
+        self.cancelled = False
+
+    async def generate_commit_message(self, context) -> str:
+        self.started_at = time.monotonic()
+        try:
+            await asyncio.sleep(self.latency(context) if callable(self.latency) else self.latency)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return f"{self.name} message"
+
+    async def stream_commit_message(self, context, on_token) -> str:
+        self.started_at = time.monotonic()
+        for i in range(self.chunks):
+            await asyncio.sleep(self.latency / self.chunks)
+            on_token("message", f"{self.name}{i} ")
+        return f"{self.name} message"
+
+    async def generate_pr_documentation(self, context) -> dict:
+        return {"title": await self.generate_commit_message(context), "body": ""}
+
+    async def summarize_changes(self, context) -> str:
+        return await self.generate_commit_message(context)
+
+
+def _hedge(primary: FakeProvider, secondary: FakeProvider, delay: float):
+    provider = AsyncHedgedProvider([("primary", primary), ("secondary", secondary)], delay=delay)
+    start = time.monotonic()
+
+    async def run(call):
+        result = await call(provider)
+        # Deja que las cancelaciones de los perdedores lleguen a ejecutarse
+        await asyncio.sleep(0.01)
+        return result
+
+    return provider, start, run
+
+
+def test_primary_wins_before_the_delay():
+    primary, secondary = FakeProvider("primary", 0.02), FakeProvider("secondary", 0.01)
+    _, _, run = _hedge(primary, secondary, delay=0.3)
+
+    message = asyncio.run(run(lambda p: p.generate_commit_message(None)))
+
+    assert message == "primary message"
+    assert served_by(message) == "primary"
+    assert secondary.started_at is None
+
+
+def test_secondary_wins_after_the_delay_and_primary_is_cancelled():
+    primary, secondary = FakeProvider("primary", 2.0), FakeProvider("secondary", 0.02)
+    _, start, run = _hedge(primary, secondary, delay=0.1)
+
+    message = asyncio.run(run(lambda p: p.generate_commit_message(None)))
+
+    assert served_by(message) == "secondary"
+    assert secondary.started_at - start >= 0.1
+    assert time.monotonic() - start < 1.0
+    assert primary.cancelled
+
+
+def test_primary_failure_starts_the_secondary_immediately():
+    primary, secondary = FakeProvider("primary", 0.01, fail=True), FakeProvider("secondary", 0.01)
+    _, start, run = _hedge(primary, secondary, delay=5.0)
+
+    message = asyncio.run(run(lambda p: p.generate_commit_message(None)))
+
+    assert served_by(message) == "secondary"
+    assert secondary.started_at - start < 1.0
+
+
+def test_all_failures_raise_the_last_error():
+    primary, secondary = FakeProvider("primary", 0.01, fail=True), FakeProvider("secondary", 0.01, fail=True)
+    _, _, run = _hedge(primary, secondary, delay=5.0)
+
+    with pytest.raises(RuntimeError, match="secondary failed"):
+        asyncio.run(run(lambda p: p.generate_commit_message(None)))
+
+
+def test_streaming_keeps_the_first_provider_to_emit_a_token():
+    primary, secondary = FakeProvider("primary", 1.5), FakeProvider("secondary", 0.15)
+    _, _, run = _hedge(primary, secondary, delay=0.05)
+    tokens = []
+
+    message = asyncio.run(run(lambda p: p.stream_commit_message(None, lambda field, text: tokens.append(text))))
+
+    assert served_by(message) == "secondary"
+    assert tokens == ["secondary0 ", "secondary1 ", "secondary2 "]
+
+
+def test_pr_documentation_carries_the_winner():
+    primary, secondary = FakeProvider("primary", 2.0), FakeProvider("secondary", 0.02)
+    _, _, run = _hedge(primary, secondary, delay=0.05)
+
+    result = asyncio.run(run(lambda p: p.generate_pr_documentation(None)))
+
+    assert result["provider"] == "secondary"
+
+
+def test_concurrent_requests_report_their_own_winner():
+    # La misma instancia atiende dos peticiones solapadas: el principal solo es lento con la primera
+    primary = FakeProvider("primary", lambda context: 2.0 if context == "slow" else 0.3)
+    provider = AsyncHedgedProvider([("primary", primary), ("secondary", FakeProvider("secondary", 0.5))], delay=0.1)
+
+    async def both():
+        return await asyncio.gather(provider.generate_commit_message("slow"), provider.generate_commit_message("fast"))
+
+    hedged, direct = asyncio.run(both())
+
+    assert (served_by(hedged), served_by(direct)) == ("secondary", "primary")
+
+
+def test_sync_adapter_returns_the_winner_with_the_result():
+    provider = HedgedProvider([("primary", FakeProvider("primary", 2.0)), ("secondary", FakeProvider("secondary", 0.02))], delay=0.05)
+
+    messages = [provider.generate_commit_message(None), *provider.generate_commit_messages(None, 2)]
+
+    assert {served_by(message) for message in messages} == {"secondary"}
@@ -0,0 +1,163 @@
+# tests/infrastructure/llm/test_local_provider.py
+import json
+import threading
+
+import pytest
+
+from gclit.application.use_cases.generate_commit import GenerateCommitMessage
+from gclit.domain.models.commit_message import CommitContext
+from gclit.domain.models.pull_request import PullRequestContext
+from gclit.infrastructure.llm.local_provider import LocalProvider
+from tests.conftest import QuietHandler
+
+COMMIT = CommitContext(diff="diff --git a/x b/x\n+x\n", branch_name="feature")
+PR = PullRequestContext(diff="diff --git a/x b/x\n+x\n", from_branch="feature", to_branch="main")
+PR_TEXT = "**Title:** Add x\n\n**Description:**\nAdds x."
+USAGE = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15, "prompt_tokens_details": {"cached_tokens": 8}}
+
+
+class ChatCompletionsHandler(QuietHandler):
+    """Servidor compatible con OpenAI (/v1/chat/completions) con la ruta de carga de Ollama"""
+    requests = []
+    warm_up_fails = False
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append((self.path, body))
+        if self.path == "/api/generate":
+            if self.warm_up_fails:
+                # Conexión cortada sin respuesta: requests lanza ConnectionError
+                self.close_connection = True
+                return
+            return self.send_body(b'{"done": true}', "application/json")
+
+        content = PR_TEXT if "Title" in json.dumps(body["messages"]) else "feat: add x"
+        if body.get("stream"):
+            return self._stream(body, content)
+        choices = [
+            {"index": i, "message": {"role": "assistant", "content": f"{content} {i}" if i else content}, "finish_reason": "stop"}
+            for i in range(body.get("n", 1))
+        ]
+        response = {"id": "x", "object": "chat.completion", "created": 0, "model": body["model"], "choices": choices, "usage": USAGE}
+        self.send_body(json.dumps(response).encode(), "application/json")
+
+    def _stream(self, body: dict, content: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        events = [
+            {"choices": [{"index": 0, "delta": {"content": content[i:i + 5]}, "finish_reason": None}]}
+            for i in range(0, len(content), 5)
+        ]
+        # Como OpenAI con include_usage: un último fragmento sin `choices` con el consumo
+        events.append({"choices": [], "usage": USAGE})
+        for event in events:
+            event.update(id="x", object="chat.completion.chunk", created=0, model=body["model"])
+            self.wfile.write(b"data: " + json.dumps(event).encode() + b"\n\n")
+        self.wfile.write(b"data: [DONE]\n\n")
+
+
+@pytest.fixture
+def endpoint(http_server):
+    ChatCompletionsHandler.requests = []
+    ChatCompletionsHandler.warm_up_fails = False
+    return http_server(ChatCompletionsHandler)
+
+
+def _completions():
+    return [body for path, body in ChatCompletionsHandler.requests if path == "/v1/chat/completions"]
+
+
+def _join_warm_up():
+    for thread in threading.enumerate():
+        if thread.name == "gclit-warm-up":
+            thread.join(5)
+
+
+def test_non_streaming_commit_and_pr(endpoint):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint, warm_up=False)
+
+    assert provider.generate_commit_message(COMMIT) == "feat: add x"
+    result = provider.generate_pr_documentation(PR)
+
+    assert (result["title"], result["body"]) == ("Add x", "Adds x.")
+    assert result["usage"]["prompt_tokens"] == 10
+    assert all(body["model"] == "qwen2.5-coder:7b" and not body.get("stream") for body in _completions())
+
+
+def test_streaming_forwards_tokens(endpoint):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint + "/v1/", warm_up=False)
+    tokens = []
+
+    message = provider.stream_commit_message(COMMIT, lambda field, text: tokens.append((field, text)))
+
+    assert message == "feat: add x"
+    assert "".join(text for _, text in tokens) == "feat: add x"
+    assert len(tokens) > 1
+    assert _completions()[-1]["stream"] is True
+
+
+def test_candidates_come_from_one_request(endpoint):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint, warm_up=False)
+
+    messages = provider.generate_commit_messages(COMMIT, 3)
+
+    assert messages == ["feat: add x", "feat: add x 1", "feat: add x 2"]
+    assert [body["n"] for body in _completions()] == [3]
+
+
+def test_keep_alive_travels_in_every_request(endpoint):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint, keep_alive="1h")
+    _join_warm_up()
+
+    provider.generate_commit_message(COMMIT)
+
+    warm_up = [body for path, body in ChatCompletionsHandler.requests if path == "/api/generate"]
+    assert warm_up == [{"model": "qwen2.5-coder:7b", "keep_alive": "1h"}]
+    assert _completions()[-1]["keep_alive"] == "1h"
+
+
+def test_keep_alive_can_be_disabled(endpoint):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint, keep_alive=None, warm_up=False)
+
+    provider.generate_commit_message(COMMIT)
+
+    assert "keep_alive" not in _completions()[-1]
+
+
+def test_failed_warm_up_is_ignored(endpoint, monkeypatch):
+    ChatCompletionsHandler.warm_up_fails = True
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint)
+    _join_warm_up()
+
+    assert provider.generate_commit_message(COMMIT) == "feat: add x"
+    assert errors == []
+    assert [path for path, _ in ChatCompletionsHandler.requests][0] == "/api/generate"
+
+
+class StagedGitProvider:
+    def get_stash_diff(self):
+        return COMMIT.diff
+
+    def get_recent_commits(self, branch=None, limit=5):
+        return ""
+
+    def get_branch_name(self):
+        return "feature"
+
+
+@pytest.mark.parametrize("generate", [
+    lambda use_case: use_case.execute(),
+    lambda use_case: use_case.execute(on_token=lambda field, text: None),
+    lambda use_case: use_case.generate_candidates(candidates=3),
+])
+def test_commit_usage_reaches_the_diagnostics(endpoint, generate):
+    provider = LocalProvider("qwen2.5-coder:7b", endpoint, warm_up=False)
+    use_case = GenerateCommitMessage(provider, StagedGitProvider())
+
+    generate(use_case)
+
+    assert use_case.diagnostics["usage"] == {"prompt_tokens": 10, "completion_tokens": 5, "cached_tokens": 8}
@@ -0,0 +1,49 @@
+# tests/infrastructure/llm/test_streaming.py
+import pytest
+
+from gclit.infrastructure.llm.streaming import PullRequestStreamParser, parse_pr_response
+
+RESPONSE = "**Title:** Add login page\n\n**Description:**\n\nAdds a login form.\n\n- Validates input\n"
+
+
+def _stream(chunks):
+    tokens = []
+    parser = PullRequestStreamParser(lambda field, text: tokens.append((field, text)))
+    for chunk in chunks:
+        parser.feed(chunk)
+    titles = [text for field, text in tokens if field == "title"]
+    body = "".join(text for field, text in tokens if field == "body")
+    return titles, body, parser.result()
+
+
+@pytest.mark.parametrize("split", range(1, len(RESPONSE)))
+def test_headers_split_at_any_point_across_two_chunks(split):
+    titles, body, result = _stream([RESPONSE[:split], RESPONSE[split:]])
+
+    assert titles == ["Add login page"]
+    assert body.strip() == result["body"] == "Adds a login form.\n\n- Validates input"
+    assert result == parse_pr_response(RESPONSE)
+
+
+def test_one_character_per_chunk():
+    titles, body, result = _stream(list(RESPONSE))
+
+    assert titles == ["Add login page"]
+    assert body == "Adds a login form.\n\n- Validates input\n"
+    assert result["title"] == "Add login page"
+
+
+def test_markdown_heading_variant():
+    titles, body, result = _stream(["### Title: Fix", " typo\n### Descr", "iption:\nFixes a typo."])
+
+    assert titles == ["Fix typo"]
+    assert body == "Fixes a typo."
+    assert result == {"title": "Fix typo", "body": "Fixes a typo."}
+
+
+def test_response_without_headers_falls_back_to_the_first_line():
+    titles, body, result = _stream(["Refactor the ", "parser\nMore text"])
+
+    assert titles == []
+    assert body == ""
+    assert result == {"title": "Refactor the parser", "body": ""}